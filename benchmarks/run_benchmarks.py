@@ -0,0 +1,271 @@
+"""Benchmark suite for the IA-Educa pages and utility hot paths
+
+Usage:
+    python benchmarks/run_benchmarks.py run --sizes 10 1000 10000 --output results.json
+    python benchmarks/run_benchmarks.py compare baseline.json results.json --threshold 0.2
+
+`run` generates synthetic datasets (utils/dataset_generator.py) for every size,
+drives each page headlessly with Streamlit's AppTest harness (cold and warm
+rerun latency, element count, peak memory) and microbenchmarks BiasSimulator
+and ProgressTracker. `compare` flags metrics that regressed between two runs.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from utils.content_store import get_content_store  # noqa: E402
+from utils.dataset_generator import generate_datasets  # noqa: E402
+from utils.navigation import ENTRYPOINT, PAGE_PATHS  # noqa: E402
+
+# None is the entrypoint itself
+PAGES = [None] + [path for path in PAGE_PATHS if path != ENTRYPOINT]
+
+# Metrics where a higher value is a regression, and where it is an improvement
+LOWER_IS_BETTER = ('median_ms', 'p95_ms', 'cold_ms', 'warm_median_ms', 'peak_memory_kb', 'elements')
+HIGHER_IS_BETTER = ('ops_per_sec',)
+
+
+def summarize(durations: List[float]) -> Dict[str, float]:
+    """Summarize per-call durations (seconds) as milliseconds"""
+    ordered = sorted(durations)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    median = statistics.median(ordered)
+    return {
+        'calls': len(ordered),
+        'median_ms': round(median * 1000, 4),
+        'p95_ms': round(p95 * 1000, 4),
+        'ops_per_sec': round(1 / median, 1) if median > 0 else 0.0
+    }
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Time `repeat` calls of func"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return summarize(durations)
+
+
+def count_elements(node) -> int:
+    """Count the nodes of an AppTest element tree"""
+    children = getattr(node, 'children', None) or {}
+    return 1 + sum(count_elements(child) for child in children.values())
+
+
+def use_dataset_dir(data_dir: str) -> None:
+    """Point the shared content store (and so every page) at a dataset directory"""
+    store = get_content_store()
+    store.data_dir = data_dir
+    store.clear()
+
+
+def new_app(page: Optional[str]):
+    """Create an AppTest for a page, going through the entrypoint so page links resolve"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(ENTRYPOINT, default_timeout=120)
+    if page:
+        app.switch_page(page)
+    return app
+
+
+def bench_page(page: Optional[str], repeat: int) -> Dict[str, Any]:
+    """Cold/warm rerun latency, element count and peak memory of one page"""
+    # Cold: empty content store, first run of a new session
+    get_content_store().clear()
+    app = new_app(page)
+    start = time.perf_counter()
+    app.run()
+    cold = time.perf_counter() - start
+    errors = [e.value for e in app.exception]
+
+    # Warm: reruns of the same session
+    warm = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app.run()
+        warm.append(time.perf_counter() - start)
+
+    # Peak memory of a fresh session on warm caches (traced separately, tracing is slow)
+    tracemalloc.start()
+    new_app(page).run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    warm_stats = summarize(warm)
+    return {
+        'cold_ms': round(cold * 1000, 2),
+        'warm_median_ms': warm_stats['median_ms'],
+        'warm_p95_ms': warm_stats['p95_ms'],
+        'elements': count_elements(app._tree),
+        'peak_memory_kb': round(peak / 1024, 1),
+        'errors': errors
+    }
+
+
+def bench_simulator(repeat: int) -> Dict[str, Dict[str, float]]:
+    """Microbenchmarks of BiasSimulator on the current dataset"""
+    from utils.bias_simulator import BiasSimulator
+
+    results = {}
+    start = time.perf_counter()
+    simulator = BiasSimulator(seed=1)
+    results['BiasSimulator.__init__'] = {'median_ms': round((time.perf_counter() - start) * 1000, 4)}
+
+    scenario_type = simulator.get_scenario_statistics()['most_common_type']
+    results['BiasSimulator.generate_scenario'] = measure(lambda: simulator.generate_scenario(scenario_type), repeat)
+
+    scenario = simulator.generate_scenario(scenario_type)
+    answer = ("Sim, há viés evidente", ["Viés de Gênero", "Viés Racial"],
+              "Diversificar os dados de treinamento e monitorar os resultados por grupo")
+    results['BiasSimulator.evaluate_response'] = measure(lambda: simulator.evaluate_response(scenario, *answer), repeat)
+    results['BiasSimulator.get_scenario_statistics'] = measure(simulator.get_scenario_statistics, repeat)
+    return results
+
+
+def bench_progress_tracker(repeat: int) -> Dict[str, Dict[str, float]]:
+    """Microbenchmarks of ProgressTracker with a history of `repeat` activities"""
+    from utils.progress_tracker import ProgressTracker
+
+    tracker = ProgressTracker()
+    activities = ['simulations_completed', 'cases_studied', 'plans_created', 'resources_accessed']
+    counter = iter(range(10 ** 9))
+
+    def update():
+        i = next(counter)
+        tracker.update_progress(activities[i % 4], 1, score=80 if i % 4 == 0 else None)
+
+    results = {'ProgressTracker.update_progress': measure(update, repeat)}
+    results['ProgressTracker.get_summary_stats'] = measure(tracker.get_summary_stats, repeat)
+    results['ProgressTracker.get_next_achievements'] = measure(tracker.get_next_achievements, repeat)
+    results['ProgressTracker.get_achievements'] = measure(tracker.get_achievements, repeat)
+    results['ProgressTracker.export_progress'] = measure(tracker.export_progress, max(1, repeat // 100))
+    return results
+
+
+def run_suite(sizes: List[int], repeat: int, micro_repeat: int, seed: int) -> Dict[str, Any]:
+    """Run every benchmark for every dataset size"""
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sizes': sizes,
+            'repeat': repeat,
+            'micro_repeat': micro_repeat,
+            'seed': seed
+        },
+        'results': {}
+    }
+
+    original_dir = get_content_store().data_dir
+    with tempfile.TemporaryDirectory(prefix='ia-educa-bench-') as workdir:
+        # Keep the persisted search index of the benchmark away from the app's
+        os.environ['IA_EDUCA_CACHE_DIR'] = os.path.join(workdir, 'cache')
+        try:
+            for size in sizes:
+                data_dir = os.path.join(workdir, f'data-{size}')
+                generate_datasets(data_dir, size, seed)
+                use_dataset_dir(data_dir)
+
+                for page in PAGES:
+                    name = f"page:{page or ENTRYPOINT}@{size}"
+                    print(f"  {name}", file=sys.stderr)
+                    report['results'][name] = bench_page(page, repeat)
+
+                micro = {}
+                micro.update(bench_simulator(micro_repeat))
+                micro.update(bench_progress_tracker(micro_repeat))
+                for name, stats in micro.items():
+                    report['results'][f"{name}@{size}"] = stats
+        finally:
+            os.environ.pop('IA_EDUCA_CACHE_DIR', None)
+            use_dataset_dir(original_dir)
+
+    return report
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Return the metrics that got worse by more than `threshold` (relative)"""
+    regressions = []
+    for name, base_stats in baseline.get('results', {}).items():
+        new_stats = current.get('results', {}).get(name)
+        if new_stats is None:
+            continue
+        for metric, base_value in base_stats.items():
+            new_value = new_stats.get(metric)
+            if not isinstance(base_value, (int, float)) or not isinstance(new_value, (int, float)) or base_value <= 0:
+                continue
+            if metric in LOWER_IS_BETTER:
+                change = (new_value - base_value) / base_value
+            elif metric in HIGHER_IS_BETTER:
+                change = (base_value - new_value) / base_value
+            else:
+                continue
+            if change > threshold:
+                regressions.append({
+                    'benchmark': name,
+                    'metric': metric,
+                    'baseline': base_value,
+                    'current': new_value,
+                    'change': round(change, 4)
+                })
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Run the benchmark suite")
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 10000])
+    run_parser.add_argument('--repeat', type=int, default=5, help="Warm reruns per page")
+    run_parser.add_argument('--micro-repeat', type=int, default=1000, help="Calls per microbenchmark")
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--output', default='bench_results.json')
+
+    compare_parser = subparsers.add_parser('compare', help="Compare two benchmark results")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.2,
+                                help="Relative change counted as a regression (default: 0.2)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        report = run_suite(args.sizes, args.repeat, args.micro_repeat, args.seed)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Results written to {args.output}", file=sys.stderr)
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, encoding='utf-8') as f:
+        current = json.load(f)
+
+    regressions = compare(baseline, current, args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r['benchmark']} {r['metric']}: {r['baseline']} -> {r['current']} "
+              f"(+{r['change'] * 100:.1f}%)")
+    if not regressions:
+        print("No regressions above the threshold.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
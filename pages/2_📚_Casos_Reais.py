@@ -1,204 +1,243 @@
-import streamlit as st
-import json
-import os
-from utils.progress_tracker import ProgressTracker
-
-st.set_page_config(
-    page_title="Casos Reais - IA na Educação",
-    page_icon="📚",
-    layout="wide"
-)
-# Esconde a navegação automática do Streamlit
-st.markdown("""
-<style>
-    [data-testid="stSidebarNav"] {
-        display: none;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Initialize progress tracker
-if 'progress_tracker' not in st.session_state:
-    st.session_state.progress_tracker = ProgressTracker()
-
-def load_real_cases():
-    """Load real cases from JSON file"""
-    try:
-        with open('data/real_cases.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return []
-
-def main():
-    st.title("📚 Casos Reais de Vieses em IA")
-    st.markdown("Explore exemplos concretos de como vieses aparecem em sistemas reais")
-    
-    cases = load_real_cases()
-    
-    if not cases:
-        st.error("Não foi possível carregar os casos reais. Verifique se o arquivo de dados está disponível.")
-        return
-    
-    # Filter options
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        category_filter = st.selectbox(
-            "Filtrar por categoria:",
-            ["Todos"] + list(set([case['category'] for case in cases]))
-        )
-    
-    with col2:
-        severity_filter = st.selectbox(
-            "Filtrar por severidade:",
-            ["Todos", "Baixa", "Média", "Alta"]
-        )
-    
-    # Apply filters
-    filtered_cases = cases
-    if category_filter != "Todos":
-        filtered_cases = [case for case in filtered_cases if case['category'] == category_filter]
-    if severity_filter != "Todos":
-        filtered_cases = [case for case in filtered_cases if case['severity'] == severity_filter]
-    
-    st.markdown(f"**{len(filtered_cases)}** casos encontrados")
-    
-    # Display cases
-    for i, case in enumerate(filtered_cases):
-        with st.expander(f"📖 {case['title']}", expanded=i==0):
-            # Case header
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.markdown(f"**Categoria:** {case['category']}")
-            with col2:
-                severity_color = {"Baixa": "🟢", "Média": "🟡", "Alta": "🔴"}
-                st.markdown(f"**Severidade:** {severity_color.get(case['severity'], '⚪')} {case['severity']}")
-            with col3:
-                st.markdown(f"**Ano:** {case['year']}")
-            
-            # Case content
-            st.markdown("### 📝 Descrição do Caso")
-            st.markdown(case['description'])
-            
-            st.markdown("### 🎯 Tipo de Viés Identificado")
-            st.info(f"**{case['bias_type']}:** {case['bias_explanation']}")
-            
-            st.markdown("### ⚡ Impacto")
-            st.warning(case['impact'])
-            
-            if case.get('solution'):
-                st.markdown("### ✅ Solução Implementada")
-                st.success(case['solution'])
-            
-            # Learning section
-            st.markdown("### 🎓 Lições Aprendidas")
-            for lesson in case['lessons']:
-                st.markdown(f"• {lesson}")
-            
-            # Discussion questions
-            if case.get('discussion_questions'):
-                st.markdown("### 💭 Questões para Discussão")
-                for question in case['discussion_questions']:
-                    st.markdown(f"❓ {question}")
-            
-            # Interactive elements
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                if st.button(f"📌 Marcar como Estudado", key=f"studied_{i}"):
-                    st.session_state.progress_tracker.update_progress('cases_studied', 1)
-                    st.success("Caso marcado como estudado!")
-                    st.rerun()
-            
-            with col2:
-                if st.button(f"📤 Compartilhar", key=f"share_{i}"):
-                    st.info("Link copiado! [Funcionalidade em desenvolvimento]")
-    
-    # Summary section
-    #if filtered_cases:
-        #st.markdown("---")
-        #st.subheader("📊 Resumo dos Casos")
-        
-        # Statistics
-        #col1, col2, col3, col4 = st.columns(4)
-        
-        #categories = [case['category'] for case in filtered_cases]
-        #severities = [case['severity'] for case in filtered_cases]
-        #bias_types = [case['bias_type'] for case in filtered_cases]
-        
-        #with col1:
-            #most_common_category = max(set(categories), key=categories.count)
-            #st.metric("Categoria Mais Comum", most_common_category)
-        
-        #with col2:
-            #most_common_severity = max(set(severities), key=severities.count)
-            #st.metric("Severidade Mais Comum", most_common_severity)
-        
-        #with col3:
-            #most_common_bias = max(set(bias_types), key=bias_types.count)
-            #st.metric("Viés Mais Comum", most_common_bias)
-        
-        #with col4:
-            #recent_cases = len([case for case in filtered_cases if case['year'] >= 2020])
-            #st.metric("Casos Recentes (2020+)", recent_cases)
-        
-        # Key insights
-        #st.markdown("### 💡 Principais Insights")
-        
-        #insights = [
-            #"Vieses em IA são mais comuns em sistemas de reconhecimento e recomendação",
-            #"A falta de diversidade nos dados de treinamento é uma causa frequente",
-            #"Testes regulares e auditorias são essenciais para identificar problemas",
-            #"A inclusão de equipes diversas no desenvolvimento reduz riscos",
-            #"Transparência e explicabilidade ajudam na detecção precoce"
-        #]
-        
-        #for insight in insights:
-            #st.markdown(f"✅ {insight}")
-    
-    # Progress tracking
-    #progress = st.session_state.progress_tracker.get_progress()
-    #st.markdown("---")
-    #st.subheader("📈 Seu Progresso")
-    #st.metric("Casos Estudados", progress.get('cases_studied', 0))
-
-    # Sidebar navigation
-    with st.sidebar:
-        st.markdown("""
-        <style>
-            .sidebar-title {
-                font-size: 1.5em;
-                margin-bottom: 10px;
-                display: flex;
-                align-items: center;
-            }
-            .sidebar-title i {
-                margin-right: 10px;
-            }
-            /* Esconde a navegação automática do Streamlit */
-            [data-testid="stSidebarNav"] {
-                display: none;
-            }
-        </style>
-        """, unsafe_allow_html=True)
-        
-        st.markdown('<div class="sidebar-title"><i>🧠</i> IA na Educação</div>', unsafe_allow_html=True)
-        st.markdown("### Menu")
-        st.page_link("ia_edu.py", label="🏠 Página Inicial")
-        st.page_link("pages/1_🎯_Simulador_de_Vieses.py", label="🎯 Simulador de Vieses")
-        st.page_link("pages/3_📝_Planos_de_Aula.py", label="📝 Planos de Aula")
-        st.page_link("pages/4_📖_Recursos.py", label="📖 Recursos")
-        
-        st.markdown("---")
-        st.markdown("### 📊 Estatísticas")
-        if cases:
-            st.markdown(f"**Total de casos:** {len(cases)}")
-            categories = list(set([case['category'] for case in cases]))
-            st.markdown(f"**Categorias:** {len(categories)}")
-            
-            for category in categories:
-                count = len([case for case in cases if case['category'] == category])
-                st.markdown(f"• {category}: {count}")
-
-if __name__ == "__main__":
-    main()
+import streamlit as st
+from utils.case_index import get_case_index
+from utils.content_store import load_dataset
+from utils.navigation import render_sidebar
+from utils.progress_tracker import ProgressTracker
+from utils.render_metrics import RenderMeter
+from utils.search_engine import get_search_engine
+from utils.theme import css_payload_bytes, inject_theme
+
+st.set_page_config(
+    page_title="Casos Reais - IA na Educação",
+    page_icon="📚",
+    layout="wide"
+)
+inject_theme()
+
+# Initialize progress tracker
+if 'progress_tracker' not in st.session_state:
+    st.session_state.progress_tracker = ProgressTracker.for_session(st.session_state, st.query_params)
+
+PAGE_SIZES = [5, 10, 20, 50]
+SEVERITY_COLORS = {"Baixa": "🟢", "Média": "🟡", "Alta": "🔴"}
+
+def load_real_cases():
+    """Load real cases from the shared content store"""
+    return load_dataset('real_cases', [])
+
+def render_case_details(case, case_id):
+    """Render the full content and actions of a case"""
+    # Case header
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown(f"**Categoria:** {case['category']}")
+    with col2:
+        st.markdown(f"**Severidade:** {SEVERITY_COLORS.get(case['severity'], '⚪')} {case['severity']}")
+    with col3:
+        st.markdown(f"**Ano:** {case['year']}")
+    
+    # Case content
+    st.markdown("### 📝 Descrição do Caso")
+    st.markdown(case['description'])
+    
+    st.markdown("### 🎯 Tipo de Viés Identificado")
+    st.info(f"**{case['bias_type']}:** {case['bias_explanation']}")
+    
+    st.markdown("### ⚡ Impacto")
+    st.warning(case['impact'])
+    
+    if case.get('solution'):
+        st.markdown("### ✅ Solução Implementada")
+        st.success(case['solution'])
+    
+    # Learning section
+    st.markdown("### 🎓 Lições Aprendidas")
+    st.markdown("\n\n".join(f"• {lesson}" for lesson in case['lessons']))
+    
+    # Discussion questions
+    if case.get('discussion_questions'):
+        st.markdown("### 💭 Questões para Discussão")
+        st.markdown("\n\n".join(f"❓ {question}" for question in case['discussion_questions']))
+    
+    # Interactive elements
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button(f"📌 Marcar como Estudado", key=f"studied_{case_id}"):
+            st.session_state.progress_tracker.update_progress('cases_studied', 1)
+            st.success("Caso marcado como estudado!")
+            st.rerun()
+    
+    with col2:
+        if st.button(f"📤 Compartilhar", key=f"share_{case_id}"):
+            st.info("Link copiado! [Funcionalidade em desenvolvimento]")
+
+def render_page():
+    st.title("📚 Casos Reais de Vieses em IA")
+    st.markdown("Explore exemplos concretos de como vieses aparecem em sistemas reais")
+    
+    cases = load_real_cases()
+    
+    if not cases:
+        st.error("Não foi possível carregar os casos reais. Verifique se o arquivo de dados está disponível.")
+        return
+    
+    index = get_case_index()
+    
+    # Full-text search
+    query = st.text_input(
+        "🔎 Buscar nos casos:",
+        placeholder="Ex.: reconhecimento facial, redações, gênero..."
+    )
+    
+    # Filter options
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        category_filter = st.selectbox(
+            "Filtrar por categoria:",
+            ["Todos"] + index.values('category')
+        )
+    
+    with col2:
+        severity_filter = st.selectbox(
+            "Filtrar por severidade:",
+            ["Todos", "Baixa", "Média", "Alta"]
+        )
+    
+    with col3:
+        bias_type_filter = st.selectbox(
+            "Filtrar por tipo de viés:",
+            ["Todos"] + index.values('bias_type')
+        )
+    
+    with col4:
+        period_filter = st.selectbox(
+            "Filtrar por período:",
+            ["Todos"] + index.values('year_bucket')
+        )
+    
+    # Apply filters (resolved by intersecting the prebuilt indexes)
+    filtered_ids = index.filter_ids(
+        category=None if category_filter == "Todos" else category_filter,
+        severity=None if severity_filter == "Todos" else severity_filter,
+        bias_type=None if bias_type_filter == "Todos" else bias_type_filter,
+        year_bucket=None if period_filter == "Todos" else period_filter
+    )
+    
+    if query.strip():
+        # Keep search relevance order, restricted to the filtered cases
+        allowed = set(filtered_ids)
+        results = get_search_engine().search(query, kind='case', limit=len(index.cases))
+        filtered_ids = [result['ref'] for result in results if result['ref'] in allowed]
+    
+    st.markdown(f"**{len(filtered_ids)}** casos encontrados")
+    
+    # Pagination: only the visible page builds widgets
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page_size = st.selectbox("Casos por página:", PAGE_SIZES, index=0)
+    
+    total_pages = max(1, -(-len(filtered_ids) // page_size))
+    filter_signature = (query, category_filter, severity_filter, bias_type_filter, period_filter, page_size)
+    if st.session_state.get('cases_filter_signature') != filter_signature:
+        st.session_state.cases_filter_signature = filter_signature
+        st.session_state.cases_page = 1
+    
+    with col2:
+        page = st.number_input(
+            "Página:",
+            min_value=1, max_value=total_pages, step=1,
+            key="cases_page",
+            help=f"{total_pages} página(s) no total"
+        )
+    
+    page_ids = filtered_ids[(page - 1) * page_size:page * page_size]
+    
+    # Display cases: the body is only built once the card is opened
+    for position, case_id in enumerate(page_ids):
+        case = index.cases[case_id]
+        with st.container(border=True):
+            st.markdown(f"#### 📖 {case['title']}")
+            if st.toggle("Ver detalhes", value=page == 1 and position == 0, key=f"open_{case_id}"):
+                render_case_details(case, case_id)
+    
+    # Summary section
+    #if filtered_cases:
+        #st.markdown("---")
+        #st.subheader("📊 Resumo dos Casos")
+        
+        # Statistics
+        #col1, col2, col3, col4 = st.columns(4)
+        
+        #categories = [case['category'] for case in filtered_cases]
+        #severities = [case['severity'] for case in filtered_cases]
+        #bias_types = [case['bias_type'] for case in filtered_cases]
+        
+        #with col1:
+            #most_common_category = max(set(categories), key=categories.count)
+            #st.metric("Categoria Mais Comum", most_common_category)
+        
+        #with col2:
+            #most_common_severity = max(set(severities), key=severities.count)
+            #st.metric("Severidade Mais Comum", most_common_severity)
+        
+        #with col3:
+            #most_common_bias = max(set(bias_types), key=bias_types.count)
+            #st.metric("Viés Mais Comum", most_common_bias)
+        
+        #with col4:
+            #recent_cases = len([case for case in filtered_cases if case['year'] >= 2020])
+            #st.metric("Casos Recentes (2020+)", recent_cases)
+        
+        # Key insights
+        #st.markdown("### 💡 Principais Insights")
+        
+        #insights = [
+            #"Vieses em IA são mais comuns em sistemas de reconhecimento e recomendação",
+            #"A falta de diversidade nos dados de treinamento é uma causa frequente",
+            #"Testes regulares e auditorias são essenciais para identificar problemas",
+            #"A inclusão de equipes diversas no desenvolvimento reduz riscos",
+            #"Transparência e explicabilidade ajudam na detecção precoce"
+        #]
+        
+        #for insight in insights:
+            #st.markdown(f"✅ {insight}")
+    
+    # Progress tracking
+    #progress = st.session_state.progress_tracker.get_progress()
+    #st.markdown("---")
+    #st.subheader("📈 Seu Progresso")
+    #st.metric("Casos Estudados", progress.get('cases_studied', 0))
+
+    render_sidebar(__file__)
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("### 📊 Estatísticas")
+        if cases:
+            st.markdown(f"**Total de casos:** {len(cases)}")
+            category_counts = index.facet_counts['category']
+            st.markdown(f"**Categorias:** {len(category_counts)}")
+            
+            for category, count in category_counts.items():
+                st.markdown(f"• {category}: {count}")
+
+def main():
+    # Measure this rerun so payload size and render time can be tracked as the dataset grows
+    meter = RenderMeter().start()
+    try:
+        render_page()
+    finally:
+        metrics = meter.stop()
+    
+    st.session_state.cases_render_metrics = metrics
+    with st.sidebar:
+        payload = (f"{metrics['payload_bytes'] / 1024:.1f} KB · {metrics['messages']} mensagens"
+                   if metrics['payload_bytes'] is not None else "payload indisponível")
+        st.caption(
+            f"⏱️ Renderização: {metrics['render_ms']:.0f} ms · {payload} · "
+            f"CSS {css_payload_bytes() / 1024:.1f} KB"
+        )
+
+if __name__ == "__main__":
+    main()
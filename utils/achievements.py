@@ -0,0 +1,139 @@
+from typing import Dict, List, Any, Iterable, Optional
+
+# Declarative achievement rules. Each requirement compares an aggregate of the
+# progress counters against a threshold:
+#   'count'   -> data[counter] >= threshold
+#   'average' -> data[counter] / data[per] >= threshold (False while data[per] is 0)
+# Only 'count' requirements contribute to the displayed progress.
+ACHIEVEMENT_RULES = {
+    'first_simulation': {
+        'name': '🎯 Primeiro Simulador',
+        'description': 'Completou sua primeira simulação de viés',
+        'requirements': [
+            {'counter': 'simulations_completed', 'threshold': 1}
+        ]
+    },
+    'case_explorer': {
+        'name': '📚 Explorador de Casos',
+        'description': 'Estudou 5 casos reais de vieses em IA',
+        'requirements': [
+            {'counter': 'cases_studied', 'threshold': 5}
+        ]
+    },
+    'plan_creator': {
+        'name': '📝 Criador de Planos',
+        'description': 'Criou seu primeiro plano de aula',
+        'requirements': [
+            {'counter': 'plans_created', 'threshold': 1}
+        ]
+    },
+    'resource_hunter': {
+        'name': '📖 Caçador de Recursos',
+        'description': 'Acessou 10 recursos educacionais',
+        'requirements': [
+            {'counter': 'resources_accessed', 'threshold': 10}
+        ]
+    },
+    'bias_expert': {
+        'name': '🏆 Especialista em Vieses',
+        'description': 'Completou 10 simulações com pontuação média acima de 80',
+        'requirements': [
+            {'counter': 'simulations_completed', 'threshold': 10},
+            {'counter': 'total_score', 'aggregate': 'average', 'per': 'simulations_completed', 'threshold': 80}
+        ]
+    },
+    'educator': {
+        'name': '🎓 Educador Consciente',
+        'description': 'Criou 3 planos de aula e estudou 10 casos',
+        'requirements': [
+            {'counter': 'plans_created', 'threshold': 3},
+            {'counter': 'cases_studied', 'threshold': 10}
+        ]
+    },
+    'frequent_learner': {
+        'name': '📅 Aprendiz Constante',
+        'description': 'Realizou atividades em 7 sessões diferentes',
+        'requirements': [
+            {'counter': 'sessions', 'threshold': 7}
+        ]
+    }
+}
+
+AGGREGATES = ('count', 'average')
+
+
+def requirement_counters(requirement: Dict[str, Any]) -> List[str]:
+    """Return the counters a requirement reads"""
+    counters = [requirement['counter']]
+    if requirement.get('per'):
+        counters.append(requirement['per'])
+    return counters
+
+
+def requirement_met(requirement: Dict[str, Any], data: Dict[str, Any]) -> bool:
+    """Check one requirement against the progress counters"""
+    value = data.get(requirement['counter'], 0)
+    if requirement.get('aggregate', 'count') == 'average':
+        total = data.get(requirement['per'], 0)
+        return total > 0 and value / total >= requirement['threshold']
+    return value >= requirement['threshold']
+
+
+class AchievementEngine:
+    """Evaluate achievement rules, re-checking only the rules a changed counter affects"""
+
+    def __init__(self, rules: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.rules = ACHIEVEMENT_RULES if rules is None else rules
+        # counter -> ids of the achievements that read it
+        self.dependents = {}
+        for achievement_id, rule in self.rules.items():
+            for requirement in rule['requirements']:
+                if requirement.get('aggregate', 'count') not in AGGREGATES:
+                    raise ValueError(f"Unknown aggregate in achievement '{achievement_id}'")
+                for counter in requirement_counters(requirement):
+                    ids = self.dependents.setdefault(counter, [])
+                    if achievement_id not in ids:
+                        ids.append(achievement_id)
+
+    def affected(self, changed: Optional[Iterable[str]] = None) -> List[str]:
+        """Return the achievement ids that depend on any changed counter (all if None)"""
+        if changed is None:
+            return list(self.rules)
+        affected = set()
+        for counter in changed:
+            affected.update(self.dependents.get(counter, ()))
+        # Keep the definition order so achievements are earned in a stable order
+        return [achievement_id for achievement_id in self.rules if achievement_id in affected]
+
+    def is_earned(self, achievement_id: str, data: Dict[str, Any]) -> bool:
+        """Check whether all requirements of an achievement are met"""
+        return all(requirement_met(r, data) for r in self.rules[achievement_id]['requirements'])
+
+    def progress(self, achievement_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return current/target/percentage of an achievement's count requirements"""
+        counts = [r for r in self.rules[achievement_id]['requirements'] if r.get('aggregate', 'count') == 'count']
+        if not counts:
+            return {'current': 0, 'target': 1, 'percentage': 0}
+        return {
+            'current': min(data.get(r['counter'], 0) for r in counts),
+            'target': min(r['threshold'] for r in counts),
+            'percentage': min(100, min(data.get(r['counter'], 0) / r['threshold'] for r in counts) * 100)
+        }
+
+    def describe(self, achievement_id: str) -> Dict[str, Any]:
+        """Return a copy of an achievement's display fields and requirements"""
+        rule = self.rules[achievement_id]
+        return {
+            'id': achievement_id,
+            'name': rule['name'],
+            'description': rule['description'],
+            'requirements': [dict(r) for r in rule['requirements']]
+        }
+
+
+_default_engine = AchievementEngine()
+
+
+def get_achievement_engine() -> AchievementEngine:
+    """Return the engine for the built-in rules, shared by all trackers"""
+    return _default_engine
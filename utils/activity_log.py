@@ -0,0 +1,173 @@
+import threading
+import time
+from array import array
+from datetime import datetime
+from typing import Dict, List, Any, Iterator, Optional
+
+from utils.memory_usage import deep_sizeof
+
+# Activity type codes; unknown types get the next free code on first use
+ACTIVITY_TYPES = ['simulations_completed', 'cases_studied', 'plans_created', 'resources_accessed', 'sessions']
+_TYPE_CODES = {name: code for code, name in enumerate(ACTIVITY_TYPES)}
+# Shared by every session: registering a new type is a check-then-append
+_TYPE_CODES_LOCK = threading.Lock()
+
+NO_SCORE = -1
+
+
+def activity_code(activity_type: str) -> int:
+    """Return the compact code of an activity type"""
+    code = _TYPE_CODES.get(activity_type)
+    if code is not None:
+        return code
+    with _TYPE_CODES_LOCK:
+        # Another thread may have registered it while we waited
+        code = _TYPE_CODES.get(activity_type)
+        if code is None:
+            if len(ACTIVITY_TYPES) >= 256:
+                raise ValueError("Too many distinct activity types")
+            code = len(ACTIVITY_TYPES)
+            # Name first, so a reader that finds the code can always decode it
+            ACTIVITY_TYPES.append(activity_type)
+            _TYPE_CODES[activity_type] = code
+    return code
+
+
+def _day(timestamp: int) -> int:
+    """Local calendar day (proleptic ordinal) of an epoch timestamp"""
+    return datetime.fromtimestamp(timestamp).toordinal()
+
+
+class ActivityLog:
+    """Column-oriented activity history with bounded retention and daily rollups
+
+    Recent events are kept in typed arrays (type code, epoch seconds, value,
+    score). When more than `max_events` are stored, the oldest ones are folded
+    into per-day aggregates, so memory stays bounded while counts per day and
+    the set of active days remain exact.
+    """
+
+    def __init__(self, max_events: int = 1000, max_rollup_days: Optional[int] = None):
+        self.max_events = max_events
+        self.max_rollup_days = max_rollup_days
+        self.types = array('B')
+        self.timestamps = array('q')
+        self.values = array('i')
+        self.scores = array('h')
+        # day -> type code -> [events, value sum, score sum, scored events]
+        self.daily = {}
+        self.active_days = set()
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def append(self, activity_type: str, value: int = 1, score: Optional[int] = None,
+               timestamp: Optional[int] = None) -> None:
+        """Record one activity"""
+        timestamp = int(time.time()) if timestamp is None else int(timestamp)
+        day = _day(timestamp)
+        self.types.append(activity_code(activity_type))
+        self.timestamps.append(timestamp)
+        self.values.append(value)
+        self.scores.append(NO_SCORE if score is None else score)
+        self.active_days.add(day)
+
+        if len(self.types) > self.max_events:
+            # Roll up a batch at once so trimming the arrays stays amortized O(1)
+            self.rollup(len(self.types) - self.max_events + max(1, self.max_events // 10))
+
+    def rollup(self, count: int) -> None:
+        """Fold the `count` oldest events into the daily aggregates"""
+        count = min(count, len(self.types))
+        for i in range(count):
+            day = _day(self.timestamps[i])
+            aggregate = self.daily.setdefault(day, {}).setdefault(self.types[i], [0, 0, 0, 0])
+            aggregate[0] += 1
+            aggregate[1] += self.values[i]
+            if self.scores[i] != NO_SCORE:
+                aggregate[2] += self.scores[i]
+                aggregate[3] += 1
+
+        del self.types[:count]
+        del self.timestamps[:count]
+        del self.values[:count]
+        del self.scores[:count]
+
+        if self.max_rollup_days is not None and len(self.daily) > self.max_rollup_days:
+            for day in sorted(self.daily)[:len(self.daily) - self.max_rollup_days]:
+                del self.daily[day]
+
+    def days_active(self) -> int:
+        """Number of distinct days with at least one activity"""
+        return len(self.active_days)
+
+    def iter_events(self) -> Iterator[tuple]:
+        """Yield the retained events as (type, value, score, epoch seconds) tuples"""
+        for code, timestamp, value, score in zip(self.types, self.timestamps, self.values, self.scores):
+            yield ACTIVITY_TYPES[code], value, None if score == NO_SCORE else score, timestamp
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield the retained events in the dict format used by exports"""
+        for code, timestamp, value, score in zip(self.types, self.timestamps, self.values, self.scores):
+            yield {
+                'type': ACTIVITY_TYPES[code],
+                'value': value,
+                'score': None if score == NO_SCORE else score,
+                'timestamp': datetime.fromtimestamp(timestamp).isoformat()
+            }
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Return the retained events as a list of dicts"""
+        return list(self.iter_records())
+
+    def rollup_records(self) -> List[Dict[str, Any]]:
+        """Return the daily aggregates as a list of dicts"""
+        return [
+            {
+                'date': datetime.fromordinal(day).date().isoformat(),
+                'type': ACTIVITY_TYPES[code],
+                'events': events,
+                'value': value_sum,
+                'score_sum': score_sum,
+                'scored_events': scored
+            }
+            for day, by_type in sorted(self.daily.items())
+            for code, (events, value_sum, score_sum, scored) in by_type.items()
+        ]
+
+    def add_rollup_record(self, record: Dict[str, Any]) -> None:
+        """Merge one exported daily aggregate"""
+        day = datetime.fromisoformat(record['date']).toordinal()
+        aggregate = self.daily.setdefault(day, {}).setdefault(activity_code(record['type']), [0, 0, 0, 0])
+        aggregate[0] += record.get('events', 0)
+        aggregate[1] += record.get('value', 0)
+        aggregate[2] += record.get('score_sum', 0)
+        aggregate[3] += record.get('scored_events', 0)
+        self.active_days.add(day)
+
+    def add_record(self, record: Dict[str, Any]) -> None:
+        """Append one exported event (ISO timestamp)"""
+        timestamp = int(datetime.fromisoformat(record['timestamp']).timestamp())
+        self.append(record['type'], record.get('value', 1), record.get('score'), timestamp)
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]], rollup: List[Dict[str, Any]] = (),
+                     max_events: int = 1000) -> 'ActivityLog':
+        """Rebuild a log from exported events and daily aggregates, skipping invalid entries"""
+        log = cls(max_events)
+        for record in rollup:
+            try:
+                log.add_rollup_record(record)
+            except (ValueError, KeyError, TypeError):
+                continue
+        for record in records:
+            try:
+                log.add_record(record)
+            except (ValueError, KeyError, TypeError):
+                continue
+        return log
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the retained events and aggregates"""
+        arrays = sum(a.buffer_info()[1] * a.itemsize for a in (self.types, self.timestamps, self.values, self.scores))
+        return arrays + deep_sizeof(self.daily) + deep_sizeof(self.active_days)
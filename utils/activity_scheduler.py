@@ -0,0 +1,146 @@
+import re
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Sequence, Tuple
+
+from utils.search_engine import fold_accents
+
+# Activity categories controlled by the lesson plan checkboxes
+TAGS = ('technology', 'discussion', 'practical')
+TAG_BITS = {tag: 1 << i for i, tag in enumerate(TAGS)}
+
+# Accent-folded word prefixes that mark an activity as belonging to a category. Only used for
+# activities without explicit "tags" in the data, so they stay narrow: broad words such as
+# "projeto" or "analise" would tag almost every activity.
+TAG_KEYWORDS = {
+    'technology': ('computador', 'tablet', 'internet', 'online', 'digital', 'software', 'aplicativo',
+                   'ferramenta', 'plataforma', 'planilha'),
+    'discussion': ('discuss', 'debate', 'reflex', 'conversa', 'argument', 'opiniao'),
+    'practical': ('pratic', 'exercicio', 'oficina', 'workshop', 'simulac', 'prototip')
+}
+
+_DURATION_PATTERN = re.compile(r'(\d+)\s*(h|min)', re.IGNORECASE)
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+def parse_minutes(duration: Any) -> int:
+    """Parse '20 min', '1h 30min' or a bare number into minutes (0 if unreadable)"""
+    if isinstance(duration, (int, float)):
+        return max(0, int(duration))
+    minutes = 0
+    for amount, unit in _DURATION_PATTERN.findall(str(duration)):
+        minutes += int(amount) * (60 if unit.lower() == 'h' else 1)
+    if not minutes and str(duration).strip().isdigit():
+        minutes = int(str(duration).strip())
+    return minutes
+
+
+def infer_tags(*texts: str) -> FrozenSet[str]:
+    """Infer the categories of an activity from its name and description"""
+    words = _WORD_PATTERN.findall(fold_accents(' '.join(texts)))
+    return frozenset(
+        tag for tag, prefixes in TAG_KEYWORDS.items()
+        if any(word.startswith(prefixes) for word in words)
+    )
+
+
+def tag_mask(tags: FrozenSet[str]) -> int:
+    """Bitmask of a set of tags"""
+    mask = 0
+    for tag in tags:
+        mask |= TAG_BITS.get(tag, 0)
+    return mask
+
+
+@lru_cache(maxsize=1024)
+def schedule_activities(activities: Tuple[Any, ...], target: int, include_technology: bool = True,
+                        include_discussion: bool = True, include_practical: bool = True,
+                        extras: Tuple[Any, ...] = ()) -> Tuple[Any, ...]:
+    """Pick the activities that best fill `target` minutes, in lesson order
+
+    Activities need `minutes` and `tags`. The first and last activities of
+    the template are its opening and closing; `extras` (a handful of
+    optional fillers) go between the template's activities and its closing.
+    The choice maximizes, in order:
+
+    1. the scheduled time (never above the target);
+    2. the number of pinned activities (opening and closing) kept;
+    3. minus the minutes of activities in a disabled category, so an
+       unchecked category is avoided whenever something else fits;
+    4. the template's sequence: each activity is kept if it still fits
+       given the ones before it, so fillers replace what does not fit
+       instead of later activities;
+    5. the time taken from the template rather than from `extras`.
+
+    All terms are additive, so a 0/1 knapsack over the minutes finds the
+    optimum with one integer score per reachable duration, in
+    O(activities x target).
+    """
+    if target <= 0:
+        return ()
+    enabled = 0
+    for flag, tag in ((include_technology, 'technology'), (include_discussion, 'discussion'),
+                      (include_practical, 'practical')):
+        if flag:
+            enabled |= TAG_BITS[tag]
+    disabled = ((1 << len(TAGS)) - 1) & ~enabled
+
+    # Lexicographic objective packed into one integer: each weight exceeds the whole
+    # range of the terms below it (template minutes <= target, one sequence bit per activity)
+    minutes_weight = target + 1
+    sequence_bits = len(activities)
+    penalty_weight = minutes_weight << sequence_bits
+    pinned_weight = (target + 1) * penalty_weight
+    closing = len(activities) - 1
+    items = []
+    for index, activity in enumerate(activities + extras):
+        if activity.minutes > target:
+            continue
+        from_template = index <= closing
+        pinned = from_template and index in (0, closing)
+        gain = pinned * pinned_weight
+        if tag_mask(activity.tags) & disabled:
+            gain -= activity.minutes * penalty_weight
+        if from_template:
+            gain += (1 << (sequence_bits - 1 - index)) * minutes_weight + activity.minutes
+        items.append((index, activity.minutes, gain))
+
+    # best[t]: score of the best selection lasting exactly t minutes (None if unreachable);
+    # one snapshot per item to recover the selection
+    best = [None] * (target + 1)
+    best[0] = 0
+    snapshots = [best]
+    for _, minutes, gain in items:
+        new = list(best)
+        for total in range(minutes, target + 1):
+            previous = best[total - minutes]
+            if previous is not None and (new[total] is None or previous + gain > new[total]):
+                new[total] = previous + gain
+        best = new
+        snapshots.append(best)
+
+    total = max(t for t, score in enumerate(best) if score is not None)
+    chosen = set()
+    for position in range(len(items) - 1, -1, -1):
+        if snapshots[position + 1][total] != snapshots[position][total]:
+            index, minutes, _ = items[position]
+            chosen.add(index)
+            total -= minutes
+
+    # Opening and template activities, fillers, then the closing (a lone activity opens the lesson)
+    last = closing if closing > 0 else len(activities)
+    order = [i for i in range(last) if i in chosen]
+    order += [i for i in range(len(activities), len(activities) + len(extras)) if i in chosen]
+    if closing > 0 and closing in chosen:
+        order.append(closing)
+    return tuple((activities + extras)[i] for i in order)
+
+
+def scheduled_minutes(activities: Sequence[Any]) -> int:
+    """Total minutes of a list of activities"""
+    return sum(activity.minutes for activity in activities)
+
+
+def schedule_stats() -> Dict[str, int]:
+    """Hit/miss counters of the schedule memo"""
+    info = schedule_activities.cache_info()
+    return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize}
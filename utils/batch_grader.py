@@ -0,0 +1,201 @@
+import csv
+import json
+import os
+import sys
+import time
+from functools import partial
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+from utils.bias_simulator import BiasSimulator
+from utils.parallel import parallel_map
+
+RESULT_FIELDS = ['record_id', 'scenario_id', 'score', 'accuracy', 'level', 'feedback',
+                 'detailed_feedback', 'recommendations', 'error']
+
+# Per-process grading state, created once by the pool initializer
+_simulator = None
+_scenarios_by_id = None
+
+
+def _init_worker() -> None:
+    """Load the scenario table once per worker process"""
+    global _simulator, _scenarios_by_id
+    _simulator = BiasSimulator()
+    _scenarios_by_id = {str(s.get('id')): s for s in _simulator.scenario_templates}
+
+
+def parse_bias_types(value: Any) -> List[str]:
+    """Accept a list, tuple or 1-d array, or a ';'-separated string of bias types (anything else is empty)"""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, str):
+        return [part.strip() for part in value.split(';') if part.strip()]
+    # numpy arrays, e.g. list cells of a DataFrame read from Parquet
+    if getattr(value, 'ndim', None) == 1:
+        return list(value.tolist())
+    return []
+
+
+def _grade_one(record: Dict[str, Any], include_explanation: bool = False) -> Dict[str, Any]:
+    """Grade a single submission with the worker's simulator"""
+    scenario_id = record.get('scenario_id')
+    result = {'record_id': record.get('record_id', record.get('id')), 'scenario_id': scenario_id}
+
+    scenario = _scenarios_by_id.get(str(scenario_id))
+    if scenario is None:
+        result['error'] = f"Unknown scenario id: {scenario_id}"
+        return result
+
+    evaluation = _simulator.evaluate_response(
+        scenario,
+        record.get('bias_detected', ''),
+        parse_bias_types(record.get('bias_types')),
+        record.get('solution', '') or ''
+    )
+    if not include_explanation:
+        evaluation.pop('explanation', None)
+
+    result.update(evaluation)
+    return result
+
+
+def _grade_chunk(records: List[Dict[str, Any]], include_explanation: bool = False) -> List[Dict[str, Any]]:
+    """Grade a chunk of submissions inside a worker process"""
+    return [_grade_one(record, include_explanation) for record in records]
+
+
+def _grade_chunk_vectorized(records: List[Dict[str, Any]], include_explanation: bool = False) -> List[Dict[str, Any]]:
+    """Grade a chunk of submissions with the columnar scoring path"""
+    from utils.vectorized_grader import grade_columns, iter_results
+
+    scenario_ids = [record.get('scenario_id') for record in records]
+    bias_types = [parse_bias_types(record.get('bias_types')) for record in records]
+    columns = grade_columns(
+        _simulator,
+        scenario_ids,
+        [record.get('bias_detected', '') or '' for record in records],
+        bias_types,
+        [record.get('solution', '') or '' for record in records]
+    )
+
+    results = []
+    evaluations = iter_results(_simulator, columns, bias_types, include_explanation)
+    for record, scenario_id, evaluation in zip(records, scenario_ids, evaluations):
+        result = {'record_id': record.get('record_id', record.get('id')), 'scenario_id': scenario_id}
+        if evaluation is None:
+            result['error'] = f"Unknown scenario id: {scenario_id}"
+        else:
+            result.update(evaluation)
+        results.append(result)
+    return results
+
+
+def grade_records(records: Iterable[Dict[str, Any]], workers: Optional[int] = None,
+                  chunk_size: int = 500, include_explanation: bool = False,
+                  vectorized: bool = False) -> Iterator[Dict[str, Any]]:
+    """Grade a stream of submissions, yielding results in input order
+
+    Records need `scenario_id`, `bias_detected`, `bias_types` and `solution`.
+    Only a bounded number of chunks is in flight at once, so arbitrarily large
+    inputs are graded in constant memory. With `vectorized=True` each chunk is
+    scored in one NumPy pass instead of record by record.
+    """
+    grade_chunk = _grade_chunk_vectorized if vectorized else _grade_chunk
+    return parallel_map(partial(grade_chunk, include_explanation=include_explanation), records,
+                        chunk_size, workers, _init_worker)
+
+
+def read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream submissions from a .csv or .jsonl file"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.endswith('.csv'):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class ResultWriter:
+    """Stream graded results to a .csv or .jsonl file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.is_csv = path.endswith('.csv')
+        self._file = open(path, 'w', encoding='utf-8', newline='')
+        self._csv = None
+        if self.is_csv:
+            self._csv = csv.DictWriter(self._file, fieldnames=RESULT_FIELDS, extrasaction='ignore')
+            self._csv.writeheader()
+
+    def write(self, result: Dict[str, Any]) -> None:
+        """Write one result"""
+        if self.is_csv:
+            row = dict(result)
+            for key in ('detailed_feedback', 'recommendations'):
+                if isinstance(row.get(key), (list, tuple)):
+                    row[key] = ' | '.join(row[key])
+            self._csv.writerow(row)
+        else:
+            self._file.write(json.dumps(result, ensure_ascii=False))
+            self._file.write('\n')
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> 'ResultWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def grade_file(input_path: str, output_path: str, workers: Optional[int] = None,
+               chunk_size: int = 500, include_explanation: bool = False,
+               vectorized: bool = False) -> Dict[str, Any]:
+    """Grade every submission of a file and return throughput statistics"""
+    start = time.perf_counter()
+    graded = 0
+    errors = 0
+
+    with ResultWriter(output_path) as writer:
+        for result in grade_records(read_records(input_path), workers, chunk_size,
+                                    include_explanation, vectorized):
+            writer.write(result)
+            graded += 1
+            if result.get('error'):
+                errors += 1
+
+    elapsed = time.perf_counter() - start
+    return {
+        'records': graded,
+        'errors': errors,
+        'workers': workers or os.cpu_count() or 1,
+        'seconds': round(elapsed, 3),
+        'records_per_second': round(graded / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Grade bias-simulator submissions in batch")
+    parser.add_argument('input', help="Submissions file (.csv or .jsonl)")
+    parser.add_argument('output', help="Results file (.csv or .jsonl)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=500)
+    parser.add_argument('--include-explanation', action='store_true')
+    parser.add_argument('--vectorized', action='store_true', help="Score each chunk in one NumPy pass")
+    args = parser.parse_args(argv)
+
+    stats = grade_file(args.input, args.output, args.workers, args.chunk_size,
+                       args.include_explanation, args.vectorized)
+    print(f"{stats['records']} records graded ({stats['errors']} errors) in {stats['seconds']} s "
+          f"with {stats['workers']} worker(s): {stats['records_per_second']} records/s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,217 +1,407 @@
-import random
-import json
-from typing import Dict, List, Any
-
-class BiasSimulator:
-    """Simulator for AI bias scenarios with interactive analysis"""
-    
-    def __init__(self):
-        self.scenario_templates = self._load_scenario_templates()
-        self.bias_types = {
-            "Viés de Confirmação": "Tendência de buscar informações que confirmem crenças preexistentes",
-            "Viés de Representação": "Dados de treinamento não representam adequadamente a população",
-            "Viés de Seleção": "Distorções na forma como os dados foram coletados",
-            "Viés Cultural": "Preconceitos baseados em normas culturais específicas",
-            "Viés de Gênero": "Discriminação baseada em gênero",
-            "Viés Racial": "Discriminação baseada em raça ou etnia",
-            "Viés Socioeconômico": "Discriminação baseada em classe social"
-        }
-    
-    def _load_scenario_templates(self) -> List[Dict]:
-        """Load scenario templates from JSON file"""
-        try:
-            with open('data/bias_scenarios.json', 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return self._get_default_scenarios()
-    
-    def _get_default_scenarios(self) -> List[Dict]:
-        """Return default scenarios if file is not available"""
-        return [
-            {
-                "type": "Seleção de Candidatos",
-                "context": "Sistema de IA para triagem de currículos",
-                "situation": "O sistema aprova mais candidatos homens que mulheres",
-                "bias_type": "Viés de Gênero",
-                "correct_identification": ["Viés de Gênero", "Viés de Representação"]
-            }
-        ]
-    
-    def generate_scenario(self, scenario_type: str) -> Dict[str, Any]:
-        """Generate a random scenario of the specified type"""
-        # Filter scenarios by type
-        matching_scenarios = [s for s in self.scenario_templates if s.get('type') == scenario_type]
-        
-        if not matching_scenarios:
-            # Return a generic scenario if no match found
-            return self._create_generic_scenario(scenario_type)
-        
-        # Select a random scenario
-        base_scenario = random.choice(matching_scenarios)
-        
-        # Add some randomization to make it more interesting
-        scenario = base_scenario.copy()
-        scenario['id'] = random.randint(1000, 9999)
-        
-        return scenario
-    
-    def _create_generic_scenario(self, scenario_type: str) -> Dict[str, Any]:
-        """Create a generic scenario when specific type is not available"""
-        generic_scenarios = {
-            "Seleção de Candidatos": {
-                "context": "Uma empresa usa IA para analisar currículos",
-                "situation": "O sistema mostra padrões discriminatórios nas aprovações",
-                "bias_type": "Viés de Representação"
-            },
-            "Reconhecimento Facial": {
-                "context": "Sistema de reconhecimento facial em ambiente educacional",
-                "situation": "O sistema tem dificuldade com certas características físicas",
-                "bias_type": "Viés Racial"
-            },
-            "Recomendação de Conteúdo": {
-                "context": "Plataforma educacional recomenda cursos",
-                "situation": "As recomendações seguem padrões estereotípicos",
-                "bias_type": "Viés de Gênero"
-            },
-            "Avaliação Automática": {
-                "context": "Sistema de correção automática de textos",
-                "situation": "Certas expressões culturais recebem notas menores",
-                "bias_type": "Viés Cultural"
-            },
-            "Tradução Automática": {
-                "context": "Sistema de tradução em escola internacional",
-                "situation": "Profissões são traduzidas com estereótipos de gênero",
-                "bias_type": "Viés de Gênero"
-            }
-        }
-        
-        template = generic_scenarios.get(scenario_type, {
-            "context": "Sistema de IA em ambiente educacional",
-            "situation": "O sistema apresenta comportamentos discriminatórios",
-            "bias_type": "Viés de Representação"
-        })
-        
-        return {
-            "id": random.randint(1000, 9999),
-            "type": scenario_type,
-            "context": template["context"],
-            "situation": template["situation"],
-            "bias_type": template["bias_type"],
-            "correct_identification": [template["bias_type"]]
-        }
-    
-    def evaluate_response(self, scenario: Dict, bias_detected: str, bias_types: List[str], solution: str) -> Dict[str, Any]:
-        """Evaluate user's response to a scenario"""
-        score = 0
-        feedback_parts = []
-        
-        # Check bias detection accuracy
-        correct_bias_types = scenario.get('correct_identification', [scenario.get('bias_type', '')])
-        
-        if bias_detected in ["Sim, há viés evidente", "Possivelmente há viés"]:
-            score += 30
-            feedback_parts.append("✅ Identificou corretamente a presença de viés")
-        else:
-            feedback_parts.append("❌ Não identificou a presença de viés no cenário")
-        
-        # Check bias type identification
-        if bias_types:
-            matching_types = set(bias_types) & set(correct_bias_types)
-            if matching_types:
-                score += 40
-                feedback_parts.append(f"✅ Identificou corretamente: {', '.join(matching_types)}")
-            else:
-                feedback_parts.append("⚠️ Tipos de viés identificados não correspondem ao cenário")
-        
-        # Evaluate solution quality
-        if solution and len(solution.strip()) > 20:
-            score += 30
-            if any(keyword in solution.lower() for keyword in ['dados', 'treinamento', 'diversidade', 'teste', 'monitorar']):
-                feedback_parts.append("✅ Proposta de solução inclui elementos técnicos relevantes")
-            else:
-                feedback_parts.append("⚠️ Solução pode ser mais específica em termos técnicos")
-        else:
-            feedback_parts.append("❌ Solução precisa ser mais detalhada")
-        
-        # Generate overall feedback
-        if score >= 80:
-            level = "Especialista"
-            general_feedback = "Excelente análise! Você demonstra compreensão profunda sobre vieses em IA."
-        elif score >= 60:
-            level = "Intermediário"
-            general_feedback = "Boa análise! Continue desenvolvendo suas habilidades de identificação de vieses."
-        else:
-            level = "Iniciante"
-            general_feedback = "Continue praticando! A identificação de vieses requer experiência."
-        
-        # Generate recommendations
-        recommendations = self._generate_recommendations(score, bias_types, correct_bias_types)
-        
-        return {
-            "score": score,
-            "accuracy": min(100, score + random.randint(-5, 15)),
-            "level": level,
-            "feedback": general_feedback,
-            "detailed_feedback": feedback_parts,
-            "explanation": self._generate_explanation(scenario),
-            "recommendations": recommendations
-        }
-    
-    def _generate_explanation(self, scenario: Dict) -> str:
-        """Generate detailed explanation for the scenario"""
-        bias_type = scenario.get('bias_type', 'Viés não especificado')
-        explanation = f"""
-        **Análise do Cenário:**
-        
-        Este cenário apresenta um caso de **{bias_type}**. 
-        
-        **Por que isso é um problema?**
-        {self.bias_types.get(bias_type, 'Tipo de viés que pode causar discriminação injusta.')}
-        
-        **Como identificar:**
-        - Analise se há disparidades nos resultados entre diferentes grupos
-        - Verifique se os dados de treinamento são representativos
-        - Considere o contexto histórico e social do problema
-        
-        **Impacto potencial:**
-        Vieses como este podem perpetuar desigualdades, limitar oportunidades e afetar negativamente grupos já marginalizados.
-        """
-        
-        return explanation
-    
-    def _generate_recommendations(self, score: int, identified_types: List[str], correct_types: List[str]) -> List[str]:
-        """Generate personalized recommendations based on performance"""
-        recommendations = []
-        
-        if score < 60:
-            recommendations.extend([
-                "Estude os diferentes tipos de vieses em IA e suas características",
-                "Pratique com mais cenários para desenvolver intuição",
-                "Foque em entender como dados de treinamento afetam os resultados"
-            ])
-        
-        if not any(t in identified_types for t in correct_types):
-            recommendations.append("Revise os tipos de vieses e suas definições")
-        
-        if score >= 60:
-            recommendations.extend([
-                "Explore estudos de caso reais para aprofundar conhecimento",
-                "Considere aprender sobre métricas de equidade em ML",
-                "Participe de discussões sobre IA ética"
-            ])
-        
-        return recommendations
-    
-    def get_bias_info(self) -> Dict[str, str]:
-        """Return information about different types of biases"""
-        return self.bias_types
-    
-    def get_scenario_statistics(self) -> Dict[str, Any]:
-        """Return statistics about available scenarios"""
-        types = [s.get('type', 'Não especificado') for s in self.scenario_templates]
-        
-        return {
-            "total_scenarios": len(self.scenario_templates),
-            "types_available": list(set(types)),
-            "most_common_type": max(set(types), key=types.count) if types else "N/A"
-        }
+import random
+import threading
+import zlib
+from collections import Counter
+from collections.abc import Mapping
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from utils.content_store import get_content_store
+from utils.lru_cache import LRUCache
+
+# Descriptions of the bias types, shared by every simulator
+BIAS_TYPES = {
+    "Viés de Confirmação": "Tendência de buscar informações que confirmem crenças preexistentes",
+    "Viés de Representação": "Dados de treinamento não representam adequadamente a população",
+    "Viés de Seleção": "Distorções na forma como os dados foram coletados",
+    "Viés Cultural": "Preconceitos baseados em normas culturais específicas",
+    "Viés de Gênero": "Discriminação baseada em gênero",
+    "Viés Racial": "Discriminação baseada em raça ou etnia",
+    "Viés Socioeconômico": "Discriminação baseada em classe social"
+}
+
+# Used when bias_scenarios.json is not available
+DEFAULT_SCENARIOS = [
+    {
+        "type": "Seleção de Candidatos",
+        "context": "Sistema de IA para triagem de currículos",
+        "situation": "O sistema aprova mais candidatos homens que mulheres",
+        "bias_type": "Viés de Gênero",
+        "correct_identification": ["Viés de Gênero", "Viés de Representação"]
+    }
+]
+
+# Generic texts for scenario types missing from the dataset
+GENERIC_SCENARIOS = {
+    "Seleção de Candidatos": {
+        "context": "Uma empresa usa IA para analisar currículos",
+        "situation": "O sistema mostra padrões discriminatórios nas aprovações",
+        "bias_type": "Viés de Representação"
+    },
+    "Reconhecimento Facial": {
+        "context": "Sistema de reconhecimento facial em ambiente educacional",
+        "situation": "O sistema tem dificuldade com certas características físicas",
+        "bias_type": "Viés Racial"
+    },
+    "Recomendação de Conteúdo": {
+        "context": "Plataforma educacional recomenda cursos",
+        "situation": "As recomendações seguem padrões estereotípicos",
+        "bias_type": "Viés de Gênero"
+    },
+    "Avaliação Automática": {
+        "context": "Sistema de correção automática de textos",
+        "situation": "Certas expressões culturais recebem notas menores",
+        "bias_type": "Viés Cultural"
+    },
+    "Tradução Automática": {
+        "context": "Sistema de tradução em escola internacional",
+        "situation": "Profissões são traduzidas com estereótipos de gênero",
+        "bias_type": "Viés de Gênero"
+    }
+}
+DEFAULT_GENERIC_SCENARIO = {
+    "context": "Sistema de IA em ambiente educacional",
+    "situation": "O sistema apresenta comportamentos discriminatórios",
+    "bias_type": "Viés de Representação"
+}
+
+def accuracy_offset(scenario: Dict, bias_detected: str, bias_types: List[str], solution: str) -> int:
+    """Deterministic spread in [-5, 15] added to the score to report accuracy
+
+    Derived from a stable hash of the scenario and the answer, so the same
+    response always gets the same accuracy.
+    """
+    key = '\x1f'.join([
+        str(scenario.get('bias_type', '')),
+        str(scenario.get('situation', '')),
+        bias_detected or '',
+        '\x1e'.join(sorted(bias_types or [])),
+        (solution or '').strip()
+    ])
+    return zlib.crc32(key.encode('utf-8')) % 21 - 5
+
+class Scenario(Mapping):
+    """A scenario handed to a session: a shared template plus the session's random id
+
+    Only the id is stored per session; every other field is read from the
+    template, which is never copied.
+    """
+
+    __slots__ = ('template', 'id')
+
+    def __init__(self, template: Dict[str, Any], scenario_id: int):
+        self.template = template
+        self.id = scenario_id
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'id':
+            return self.id
+        return self.template[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.template
+        if 'id' not in self.template:
+            yield 'id'
+
+    def __len__(self) -> int:
+        return len(self.template) + ('id' not in self.template)
+
+    def __repr__(self) -> str:
+        return f"Scenario({dict(self)!r})"
+
+
+class ScenarioLibrary:
+    """Scenario templates, their type index and the feedback caches, shared by every simulator
+
+    Built once per version of bias_scenarios.json (see get_scenario_library),
+    so sessions only keep their own random generator.
+    """
+
+    def __init__(self, scenarios: List[Dict]):
+        self.scenario_templates = scenarios
+        self.scenarios_by_type = {}
+        for scenario in scenarios:
+            self.scenarios_by_type.setdefault(scenario.get('type'), []).append(scenario)
+        
+        type_counts = Counter(s.get('type', 'Não especificado') for s in scenarios)
+        self.scenario_statistics = {
+            "total_scenarios": len(scenarios),
+            "types_available": list(type_counts),
+            "type_counts": dict(type_counts),
+            "most_common_type": type_counts.most_common(1)[0][0] if type_counts else "N/A"
+        }
+        self._generic_templates = {}
+        
+        # Feedback texts depend only on a few grading outcomes, so they are built once and shared
+        self.explanation_cache = LRUCache(maxsize=256)
+        self.recommendation_cache = LRUCache(maxsize=16)
+        self.feedback_cache = LRUCache(maxsize=1024)
+    
+    def generic_template(self, scenario_type: str) -> Dict[str, Any]:
+        """Return the (shared) generic template of a scenario type"""
+        template = self._generic_templates.get(scenario_type)
+        if template is None:
+            texts = GENERIC_SCENARIOS.get(scenario_type, DEFAULT_GENERIC_SCENARIO)
+            template = self._generic_templates.setdefault(scenario_type, {
+                "type": scenario_type,
+                "context": texts["context"],
+                "situation": texts["situation"],
+                "bias_type": texts["bias_type"],
+                "correct_identification": [texts["bias_type"]]
+            })
+        return template
+
+
+def _build_library(scenarios: List[Dict]) -> ScenarioLibrary:
+    library = ScenarioLibrary(scenarios)
+    BiasSimulator(library=library)._precompute_feedback()
+    return library
+
+
+_fallback_library = None
+_fallback_lock = threading.Lock()
+
+
+def get_scenario_library() -> ScenarioLibrary:
+    """Return the process-wide scenario library, rebuilt only when bias_scenarios.json changes"""
+    global _fallback_library
+    library = get_content_store().get_derived('bias_scenarios', 'scenario_library', _build_library)
+    if library is not None:
+        return library
+    with _fallback_lock:
+        if _fallback_library is None:
+            _fallback_library = _build_library(DEFAULT_SCENARIOS)
+        return _fallback_library
+
+
+class BiasSimulator:
+    """Simulator for AI bias scenarios with interactive analysis"""
+    
+    # Grading rules, shared by the scalar and the vectorized scoring paths
+    POSITIVE_DETECTIONS = ("Sim, há viés evidente", "Possivelmente há viés")
+    SOLUTION_KEYWORDS = ('dados', 'treinamento', 'diversidade', 'teste', 'monitorar')
+    MIN_SOLUTION_LENGTH = 20
+    DETECTION_POINTS = 30
+    TYPE_POINTS = 40
+    SOLUTION_POINTS = 30
+    SCORE_LEVELS = [
+        (80, "Especialista", "Excelente análise! Você demonstra compreensão profunda sobre vieses em IA."),
+        (60, "Intermediário", "Boa análise! Continue desenvolvendo suas habilidades de identificação de vieses."),
+        (0, "Iniciante", "Continue praticando! A identificação de vieses requer experiência.")
+    ]
+    
+    def __init__(self, seed: Optional[Any] = None, library: Optional[ScenarioLibrary] = None):
+        # Each simulator owns its RNG so sessions and assessments are reproducible;
+        # scenarios and feedback caches live in the shared library
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self._library = library
+    
+    @property
+    def library(self) -> ScenarioLibrary:
+        """The pinned library, or the shared one for the current dataset"""
+        return self._library or get_scenario_library()
+    
+    @property
+    def scenario_templates(self) -> List[Dict]:
+        return self.library.scenario_templates
+    
+    @property
+    def bias_types(self) -> Dict[str, str]:
+        return BIAS_TYPES
+    
+    def generate_scenario(self, scenario_type: str) -> Scenario:
+        """Generate a random scenario of the specified type"""
+        # Look up scenarios of this type in the prebuilt index
+        matching_scenarios = self.library.scenarios_by_type.get(scenario_type)
+        
+        if not matching_scenarios:
+            # Return a generic scenario if no match found
+            return self._create_generic_scenario(scenario_type)
+        
+        # Select a random scenario; the session keeps a handle on the shared template plus a random id
+        base_scenario = self.rng.choice(matching_scenarios)
+        return Scenario(base_scenario, self.rng.randint(1000, 9999))
+    
+    def _create_generic_scenario(self, scenario_type: str) -> Scenario:
+        """Create a generic scenario when specific type is not available"""
+        return Scenario(self.library.generic_template(scenario_type), self.rng.randint(1000, 9999))
+    
+    def evaluate_response(self, scenario: Dict, bias_detected: str, bias_types: List[str], solution: str) -> Dict[str, Any]:
+        """Evaluate user's response to a scenario (a pure function of its arguments)"""
+        correct_bias_types = scenario.get('correct_identification', [scenario.get('bias_type', '')])
+        
+        # Check bias detection accuracy
+        detected = bias_detected in self.POSITIVE_DETECTIONS
+        
+        # Check bias type identification (None means no type was given)
+        matching_types = None
+        if bias_types:
+            identified = set(bias_types)
+            matching_types = tuple(t for t in correct_bias_types if t in identified)
+        
+        # Evaluate solution quality
+        solution_ok = bool(solution) and len(solution.strip()) > self.MIN_SOLUTION_LENGTH
+        keyword_hit = False
+        if solution_ok:
+            solution_lower = solution.lower()
+            keyword_hit = any(keyword in solution_lower for keyword in self.SOLUTION_KEYWORDS)
+        
+        score = (self.DETECTION_POINTS * detected
+                 + self.TYPE_POINTS * bool(matching_types)
+                 + self.SOLUTION_POINTS * solution_ok)
+        
+        # Generate overall feedback
+        level, general_feedback = self.get_level(score)
+        
+        return {
+            "score": score,
+            "accuracy": min(100, score + accuracy_offset(scenario, bias_detected, bias_types, solution)),
+            "level": level,
+            "feedback": general_feedback,
+            # Cached as shared tuples; each result gets its own lists
+            "detailed_feedback": list(self._get_detailed_feedback(detected, matching_types, solution_ok, keyword_hit)),
+            "explanation": self._generate_explanation(scenario),
+            "recommendations": list(self._generate_recommendations(score, bias_types, correct_bias_types))
+        }
+    
+    def get_level(self, score: int) -> Tuple[str, str]:
+        """Return the (level, general feedback) pair for a score"""
+        for threshold, level, feedback in self.SCORE_LEVELS:
+            if score >= threshold:
+                return level, feedback
+        return self.SCORE_LEVELS[-1][1:]
+    
+    def _precompute_feedback(self) -> None:
+        """Fill the caches with every explanation, recommendation and feedback combination"""
+        bias_types = set(self.bias_types) | {'Viés não especificado'}
+        correct_lists = set()
+        for scenario in self.scenario_templates:
+            bias_types.add(scenario.get('bias_type', 'Viés não especificado'))
+            correct_lists.add(tuple(scenario.get('correct_identification', [scenario.get('bias_type', '')])))
+        
+        for bias_type in bias_types:
+            self._generate_explanation({'bias_type': bias_type})
+        
+        for below_threshold in (True, False):
+            for overlap in (True, False):
+                self.library.recommendation_cache.put((below_threshold, overlap), self._build_recommendations(below_threshold, overlap))
+        
+        # Matching types are always an ordered subset of a scenario's correct list
+        matches = {None, ()}
+        for correct in correct_lists:
+            for mask in range(1, 2 ** min(len(correct), 7)):
+                matches.add(tuple(t for i, t in enumerate(correct) if mask >> i & 1))
+        for detected in (True, False):
+            for matching_types in matches:
+                for solution_ok, keyword_hit in ((False, False), (True, False), (True, True)):
+                    self._get_detailed_feedback(detected, matching_types, solution_ok, keyword_hit)
+        
+        # Warm-up lookups should not count in the statistics
+        library = self.library
+        for cache in (library.explanation_cache, library.recommendation_cache, library.feedback_cache):
+            cache.hits = cache.misses = 0
+    
+    def _get_detailed_feedback(self, detected: bool, matching_types: Optional[Tuple[str, ...]],
+                               solution_ok: bool, keyword_hit: bool) -> Tuple[str, ...]:
+        """Return the (cached) feedback lines for a combination of grading outcomes"""
+        key = (detected, matching_types, solution_ok, keyword_hit)
+        return self.library.feedback_cache.get_or_compute(key, lambda: self._build_detailed_feedback(*key))
+    
+    def _build_detailed_feedback(self, detected: bool, matching_types: Optional[Tuple[str, ...]],
+                                 solution_ok: bool, keyword_hit: bool) -> Tuple[str, ...]:
+        """Build the feedback lines for a combination of grading outcomes"""
+        feedback_parts = []
+        
+        if detected:
+            feedback_parts.append("✅ Identificou corretamente a presença de viés")
+        else:
+            feedback_parts.append("❌ Não identificou a presença de viés no cenário")
+        
+        if matching_types is not None:
+            if matching_types:
+                feedback_parts.append(f"✅ Identificou corretamente: {', '.join(matching_types)}")
+            else:
+                feedback_parts.append("⚠️ Tipos de viés identificados não correspondem ao cenário")
+        
+        if solution_ok:
+            if keyword_hit:
+                feedback_parts.append("✅ Proposta de solução inclui elementos técnicos relevantes")
+            else:
+                feedback_parts.append("⚠️ Solução pode ser mais específica em termos técnicos")
+        else:
+            feedback_parts.append("❌ Solução precisa ser mais detalhada")
+        
+        return tuple(feedback_parts)
+    
+    def _generate_explanation(self, scenario: Dict) -> str:
+        """Generate detailed explanation for the scenario"""
+        bias_type = scenario.get('bias_type', 'Viés não especificado')
+        return self.library.explanation_cache.get_or_compute(bias_type, lambda: self._build_explanation(bias_type))
+    
+    def _build_explanation(self, bias_type: str) -> str:
+        """Build the explanation text for a bias type"""
+        explanation = f"""
+        **Análise do Cenário:**
+        
+        Este cenário apresenta um caso de **{bias_type}**. 
+        
+        **Por que isso é um problema?**
+        {self.bias_types.get(bias_type, 'Tipo de viés que pode causar discriminação injusta.')}
+        
+        **Como identificar:**
+        - Analise se há disparidades nos resultados entre diferentes grupos
+        - Verifique se os dados de treinamento são representativos
+        - Considere o contexto histórico e social do problema
+        
+        **Impacto potencial:**
+        Vieses como este podem perpetuar desigualdades, limitar oportunidades e afetar negativamente grupos já marginalizados.
+        """
+        
+        return explanation
+    
+    def _generate_recommendations(self, score: int, identified_types: List[str], correct_types: List[str]) -> Tuple[str, ...]:
+        """Generate personalized recommendations based on performance"""
+        identified_types = identified_types or []
+        key = (score < 60, any(t in identified_types for t in correct_types))
+        return self.library.recommendation_cache.get_or_compute(key, lambda: self._build_recommendations(*key))
+    
+    def _build_recommendations(self, below_threshold: bool, overlap: bool) -> Tuple[str, ...]:
+        """Build the recommendations for a score band and type overlap"""
+        recommendations = []
+        
+        if below_threshold:
+            recommendations.extend([
+                "Estude os diferentes tipos de vieses em IA e suas características",
+                "Pratique com mais cenários para desenvolver intuição",
+                "Foque em entender como dados de treinamento afetam os resultados"
+            ])
+        
+        if not overlap:
+            recommendations.append("Revise os tipos de vieses e suas definições")
+        
+        if not below_threshold:
+            recommendations.extend([
+                "Explore estudos de caso reais para aprofundar conhecimento",
+                "Considere aprender sobre métricas de equidade em ML",
+                "Participe de discussões sobre IA ética"
+            ])
+        
+        return tuple(recommendations)
+    
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return size and hit/miss counters of the feedback caches"""
+        return {
+            'explanations': self.library.explanation_cache.get_stats(),
+            'recommendations': self.library.recommendation_cache.get_stats(),
+            'detailed_feedback': self.library.feedback_cache.get_stats()
+        }
+    
+    def get_bias_info(self) -> Dict[str, str]:
+        """Return information about different types of biases"""
+        return self.bias_types
+    
+    def get_scenario_statistics(self) -> Dict[str, Any]:
+        """Return statistics about available scenarios (precomputed at load time)"""
+        stats = dict(self.library.scenario_statistics)
+        stats["types_available"] = list(stats["types_available"])
+        stats["type_counts"] = dict(stats["type_counts"])
+        return stats
@@ -0,0 +1,39 @@
+from typing import Dict, List, Any, Optional
+
+from utils.content_store import get_content_store
+from utils.facet_index import FacetIndex
+
+
+class CaseIndex(FacetIndex):
+    """Inverted indexes over the real cases dataset for fast filtering and facet counts"""
+
+    FACETS = ('category', 'severity', 'bias_type', 'year_bucket')
+
+    def __init__(self, cases: List[Dict], year_bucket_size: int = 5):
+        self.cases = cases
+        self.year_bucket_size = year_bucket_size
+        super().__init__(cases)
+
+    def year_bucket(self, year: int) -> str:
+        """Return the label of the year range a year belongs to"""
+        start = year - year % self.year_bucket_size
+        return f"{start}–{start + self.year_bucket_size - 1}"
+
+    def _facet_value(self, case: Dict, facet: str) -> Optional[str]:
+        """Extract the indexed value of a facet from a case"""
+        if facet == 'year_bucket':
+            year = case.get('year')
+            return self.year_bucket(year) if isinstance(year, int) else None
+        return case.get(facet)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return precomputed totals and facet counts"""
+        return {
+            'total_cases': len(self.cases),
+            'facet_counts': self.facet_counts
+        }
+
+
+def get_case_index() -> CaseIndex:
+    """Return the shared case index, rebuilt only when real_cases.json changes"""
+    return get_content_store().get_derived('real_cases', 'case_index', CaseIndex, [])
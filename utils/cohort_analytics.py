@@ -0,0 +1,273 @@
+from array import array
+from datetime import date, datetime
+from typing import Dict, Any, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.activity_log import ACTIVITY_TYPES, ActivityLog, NO_SCORE, _day
+from utils.achievements import get_achievement_engine
+from utils.progress_export import read_export
+from utils.progress_tracker import ACTIVITY_COUNTERS, DEFAULT_LEVEL, USER_LEVELS, ProgressTracker
+
+USER_COUNTERS = ACTIVITY_COUNTERS + ['total_score', 'sessions']
+GROUP_COLUMNS = {'group': 'group', 'class': 'group', 'date': 'date', 'type': 'type'}
+
+
+def user_levels(total_activities: np.ndarray, avg_scores: np.ndarray) -> np.ndarray:
+    """Vectorized ProgressTracker user level over arrays of learners"""
+    conditions = [(total_activities >= min_activities) & (avg_scores >= min_score)
+                  for min_activities, min_score, _ in USER_LEVELS]
+    return np.select(conditions, [level for _, _, level in USER_LEVELS], default=DEFAULT_LEVEL)
+
+
+def average_scores(total_score: np.ndarray, simulations_completed: np.ndarray) -> np.ndarray:
+    """Vectorized average simulation score, 0 for learners without simulations"""
+    return np.divide(total_score, simulations_completed, out=np.zeros(len(total_score)),
+                     where=simulations_completed > 0)
+
+
+def _to_numpy(values: array) -> np.ndarray:
+    """Copy a typed array into a numpy array of the same item type"""
+    if not len(values):
+        return np.zeros(0, dtype=values.typecode)
+    return np.frombuffer(values, dtype=values.typecode).copy()
+
+
+class CohortAnalytics:
+    """Columnar aggregates over many learners' progress, for class and school dashboards
+
+    Each learner contributes one row of counters and a set of activity rows
+    (one per retained event, plus one per day and type for rolled-up history).
+    Rows are appended to typed arrays during ingestion and exposed as numpy
+    arrays, so group-by queries over 100k+ learners run in a few vectorized
+    passes. Ingesting the same user id again replaces that learner's data.
+    """
+
+    def __init__(self):
+        self.user_ids = []
+        self.user_positions = {}
+        self.group_names = []
+        self._group_codes = {}
+        self.achievement_ids = list(get_achievement_engine().rules)
+        self._achievement_bits = {a: i for i, a in enumerate(self.achievement_ids)}
+
+        # Per-learner columns
+        self._users = {
+            'group': array('i'),
+            'active': array('b'),
+            'days_active': array('i'),
+            'achievements': array('Q'),
+            'last_activity': array('q'),
+            **{counter: array('q') for counter in USER_COUNTERS}
+        }
+        # Activity rows: learner, type code, local day (ordinal) and sums
+        self._rows = {
+            'user': array('i'),
+            'type': array('B'),
+            'day': array('i'),
+            'events': array('i'),
+            'value': array('q'),
+            'score_sum': array('q'),
+            'scored': array('i')
+        }
+        self._columns = None
+
+    def __len__(self) -> int:
+        return len(self.user_positions)
+
+    def _group_code(self, group: Optional[str]) -> int:
+        """Return the code of a group (class) name"""
+        group = '' if group is None else str(group)
+        code = self._group_codes.get(group)
+        if code is None:
+            code = self._group_codes[group] = len(self.group_names)
+            self.group_names.append(group)
+        return code
+
+    def add_user(self, user_id: str, progress: Dict[str, Any], history: Optional[ActivityLog] = None,
+                 group: Optional[str] = None) -> None:
+        """Ingest one learner's progress counters and activity log
+
+        The learner row is built (and validated) in full before any column
+        is touched, so a bad record raises ValueError and leaves the
+        cohort unchanged.
+        """
+        last_activity = progress.get('last_activity')
+        try:
+            row = {counter: int(progress.get(counter, 0) or 0) for counter in USER_COUNTERS}
+            row['last_activity'] = int(datetime.fromisoformat(last_activity).timestamp()) if last_activity else 0
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"Invalid progress for user {user_id!r}: {error}") from None
+        mask = 0
+        for achievement_id in progress.get('achievements', []):
+            bit = self._achievement_bits.get(achievement_id) if isinstance(achievement_id, str) else None
+            if bit is not None:
+                mask |= 1 << bit
+        row['achievements'] = mask
+        row['days_active'] = history.days_active() if history is not None else 0
+        row['group'] = self._group_code(group)
+        row['active'] = 1
+
+        previous = self.user_positions.get(user_id)
+        if previous is not None:
+            self._users['active'][previous] = 0
+
+        position = len(self.user_ids)
+        self.user_ids.append(user_id)
+        self.user_positions[user_id] = position
+        for name, values in self._users.items():
+            values.append(row[name])
+
+        if history is not None:
+            for day, by_type in history.daily.items():
+                for code, (events, value_sum, score_sum, scored) in by_type.items():
+                    self._append_row(position, code, day, events, value_sum, score_sum, scored)
+            for code, timestamp, value, score in zip(history.types, history.timestamps,
+                                                     history.values, history.scores):
+                scored = score != NO_SCORE
+                self._append_row(position, code, _day(timestamp), 1, value, score if scored else 0, int(scored))
+
+        self._columns = None
+
+    def _append_row(self, user: int, code: int, day: int, events: int, value: int, score_sum: int,
+                    scored: int) -> None:
+        rows = self._rows
+        rows['user'].append(user)
+        rows['type'].append(code)
+        rows['day'].append(day)
+        rows['events'].append(events)
+        rows['value'].append(value)
+        rows['score_sum'].append(score_sum)
+        rows['scored'].append(scored)
+
+    def add_tracker(self, user_id: str, tracker: ProgressTracker, group: Optional[str] = None) -> None:
+        """Ingest a live ProgressTracker"""
+        self.add_user(user_id, tracker.progress_data, tracker.history, group)
+
+    def add_export(self, user_id: str, source, group: Optional[str] = None, max_events: int = 1000) -> Dict[str, int]:
+        """Ingest a progress export (NDJSON, optionally gzipped); returns the import stats"""
+        imported = read_export(source, max_events)
+        self.add_user(user_id, imported['progress'], imported['history'], group)
+        return imported['stats']
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Return the learner and activity columns as numpy arrays, cached until the next ingest"""
+        if self._columns is None:
+            # Copies, so the typed arrays can keep growing while results are in use
+            columns = {f'user_{name}': _to_numpy(values) for name, values in self._users.items()}
+            columns.update({name: _to_numpy(values) for name, values in self._rows.items()})
+            self._columns = columns
+        return self._columns
+
+    def users(self) -> pd.DataFrame:
+        """One row per learner with the ProgressTracker summary statistics"""
+        c = self.columns()
+        active = c['user_active'].astype(bool)
+        total_activities = sum(c[f'user_{counter}'] for counter in ACTIVITY_COUNTERS)
+        avg = average_scores(c['user_total_score'], c['user_simulations_completed'])
+        masks = c['user_achievements']
+        achievements = np.zeros(len(masks), dtype=np.int64)
+        for bit in range(len(self.achievement_ids)):
+            achievements += ((masks >> np.uint64(bit)) & np.uint64(1)).astype(np.int64)
+
+        frame = pd.DataFrame({
+            'user_id': self.user_ids,
+            'group': pd.Categorical.from_codes(c['user_group'], categories=self.group_names)
+            if self.group_names else pd.Categorical([]),
+            **{counter: c[f'user_{counter}'] for counter in USER_COUNTERS},
+            'total_activities': total_activities,
+            'average_score': np.round(avg, 1),
+            'achievements_earned': achievements,
+            'user_level': user_levels(total_activities, avg),
+            'days_active': c['user_days_active']
+        })
+        return frame[active].set_index('user_id')
+
+    def summary(self, by: str = 'group') -> pd.DataFrame:
+        """Per-group learners, average score, days active, achievements and level distribution"""
+        # users() has one row per learner, so only the learner's group can be a key
+        if GROUP_COLUMNS.get(by) != 'group':
+            raise ValueError(f"Unsupported summary key: {by!r}")
+        users = self.users()
+        key = GROUP_COLUMNS[by]
+        grouped = users.groupby(key, observed=True)
+        summary = pd.DataFrame({
+            'learners': grouped.size(),
+            'total_activities': grouped['total_activities'].sum(),
+            'simulations_completed': grouped['simulations_completed'].sum(),
+            'average_score': grouped['total_score'].sum() / grouped['simulations_completed'].sum().replace(0, np.nan),
+            'mean_days_active': grouped['days_active'].mean(),
+            'achievements_per_learner': grouped['achievements_earned'].mean()
+        })
+        summary['average_score'] = summary['average_score'].fillna(0).round(1)
+        levels = pd.crosstab(users[key], users['user_level'])
+        level_names = [level for _, _, level in USER_LEVELS] + [DEFAULT_LEVEL]
+        levels = levels.reindex(columns=level_names, fill_value=0)
+        return summary.join(levels).fillna(0)
+
+    def achievement_distribution(self, by: str = 'group') -> pd.DataFrame:
+        """Number of learners per group that earned each achievement"""
+        c = self.columns()
+        active = c['user_active'].astype(bool)
+        masks = c['user_achievements'][active]
+        groups = c['user_group'][active]
+        distribution = {}
+        for bit, achievement_id in enumerate(self.achievement_ids):
+            earned = ((masks >> np.uint64(bit)) & np.uint64(1)).astype(np.int64)
+            distribution[achievement_id] = np.bincount(groups, weights=earned, minlength=len(self.group_names))
+        frame = pd.DataFrame(distribution, index=pd.Index(self.group_names, name='group')).astype(np.int64)
+        if by in ('group', 'class'):
+            return frame.iloc[np.unique(groups)]
+        # Whole cohort
+        return frame.sum().to_frame('all').T
+
+    def activity(self, by: Union[str, Sequence[str]] = ('group', 'date', 'type'),
+                 start: Optional[date] = None, end: Optional[date] = None,
+                 types: Optional[Sequence[str]] = None,
+                 groups: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Activity counts, value sums and average scores grouped by class, date and/or type
+
+        `start`/`end` are inclusive dates; `types` and `groups` restrict the rows.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        unknown = [name for name in by if name not in GROUP_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unsupported activity keys: {unknown}")
+        c = self.columns()
+        user = c['user']
+        mask = c['user_active'].astype(bool)[user] if len(user) else np.zeros(0, dtype=bool)
+        if start is not None:
+            mask &= c['day'] >= start.toordinal()
+        if end is not None:
+            mask &= c['day'] <= end.toordinal()
+        if types is not None:
+            codes = [ACTIVITY_TYPES.index(t) for t in types if t in ACTIVITY_TYPES]
+            mask &= np.isin(c['type'], codes)
+        user_groups = c['user_group'][user]
+        if groups is not None:
+            codes = [self._group_codes[g] for g in groups if g in self._group_codes]
+            mask &= np.isin(user_groups, codes)
+
+        keys = {
+            'group': user_groups[mask],
+            'date': c['day'][mask],
+            'type': c['type'][mask]
+        }
+        frame = pd.DataFrame({GROUP_COLUMNS[name]: keys[GROUP_COLUMNS[name]] for name in by})
+        for name in ('events', 'value', 'score_sum', 'scored'):
+            frame[name] = c[name][mask]
+        result = frame.groupby([GROUP_COLUMNS[name] for name in by], sort=True).sum()
+        result['average_score'] = (result['score_sum'] / result['scored'].replace(0, np.nan)).round(1)
+        result = result.drop(columns=['score_sum', 'scored'])
+
+        # Decode the integer keys only on the (small) aggregated result
+        index = result.index.to_frame(index=False)
+        if 'group' in index:
+            index['group'] = [self.group_names[g] for g in index['group']]
+        if 'date' in index:
+            index['date'] = [date.fromordinal(int(d)) for d in index['date']]
+        if 'type' in index:
+            index['type'] = [ACTIVITY_TYPES[t] for t in index['type']]
+        result.index = pd.MultiIndex.from_frame(index) if len(by) > 1 else pd.Index(index.iloc[:, 0])
+        return result
@@ -0,0 +1,139 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Callable
+
+from utils.memory_usage import deep_sizeof
+
+
+class ContentStore:
+    """Process-wide store for the data/*.json datasets, shared read-only by all sessions
+
+    Each dataset is parsed once and kept in memory. The file's mtime is checked
+    at most every `check_interval` seconds and the dataset is reloaded only when
+    it changes. Callers must treat the returned objects as read-only.
+    """
+
+    def __init__(self, data_dir: str = 'data', check_interval: float = 1.0):
+        self.data_dir = data_dir
+        self.check_interval = check_interval
+        self._entries = {}
+        self._lock = threading.RLock()
+
+    def _path(self, name: str) -> str:
+        """Return the JSON file path for a dataset name"""
+        return os.path.join(self.data_dir, f'{name}.json')
+
+    def get(self, name: str, default: Any = None, recheck: bool = False) -> Any:
+        """Return the parsed dataset, loading or reloading it when needed
+
+        `recheck=True` checks the file's mtime even if it was checked less
+        than `check_interval` seconds ago.
+        """
+        entry = self._entries.get(name)
+        now = time.monotonic()
+
+        # Fast path: recently validated entry, no filesystem access
+        if not recheck and entry is not None and now - entry['checked_at'] < self.check_interval:
+            return default if entry['missing'] else entry['data']
+
+        with self._lock:
+            entry = self._entries.get(name)
+            path = self._path(name)
+
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                # Remembered like a loaded file, so objects derived from the default are cached too
+                if entry is None or not entry['missing']:
+                    entry = self._entries[name] = {
+                        'data': None,
+                        'mtime': None,
+                        'missing': True,
+                        'loads': entry['loads'] if entry else 0,
+                        'derived': {}
+                    }
+                entry['checked_at'] = now
+                return default
+
+            if entry is not None and entry['mtime'] == mtime:
+                entry['checked_at'] = now
+                return entry['data']
+
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            self._entries[name] = {
+                'data': data,
+                'mtime': mtime,
+                'missing': False,
+                'checked_at': now,
+                'loads': (entry['loads'] if entry else 0) + 1,
+                'file_bytes': os.path.getsize(path),
+                'memory_bytes': deep_sizeof(data),
+                'loaded_at': time.time(),
+                'derived': {}
+            }
+            return data
+
+    def get_derived(self, name: str, key: str, builder: Callable[[Any], Any], default: Any = None) -> Any:
+        """Return an object built from a dataset (index, cache...), rebuilt only when the dataset reloads"""
+        data = self.get(name)
+        entry = self._entries.get(name)
+        if data is None:
+            if default is None:
+                return None
+            # A missing file caches what was built from the default until the file appears
+            if entry is None or not entry['missing']:
+                return builder(default)
+            source = default
+        elif entry is None or entry['data'] is not data:
+            return builder(data)
+        else:
+            source = data
+
+        derived = entry['derived']
+        if key not in derived:
+            with self._lock:
+                if key not in derived:
+                    derived[key] = builder(source)
+        return derived[key]
+
+    def clear(self) -> None:
+        """Drop every cached dataset (mainly useful for tests and benchmarks)"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return load counts and memory footprint for each cached dataset"""
+        datasets = {
+            name: {
+                'loads': entry['loads'],
+                'file_bytes': entry['file_bytes'],
+                'memory_bytes': entry['memory_bytes'],
+                'loaded_at': entry['loaded_at']
+            }
+            for name, entry in self._entries.items()
+            if not entry['missing']
+        }
+
+        return {
+            'datasets': datasets,
+            'total_loads': sum(d['loads'] for d in datasets.values()),
+            'total_memory_bytes': sum(d['memory_bytes'] for d in datasets.values())
+        }
+
+
+# IA_EDUCA_DATA_DIR points the app at another dataset directory (benchmarks, staging)
+_default_store = ContentStore(os.environ.get('IA_EDUCA_DATA_DIR', 'data'))
+
+
+def get_content_store() -> ContentStore:
+    """Return the store shared by every session in this process"""
+    return _default_store
+
+
+def load_dataset(name: str, default: Any = None) -> Any:
+    """Shortcut for loading a dataset from the shared store"""
+    return _default_store.get(name, default)
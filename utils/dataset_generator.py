@@ -0,0 +1,198 @@
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Any, Callable, Iterator, Optional
+
+SCENARIO_TYPES = ["Seleção de Candidatos", "Reconhecimento Facial", "Recomendação de Conteúdo",
+                  "Avaliação Automática", "Tradução Automática"]
+BIAS_TYPES = ["Viés de Confirmação", "Viés de Representação", "Viés de Seleção", "Viés Cultural",
+              "Viés de Gênero", "Viés Racial", "Viés Socioeconômico"]
+SEVERITIES = ["Baixa", "Média", "Alta"]
+CASE_CATEGORIES = ["Plataformas Educacionais", "Segurança Escolar", "Avaliação Educacional",
+                   "Orientação Educacional", "Ferramentas de Ensino", "Gestão Escolar",
+                   "Acessibilidade", "Ensino Superior"]
+TARGET_GRADES = ["Ensino Fundamental I", "Ensino Fundamental II", "Ensino Médio", "Ensino Superior"]
+SUGGESTED_DURATIONS = [45, 60, 90, 120, 180]
+ACTIVITY_DURATIONS = [5, 10, 15, 20, 25, 30, 40]
+
+# Vocabulary used to synthesize realistic-looking Portuguese text
+NOUNS = """sistema algoritmo escola aluno professor dados modelo plataforma avaliação
+recomendação turma comunidade resultado decisão critério grupo estudante conteúdo
+treinamento diversidade equidade tecnologia ferramenta padrão perfil histórico
+desempenho acesso oportunidade política auditoria métrica transparência ética
+currículo redação curso vaga rede região família gênero raça classe idioma""".split()
+VERBS = """analisa identifica reproduz amplifica favorece prejudica classifica recomenda
+avalia seleciona ignora reforça limita monitora corrige revela mede distorce
+interpreta aprende""".split()
+ADJECTIVES = """automático histórico desigual representativo injusto educacional diverso
+sistemático público privado digital social cultural regional tecnológico
+periférico equitativo transparente""".split()
+CONNECTORS = ["que", "com", "para", "entre", "sobre", "durante", "após", "sem", "pelo", "no", "em", "de"]
+MATERIALS = ["Computador/tablet com acesso à internet", "Projetor ou tela para apresentações",
+             "Fichas com cenários de IA", "Quadro ou flipchart", "Marcadores coloridos",
+             "Cartolinas", "Planilhas impressas", "Notícias recortadas", "Post-its"]
+SKILLS = ["Pensamento crítico", "Análise de dados", "Discussão e argumentação", "Consciência digital",
+          "Ética tecnológica", "Trabalho em equipe", "Resolução de problemas", "Comunicação"]
+ACTIVITY_KINDS = ["Aquecimento", "Exploração", "Investigação", "Debate", "Aplicação", "Oficina",
+                  "Estudo de Caso", "Reflexão e Síntese"]
+
+
+class TextSynthesizer:
+    """Generate pseudo-Portuguese sentences with a target word-count distribution"""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def words(self, mean: float, stdev: float, minimum: int = 2) -> str:
+        """Return a sentence whose length follows a normal distribution"""
+        count = max(minimum, int(round(self.rng.gauss(mean, stdev))))
+        rng = self.rng
+        words = []
+        while len(words) < count:
+            words.extend([rng.choice(NOUNS), rng.choice(VERBS), rng.choice(ADJECTIVES), rng.choice(CONNECTORS)])
+        sentence = ' '.join(words[:count])
+        return sentence[0].upper() + sentence[1:] + '.'
+
+    def title(self, mean: float = 8, stdev: float = 1.5) -> str:
+        """Return a title-like phrase without final punctuation"""
+        return self.words(mean, stdev, minimum=3).rstrip('.')
+
+    def items(self, low: int, high: int, mean: float, stdev: float) -> List[str]:
+        """Return a list of sentences"""
+        return [self.words(mean, stdev) for _ in range(self.rng.randint(low, high))]
+
+
+def generate_scenario(rng: random.Random, text: TextSynthesizer, scenario_id: int) -> Dict[str, Any]:
+    """Return one bias_scenarios.json record"""
+    bias_type = rng.choice(BIAS_TYPES)
+    correct = [bias_type] + rng.sample([t for t in BIAS_TYPES if t != bias_type], rng.randint(0, 2))
+    return {
+        "id": scenario_id,
+        "type": rng.choice(SCENARIO_TYPES),
+        "context": text.words(18, 2),
+        "situation": text.words(41, 5),
+        "bias_type": bias_type,
+        "bias_explanation": text.words(21, 2),
+        "correct_identification": correct,
+        "severity": rng.choice(SEVERITIES),
+        "solutions": text.items(3, 5, 9, 2)
+    }
+
+
+def generate_case(rng: random.Random, text: TextSynthesizer, case_id: int) -> Dict[str, Any]:
+    """Return one real_cases.json record"""
+    case = {
+        "id": case_id,
+        "title": text.title(8, 1.2),
+        "category": rng.choice(CASE_CATEGORIES),
+        "year": rng.randint(2012, 2025),
+        "description": text.words(44, 4),
+        "bias_type": rng.choice(BIAS_TYPES),
+        "bias_explanation": text.words(23, 4),
+        "impact": text.words(22, 2),
+        "severity": rng.choice(SEVERITIES),
+        "lessons": text.items(3, 5, 12, 3),
+        "discussion_questions": [q.rstrip('.') + '?' for q in text.items(2, 4, 12, 2)]
+    }
+    # Most, but not all, cases document a solution
+    if rng.random() < 0.85:
+        case["solution"] = text.words(26, 3)
+    return case
+
+
+def generate_lesson_plan(rng: random.Random, text: TextSynthesizer, plan_id: int) -> Dict[str, Any]:
+    """Return one lesson_plans.json record"""
+    activities = []
+    for _ in range(rng.randint(3, 7)):
+        activities.append({
+            "name": f"{rng.choice(ACTIVITY_KINDS)}: {text.title(4, 1)}",
+            "duration": f"{rng.choice(ACTIVITY_DURATIONS)} min",
+            "description": text.words(22, 5)
+        })
+    return {
+        "id": plan_id,
+        "title": text.title(7, 1.2),
+        "objective": text.words(18, 2),
+        "description": text.words(22, 3),
+        "target_grade": rng.choice(TARGET_GRADES),
+        "suggested_duration": rng.choice(SUGGESTED_DURATIONS),
+        "materials": rng.sample(MATERIALS, rng.randint(3, 6)),
+        "skills": rng.sample(SKILLS, rng.randint(3, 6)),
+        "activities": activities,
+        "assessment": text.words(17, 2),
+        "extensions": text.items(2, 4, 10, 2)
+    }
+
+
+GENERATORS = {
+    'bias_scenarios': generate_scenario,
+    'real_cases': generate_case,
+    'lesson_plans': generate_lesson_plan
+}
+
+
+def iter_records(name: str, size: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield `size` records of a dataset; the same (name, seed) always yields the same records"""
+    generator = GENERATORS[name]
+    rng = random.Random(f"{seed}:{name}")
+    text = TextSynthesizer(rng)
+    for record_id in range(1, size + 1):
+        yield generator(rng, text, record_id)
+
+
+def write_dataset(name: str, size: int, output_dir: str, seed: int = 0) -> str:
+    """Stream a dataset to <output_dir>/<name>.json without holding it in memory"""
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f'{name}.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[\n')
+        for i, record in enumerate(iter_records(name, size, seed)):
+            if i:
+                f.write(',\n')
+            f.write(json.dumps(record, ensure_ascii=False))
+        f.write('\n]\n')
+    return path
+
+
+def generate_datasets(output_dir: str, size: int, seed: int = 0,
+                      sizes: Optional[Dict[str, int]] = None,
+                      progress: Optional[Callable[[str, str, float], None]] = None) -> Dict[str, str]:
+    """Write all three datasets; `sizes` overrides the size per dataset"""
+    paths = {}
+    for name in GENERATORS:
+        start = time.perf_counter()
+        paths[name] = write_dataset(name, (sizes or {}).get(name, size), output_dir, seed)
+        if progress:
+            progress(name, paths[name], time.perf_counter() - start)
+    return paths
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate schema-valid synthetic datasets for scale testing")
+    parser.add_argument('output_dir', help="Directory that receives the three JSON files")
+    parser.add_argument('--size', type=int, default=1000, help="Records per dataset (default: 1000)")
+    parser.add_argument('--scenarios', type=int, help="Override the number of scenarios")
+    parser.add_argument('--cases', type=int, help="Override the number of real cases")
+    parser.add_argument('--plans', type=int, help="Override the number of lesson plans")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sizes = {
+        name: value for name, value in (
+            ('bias_scenarios', args.scenarios), ('real_cases', args.cases), ('lesson_plans', args.plans)
+        ) if value is not None
+    }
+
+    def report(name, path, seconds):
+        print(f"{path}: {os.path.getsize(path) / 1024:.1f} KB in {seconds:.2f} s", file=sys.stderr)
+
+    generate_datasets(args.output_dir, args.size, args.seed, sizes, report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Sequence
+
+
+class FacetIndex:
+    """Inverted indexes (one frozenset posting per facet value) over a list of records
+
+    Internal ids are positions in the list, so sorted ids keep file order.
+    Subclasses set FACETS and may override `_facet_value` to index derived
+    values (e.g. year ranges).
+    """
+
+    FACETS: Sequence[str] = ()
+
+    def __init__(self, records: List[Dict], facets: Optional[Sequence[str]] = None):
+        self.records = records
+        self.facets = tuple(facets or self.FACETS)
+        self.all_ids = frozenset(range(len(records)))
+
+        postings = {facet: defaultdict(set) for facet in self.facets}
+        for position, record in enumerate(records):
+            for facet in self.facets:
+                value = self._facet_value(record, facet)
+                if value is not None:
+                    postings[facet][value].add(position)
+
+        self.postings = {
+            facet: {value: frozenset(ids) for value, ids in values.items()}
+            for facet, values in postings.items()
+        }
+        self.facet_counts = {
+            facet: {value: len(ids) for value, ids in sorted(values.items())}
+            for facet, values in self.postings.items()
+        }
+
+    def _facet_value(self, record: Dict, facet: str) -> Optional[Any]:
+        """Extract the indexed value of a facet from a record"""
+        return record.get(facet)
+
+    def values(self, facet: str) -> List[Any]:
+        """Return the sorted distinct values of a facet"""
+        return list(self.facet_counts.get(facet, {}))
+
+    def filter_ids(self, **criteria: Optional[Any]) -> List[int]:
+        """Return the ids matching every criterion (None values are ignored)"""
+        selected = []
+        for facet, value in criteria.items():
+            if value is None:
+                continue
+            if facet not in self.postings:
+                raise ValueError(f"Unknown facet: {facet}")
+            selected.append(self.postings[facet].get(value, frozenset()))
+
+        if not selected:
+            return sorted(self.all_ids)
+
+        # Intersect starting from the smallest posting set
+        selected.sort(key=len)
+        result = selected[0]
+        for ids in selected[1:]:
+            if not result:
+                break
+            result = result & ids
+
+        return sorted(result)
+
+    def filter(self, **criteria: Optional[Any]) -> List[Dict]:
+        """Return the records matching every criterion, in dataset order"""
+        return [self.records[i] for i in self.filter_ids(**criteria)]
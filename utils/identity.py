@@ -0,0 +1,56 @@
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+from typing import Optional, MutableMapping
+
+# Signs the user tokens; without IA_EDUCA_SECRET tokens are only valid for this process
+_secret = os.environ.get('IA_EDUCA_SECRET', '').encode('utf-8') or secrets.token_bytes(32)
+
+TOKEN_PARAM = 'token'
+
+
+def _signature(user_id: str) -> str:
+    digest = hmac.new(_secret, user_id.encode('utf-8'), hashlib.sha256).digest()[:16]
+    return base64.urlsafe_b64encode(digest).decode('ascii').rstrip('=')
+
+
+def issue_user_token() -> str:
+    """Create a new random user id and return it as a signed "<id>.<signature>" token"""
+    user_id = secrets.token_urlsafe(16)
+    return f"{user_id}.{_signature(user_id)}"
+
+
+def verify_user_token(token: Optional[str]) -> Optional[str]:
+    """Return the user id of a token issued by this server, or None if it is malformed or forged"""
+    if not token or '.' not in token:
+        return None
+    user_id, signature = token.rsplit('.', 1)
+    if not user_id or not hmac.compare_digest(signature, _signature(user_id)):
+        return None
+    return user_id
+
+
+def session_user_id(session_state: MutableMapping, query_params: Optional[MutableMapping] = None) -> str:
+    """Return the server-issued user id of a session, creating it on first use
+
+    The id is never taken from the request as is: a `?token=...` parameter
+    is only honoured when its signature verifies, otherwise a new random
+    id is issued. The signed token is kept in the session state and written
+    back to the query parameters, so reloading or bookmarking the page
+    resumes the same stored progress.
+    """
+    if 'user_id' in session_state:
+        return session_state['user_id']
+
+    token = query_params.get(TOKEN_PARAM) if query_params is not None else None
+    user_id = verify_user_token(token)
+    if user_id is None:
+        token = issue_user_token()
+        user_id = verify_user_token(token)
+    session_state['user_token'] = token
+    session_state['user_id'] = user_id
+    if query_params is not None:
+        query_params[TOKEN_PARAM] = token
+    return user_id
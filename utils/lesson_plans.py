@@ -0,0 +1,217 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Iterator, Tuple
+
+from utils.activity_scheduler import infer_tags, parse_minutes, schedule_activities
+from utils.content_store import get_content_store
+
+GRADE_LEVELS = ["Ensino Fundamental I (1º-5º ano)",
+                "Ensino Fundamental II (6º-9º ano)",
+                "Ensino Médio",
+                "Ensino Superior"]
+FOCUS_AREAS = ["Identificação de Vieses", "Impactos Sociais", "Soluções Práticas",
+               "Casos Reais", "Desenvolvimento Crítico"]
+DIFFICULTY_LEVELS = ["Básico", "Intermediário", "Avançado"]
+LEARNING_STYLES = ["Visual", "Auditivo", "Cinestésico", "Leitura/Escrita"]
+# Lesson duration slider: minutes
+MIN_DURATION, MAX_DURATION, DURATION_STEP = 30, 120, 15
+DURATIONS = list(range(MIN_DURATION, MAX_DURATION + 1, DURATION_STEP))
+
+
+class _FieldMapping(Mapping):
+    """Read-only dict-style access to dataclass fields, so pages can keep using plan['title']"""
+
+    # Identity semantics: shared immutable objects are compared and hashed (memo keys) by identity
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_names():
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._field_names())
+
+    def __len__(self) -> int:
+        return len(self._field_names())
+
+    @classmethod
+    def _field_names(cls) -> Tuple[str, ...]:
+        names = cls.__dict__.get('_names')
+        if names is None:
+            names = tuple(f.name for f in fields(cls))
+            cls._names = names
+        return names
+
+
+@dataclass(frozen=True, eq=False)
+class Activity(_FieldMapping):
+    """One activity of a lesson plan"""
+    name: str
+    duration: str
+    description: str
+    materials: Tuple[str, ...] = ()
+    instructions: Tuple[str, ...] = ()
+    # Parsed once at load time for the scheduler
+    minutes: int = 0
+    tags: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Activity':
+        name = data.get('name', '')
+        description = data.get('description', '')
+        return cls(
+            name=name,
+            duration=data.get('duration', ''),
+            description=description,
+            materials=tuple(data.get('materials', ())),
+            instructions=tuple(data.get('instructions', ())),
+            minutes=parse_minutes(data.get('duration', '')),
+            # Explicit "tags" win; otherwise inferred from the name and description
+            tags=frozenset(data['tags']) if 'tags' in data else infer_tags(name, description)
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class LessonTemplate(_FieldMapping):
+    """Immutable lesson plan template, shared by every session"""
+    id: Any
+    title: str
+    objective: str
+    description: str
+    target_grade: str
+    suggested_duration: int
+    materials: Tuple[str, ...]
+    skills: Tuple[str, ...]
+    activities: Tuple[Activity, ...]
+    assessment: str = ''
+    extensions: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LessonTemplate':
+        return cls(
+            id=data.get('id', data.get('title')),
+            title=data.get('title', ''),
+            objective=data.get('objective', ''),
+            description=data.get('description', ''),
+            target_grade=data.get('target_grade', ''),
+            suggested_duration=int(data.get('suggested_duration', 60)),
+            materials=tuple(data.get('materials', ())),
+            skills=tuple(data.get('skills', ())),
+            activities=tuple(Activity.from_dict(a) for a in data.get('activities', ())),
+            assessment=data.get('assessment', ''),
+            extensions=tuple(data.get('extensions', ()))
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class LessonPlan(_FieldMapping):
+    """A customized plan: the template's fields overlaid with the customizations
+
+    Template fields are read through from the shared template and the
+    activities tuple reuses the template's Activity objects, so generating a
+    plan allocates only the overlay.
+    """
+    template: LessonTemplate
+    duration: int
+    grade_level: str
+    class_size: int
+    focus_area: str
+    activities: Tuple[Activity, ...]
+    customizations: Mapping = field(default_factory=lambda: MappingProxyType({}))
+
+    _OVERLAY = ('duration', 'grade_level', 'class_size', 'focus_area', 'activities')
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that are not overlay fields
+        if name.startswith('__') or name == 'template':
+            raise AttributeError(name)
+        return getattr(self.template, name)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._OVERLAY:
+            return getattr(self, key)
+        return self.template[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.template
+        yield from (name for name in self._OVERLAY if name not in self.template)
+
+    def __len__(self) -> int:
+        return len(self.template) + sum(1 for name in self._OVERLAY if name not in self.template)
+
+
+# Optional fillers the scheduler may add before the template's closing activity to reach the duration
+EXTENDED_DEBATE = Activity.from_dict({
+    "name": "Atividade Adicional - Debate Estendido",
+    "duration": "20 min",
+    "description": "Debate aprofundado sobre as implicações éticas dos vieses em IA",
+    "tags": ["discussion"]
+})
+FILLER_ACTIVITIES = (
+    EXTENDED_DEBATE,
+    Activity.from_dict({
+        "name": "Atividade Adicional - Exercício Prático",
+        "duration": "15 min",
+        "description": "Exercício prático em duplas: encontrar e corrigir um viés em um conjunto de dados fictício",
+        "tags": ["practical"]
+    }),
+    Activity.from_dict({
+        "name": "Atividade Adicional - Exploração Digital",
+        "duration": "15 min",
+        "description": "Uso de uma ferramenta digital de IA para testar como ela responde a diferentes perfis",
+        "tags": ["technology"]
+    }),
+    Activity.from_dict({
+        "name": "Revisão e Perguntas",
+        "duration": "10 min",
+        "description": "Retomada dos conceitos principais e espaço para dúvidas da turma",
+        "tags": []
+    }),
+    Activity.from_dict({
+        "name": "Registro no Diário de Bordo",
+        "duration": "5 min",
+        "description": "Cada aluno anota o que aprendeu até aqui e as dúvidas que ficaram",
+        "tags": []
+    })
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Turn lists into tuples so customizations cannot be mutated through a plan"""
+    return tuple(value) if isinstance(value, list) else value
+
+
+def generate_lesson_plan(template: LessonTemplate, customizations: Dict[str, Any]) -> LessonPlan:
+    """Generate a customized lesson plan based on template and user inputs"""
+    # Fit the activities to the lesson duration and the selected activity types
+    activities = schedule_activities(
+        template.activities,
+        customizations['duration'],
+        customizations.get('include_technology', True),
+        customizations.get('include_discussion', True),
+        customizations.get('include_practical', True),
+        FILLER_ACTIVITIES
+    )
+
+    return LessonPlan(
+        template=template,
+        duration=customizations['duration'],
+        grade_level=customizations['grade_level'],
+        class_size=customizations['class_size'],
+        focus_area=customizations['focus_area'],
+        activities=activities,
+        customizations=MappingProxyType({k: _freeze(v) for k, v in customizations.items()})
+    )
+
+
+def build_templates(data: Any) -> Tuple[LessonTemplate, ...]:
+    """Convert the lesson_plans.json records into immutable templates"""
+    return tuple(LessonTemplate.from_dict(record) for record in data)
+
+
+def get_lesson_templates() -> Tuple[LessonTemplate, ...]:
+    """Return the shared templates, rebuilt only when lesson_plans.json changes"""
+    return get_content_store().get_derived('lesson_plans', 'templates', build_templates, [])
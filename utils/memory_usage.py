@@ -0,0 +1,226 @@
+import statistics
+import sys
+from collections.abc import Mapping
+from types import BuiltinFunctionType, FunctionType, MappingProxyType, MethodType, ModuleType
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Set
+
+
+def deep_sizeof(obj: Any, seen: Set[int] = None) -> int:
+    """Approximate the memory held by an object graph (containers included)"""
+    if seen is None:
+        seen = set()
+
+    obj_id = id(obj)
+    if obj_id in seen:
+        return 0
+    seen.add(obj_id)
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += deep_sizeof(key, seen)
+            size += deep_sizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += deep_sizeof(item, seen)
+
+    return size
+
+
+# Code and modules are shared by the whole process, never owned by a session
+_OPAQUE_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+# Process-wide objects that sessions may reference: (module, attribute)
+SHARED_ROOTS = (
+    ('utils.content_store', '_default_store'),
+    ('utils.achievements', '_default_engine'),
+    ('utils.progress_store', '_default_store'),
+    ('utils.bias_simulator', 'BIAS_TYPES'),
+    ('utils.bias_simulator', '_fallback_library'),
+    ('utils.lesson_plans', 'FILLER_ACTIVITIES'),
+    ('utils.theme', '_assets')
+)
+
+
+def _referents(obj: Any) -> Iterator[Any]:
+    """Objects directly held by `obj`: container items and instance attributes"""
+    if isinstance(obj, (dict, MappingProxyType)):
+        for key, value in obj.items():
+            yield key
+            yield value
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        yield from obj
+
+    if isinstance(obj, _OPAQUE_TYPES):
+        return
+    attributes = getattr(obj, '__dict__', None)
+    if isinstance(attributes, dict):
+        yield attributes
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            if name not in ('__dict__', '__weakref__') and hasattr(obj, name):
+                yield getattr(obj, name)
+
+
+def object_sizeof(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """Like deep_sizeof, but also follows instance attributes (__dict__, __slots__)
+
+    Objects whose id is already in `seen` are not counted, so passing the
+    ids of shared objects (see shared_object_ids) measures only what the
+    graph owns exclusively.
+    """
+    if seen is None:
+        seen = set()
+
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, _OPAQUE_TYPES):
+            continue
+        size += sys.getsizeof(current)
+        stack.extend(_referents(current))
+    return size
+
+
+def shared_object_ids(roots: Optional[Iterable[Any]] = None) -> Set[int]:
+    """Ids of every object reachable from the process-wide shared objects
+
+    Defaults to the SHARED_ROOTS of the modules already imported. The ids
+    are only valid while those objects are alive, so compute them right
+    before measuring.
+    """
+    if roots is None:
+        roots = [getattr(sys.modules[module], name) for module, name in SHARED_ROOTS
+                 if module in sys.modules and getattr(sys.modules[module], name, None) is not None]
+    seen = set()
+    for root in roots:
+        object_sizeof(root, seen)
+    return seen
+
+
+def shared_bytes(roots: Optional[Iterable[Any]] = None) -> int:
+    """Memory held once per process by the shared objects"""
+    if roots is None:
+        roots = [getattr(sys.modules[module], name) for module, name in SHARED_ROOTS
+                 if module in sys.modules and getattr(sys.modules[module], name, None) is not None]
+    seen = set()
+    return sum(object_sizeof(root, seen) for root in roots)
+
+
+def session_sizes(state: Mapping, shared_ids: Optional[Set[int]] = None) -> Dict[str, int]:
+    """Bytes owned by each key of a session state, excluding shared objects
+
+    An object referenced by several keys is counted under the first one.
+    """
+    seen = set(shared_ids if shared_ids is not None else shared_object_ids())
+    return {str(key): object_sizeof(value, seen) for key, value in state.items()}
+
+
+def memory_report(states: Iterable[Mapping]) -> Dict[str, Any]:
+    """Per-session memory statistics over several session states
+
+    Returns the shared bytes (paid once per process), the distribution of
+    bytes per session and the average bytes of each session state key.
+    """
+    shared_ids = shared_object_ids()
+    sessions = [session_sizes(state, shared_ids) for state in states]
+    totals = sorted(sum(sizes.values()) for sizes in sessions)
+    keys = {}
+    for sizes in sessions:
+        for key, size in sizes.items():
+            keys.setdefault(key, []).append(size)
+
+    return {
+        'sessions': len(sessions),
+        'shared_bytes': shared_bytes(),
+        'per_session': {
+            'mean_bytes': round(statistics.mean(totals)) if totals else 0,
+            'p95_bytes': totals[min(len(totals) - 1, int(len(totals) * 0.95))] if totals else 0,
+            'max_bytes': totals[-1] if totals else 0
+        },
+        'by_key': {
+            key: {'mean_bytes': round(statistics.mean(sizes)), 'max_bytes': max(sizes), 'sessions': len(sizes)}
+            for key, sizes in sorted(keys.items(), key=lambda item: -statistics.mean(item[1]))
+        }
+    }
+
+
+def projected_bytes(report: Dict[str, Any], sessions: int, percentile: str = 'p95_bytes') -> int:
+    """Estimated process memory for `sessions` concurrent sessions (shared data counted once)"""
+    return report['shared_bytes'] + sessions * report['per_session'][percentile]
+
+
+def runtime_session_states() -> List[Mapping]:
+    """Session states of the sessions connected to the running Streamlit server"""
+    from streamlit.runtime import Runtime
+
+    if not Runtime.exists():
+        return []
+    session_manager = Runtime.instance()._session_mgr
+    return [info.session.session_state.filtered_state for info in session_manager.list_active_sessions()]
+
+
+def runtime_report() -> Dict[str, Any]:
+    """memory_report over the live sessions of this server process"""
+    return memory_report(runtime_session_states())
+
+
+def _simulated_session(seed: int) -> Mapping:
+    """Drive one headless session through every page and return its session state"""
+    from streamlit.testing.v1 import AppTest
+
+    from utils.navigation import ENTRYPOINT
+
+    app = AppTest.from_file(ENTRYPOINT, default_timeout=120)
+    app.query_params['seed'] = str(seed)
+    app.run()
+
+    app.switch_page('pages/1_🎯_Simulador_de_Vieses.py').run()
+    app.button[0].click().run()
+    app.text_area(key='solution_input').input("Diversificar os dados de treinamento e monitorar os resultados").run()
+    app.button[1].click().run()
+
+    app.switch_page('pages/2_📚_Casos_Reais.py').run()
+    app.switch_page('pages/3_📝_Planos_de_Aula.py').run()
+    for button in app.button:
+        if 'Gerar Plano' in button.label:
+            button.click().run()
+            break
+
+    app.switch_page('pages/4_📖_Recursos.py').run()
+    return app.session_state.filtered_state
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    import os
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, root)
+    os.chdir(root)
+
+    parser = argparse.ArgumentParser(description="Per-session memory accounting for pod sizing")
+    parser.add_argument('--sessions', type=int, default=5, help="Headless sessions to simulate")
+    parser.add_argument('--project', type=int, nargs='+', default=[100, 1000, 5000],
+                        help="Concurrent session counts to project memory for")
+    args = parser.parse_args(argv)
+
+    report = memory_report([_simulated_session(seed) for seed in range(args.sessions)])
+    print(f"Shared (once per process): {report['shared_bytes'] / 1024:.1f} KB")
+    per_session = report['per_session']
+    print(f"Per session ({report['sessions']} simulated): mean {per_session['mean_bytes'] / 1024:.1f} KB, "
+          f"p95 {per_session['p95_bytes'] / 1024:.1f} KB, max {per_session['max_bytes'] / 1024:.1f} KB")
+    for key, sizes in report['by_key'].items():
+        print(f"  {key:<28} {sizes['mean_bytes']:>9} B")
+    for sessions in args.project:
+        print(f"{sessions:>6} sessions: {projected_bytes(report, sessions) / 2 ** 20:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
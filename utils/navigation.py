@@ -0,0 +1,63 @@
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_TITLE = "IA na Educação"
+APP_ICON = "🧠"
+
+
+@dataclass(frozen=True)
+class PageEntry:
+    """One page of the app, as listed in the sidebar menu"""
+    path: str
+    icon: str
+    title: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.icon} {self.title}"
+
+
+# Single source of truth for the menu: adding a page means adding its entry here
+PAGE_REGISTRY = (
+    PageEntry("ia_edu.py", "🏠", "Página Inicial"),
+    PageEntry("pages/1_🎯_Simulador_de_Vieses.py", "🎯", "Simulador de Vieses"),
+    PageEntry("pages/2_📚_Casos_Reais.py", "📚", "Casos Reais"),
+    PageEntry("pages/3_📝_Planos_de_Aula.py", "📝", "Planos de Aula"),
+    PageEntry("pages/4_📖_Recursos.py", "📖", "Recursos")
+)
+ENTRYPOINT = PAGE_REGISTRY[0].path
+PAGE_PATHS = [page.path for page in PAGE_REGISTRY]
+
+
+def page_path(script: Optional[str]) -> Optional[str]:
+    """Registry path of a page script (e.g. a page's __file__), relative to the app root"""
+    if script is None:
+        return None
+    return os.path.relpath(os.path.abspath(script), ROOT).replace(os.sep, '/')
+
+
+@lru_cache(maxsize=None)
+def sidebar_header() -> str:
+    """Markup of the sidebar title and menu heading, sent as a single element"""
+    return f'<div class="sidebar-title"><i>{APP_ICON}</i> {APP_TITLE}</div>\n\n### Menu'
+
+
+@lru_cache(maxsize=None)
+def menu_entries(current: Optional[str] = None) -> Tuple[PageEntry, ...]:
+    """Pages listed in the menu of `current`: every page but the current one (all of them on the home page)"""
+    if current == ENTRYPOINT:
+        return PAGE_REGISTRY
+    return tuple(page for page in PAGE_REGISTRY if page.path != current)
+
+
+def render_sidebar(current: Optional[str] = None) -> None:
+    """Render the sidebar title and page menu; pass the page's __file__ as `current`"""
+    import streamlit as st
+
+    with st.sidebar:
+        st.markdown(sidebar_header(), unsafe_allow_html=True)
+        for page in menu_entries(page_path(current)):
+            st.page_link(page.path, label=page.label)
@@ -0,0 +1,48 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group a stream into lists of at most `size` items"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parallel_map(fn: Callable[[List[T]], List[R]], items: Iterable[T], chunk_size: int,
+                 workers: Optional[int] = None, initializer: Optional[Callable[[], Any]] = None) -> Iterator[R]:
+    """Apply `fn` to chunks of a stream in worker processes, yielding the results in input order
+
+    `fn` takes a list of items and returns one result per item; it and
+    `initializer` (run once per worker, e.g. to load shared tables) must be
+    picklable module-level functions. At most `workers * 2` chunks are in
+    flight, so arbitrarily large streams are processed in constant memory.
+    With a single worker everything runs in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        if initializer is not None:
+            initializer()
+        for chunk in chunked(items, chunk_size):
+            yield from fn(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as executor:
+        pending = deque()
+        for chunk in chunked(items, chunk_size):
+            pending.append(executor.submit(fn, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
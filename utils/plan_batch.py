@@ -0,0 +1,131 @@
+import itertools
+import os
+import sys
+import time
+import zipfile
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Sequence, Tuple
+
+from utils.lesson_plans import DURATIONS, FOCUS_AREAS, GRADE_LEVELS, generate_lesson_plan, get_lesson_templates
+from utils.parallel import parallel_map
+from utils.plan_render import RenderedPlan, render_plan
+
+FORMATS = ('txt', 'md')
+
+# Per-process templates by id, loaded once by the pool initializer
+_templates_by_id = None
+
+
+def _init_worker() -> None:
+    """Load the lesson templates once per worker process"""
+    global _templates_by_id
+    _templates_by_id = {str(t.id): t for t in get_lesson_templates()}
+
+
+def expand_matrix(template_ids: Sequence[Any], durations: Sequence[int] = DURATIONS,
+                  grade_levels: Sequence[str] = GRADE_LEVELS, focus_areas: Sequence[str] = FOCUS_AREAS,
+                  class_size: int = 25, **options: Any) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (template id, customizations) for every template × duration × grade × focus combination
+
+    Extra keyword options (include_technology, difficulty_level...) are
+    applied to every plan.
+    """
+    for template_id, duration, grade_level, focus_area in itertools.product(
+            template_ids, durations, grade_levels, focus_areas):
+        customizations = {
+            'duration': duration,
+            'grade_level': grade_level,
+            'class_size': class_size,
+            'focus_area': focus_area
+        }
+        customizations.update(options)
+        yield str(template_id), customizations
+
+
+def _render_chunk(jobs: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[RenderedPlan]]:
+    """Generate and render a chunk of plans (None for unknown template ids)"""
+    results = []
+    for template_id, customizations in jobs:
+        template = _templates_by_id.get(template_id)
+        results.append(render_plan(generate_lesson_plan(template, customizations)) if template else None)
+    return results
+
+
+def render_plans(jobs: Iterable[Tuple[str, Dict[str, Any]]], workers: Optional[int] = None,
+                 chunk_size: int = 50) -> Iterator[Optional[RenderedPlan]]:
+    """Render a stream of plans in parallel, yielding them in input order
+
+    Only a bounded number of chunks is in flight at once, so the whole set
+    is never held in memory.
+    """
+    return parallel_map(_render_chunk, jobs, chunk_size, workers, _init_worker)
+
+
+def plan_file_name(rendered: RenderedPlan, customizations: Dict[str, Any]) -> str:
+    """Readable path of a plan inside the archive, without extension"""
+    grade = GRADE_LEVELS.index(customizations['grade_level']) + 1 \
+        if customizations['grade_level'] in GRADE_LEVELS else 0
+    focus = FOCUS_AREAS.index(customizations['focus_area']) + 1 \
+        if customizations['focus_area'] in FOCUS_AREAS else 0
+    return (f"modelo_{rendered.key[0]}/{customizations['duration']}min_nivel{grade}_foco{focus}_"
+            f"{rendered.key[1]}")
+
+
+def write_plan_zip(output_path: str, jobs: Iterable[Tuple[str, Dict[str, Any]]],
+                   formats: Sequence[str] = FORMATS, workers: Optional[int] = None,
+                   chunk_size: int = 50) -> Dict[str, Any]:
+    """Generate every plan of a job stream into a ZIP archive and return throughput statistics"""
+    start = time.perf_counter()
+    plans = 0
+    skipped = 0
+    # Jobs are consumed twice: by the workers and to name the files in order
+    jobs, names = itertools.tee(jobs)
+
+    with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for (_, customizations), rendered in zip(names, render_plans(jobs, workers, chunk_size)):
+            if rendered is None:
+                skipped += 1
+                continue
+            name = plan_file_name(rendered, customizations)
+            if 'txt' in formats:
+                archive.writestr(f"{name}.txt", rendered.text_bytes)
+            if 'md' in formats:
+                archive.writestr(f"{name}.md", rendered.markdown_bytes)
+            plans += 1
+
+    elapsed = time.perf_counter() - start
+    return {
+        'plans': plans,
+        'skipped': skipped,
+        'workers': workers or os.cpu_count() or 1,
+        'bytes': os.path.getsize(output_path),
+        'seconds': round(elapsed, 3),
+        'plans_per_second': round(plans / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate lesson plans for a whole calendar into a ZIP archive")
+    parser.add_argument('output', help="ZIP file to write")
+    parser.add_argument('--templates', nargs='+', help="Template ids (default: all)")
+    parser.add_argument('--durations', type=int, nargs='+', default=DURATIONS, help="Durations in minutes")
+    parser.add_argument('--grades', nargs='+', default=GRADE_LEVELS, help="Grade levels (default: all)")
+    parser.add_argument('--focus', nargs='+', default=FOCUS_AREAS, help="Focus areas (default: all)")
+    parser.add_argument('--class-size', type=int, default=25)
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=list(FORMATS))
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    template_ids = args.templates or [t.id for t in get_lesson_templates()]
+    jobs = expand_matrix(template_ids, args.durations, args.grades, args.focus, args.class_size)
+    stats = write_plan_zip(args.output, jobs, args.formats, args.workers, args.chunk_size)
+    print(f"{stats['plans']} plans ({stats['skipped']} skipped) written to {args.output} "
+          f"({stats['bytes'] / 1024:.1f} KB) in {stats['seconds']} s with {stats['workers']} worker(s): "
+          f"{stats['plans_per_second']} plans/s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
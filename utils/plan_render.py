@@ -0,0 +1,136 @@
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Tuple
+
+from utils.content_store import get_content_store
+from utils.lesson_plans import LessonPlan
+from utils.lru_cache import LRUCache
+
+
+@dataclass(frozen=True)
+class RenderedPlan:
+    """Every text artifact of a plan, rendered once"""
+    key: Tuple[Any, str]
+    markdown: str
+    text: str
+    markdown_bytes: bytes
+    text_bytes: bytes
+    file_stem: str
+
+
+def customizations_hash(plan: LessonPlan) -> str:
+    """Stable short hash of a plan's customizations"""
+    payload = json.dumps(dict(plan.customizations), sort_keys=True, ensure_ascii=False, default=list)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+
+def plan_key(plan: LessonPlan) -> Tuple[Any, str]:
+    """Cache key of a plan: (template id, customizations hash)"""
+    return plan.template.id, customizations_hash(plan)
+
+
+def render_markdown(plan: LessonPlan) -> str:
+    """Render a plan as a Markdown document"""
+    lines = [
+        f"# {plan['title']}",
+        "",
+        f"**Duração:** {plan['duration']} min | **Nível:** {plan['grade_level']} | "
+        f"**Turma:** {plan['class_size']} alunos | **Foco:** {plan['focus_area']}",
+        "",
+        "## 🎯 Objetivo", plan['objective'], "",
+        "## 📝 Descrição", plan['description'], "",
+        "## 🛠️ Materiais Necessários"
+    ]
+    lines += [f"- {material}" for material in plan['materials']]
+    lines += ["", "## 🎓 Competências Desenvolvidas"]
+    lines += [f"- {skill}" for skill in plan['skills']]
+    lines += ["", "## 📋 Atividades"]
+    for i, activity in enumerate(plan['activities'], 1):
+        lines += ["", f"### Atividade {i}: {activity['name']} ({activity['duration']})", activity['description']]
+        if activity.get('materials'):
+            lines += ["", "**Materiais específicos:**"] + [f"- {m}" for m in activity['materials']]
+        if activity.get('instructions'):
+            # One paragraph per step: consecutive lines would be joined into one
+            lines += ["", "**Instruções:**"]
+            for instruction in activity['instructions']:
+                lines += ["", instruction]
+    if plan.get('assessment'):
+        lines += ["", "## 📊 Avaliação", plan['assessment']]
+    return '\n'.join(lines) + '\n'
+
+
+def render_text(plan: LessonPlan) -> str:
+    """Render a plan in the plain-text export format"""
+    lines = [
+        f"PLANO DE AULA: {plan['title']}",
+        "",
+        f"DURAÇÃO: {plan['duration']} minutos",
+        f"NÍVEL: {plan['grade_level']}",
+        f"TAMANHO DA TURMA: {plan['class_size']} alunos",
+        "",
+        "OBJETIVO:", plan['objective'], "",
+        "DESCRIÇÃO:", plan['description'], "",
+        "MATERIAIS:"
+    ]
+    lines += [f"• {material}" for material in plan['materials']]
+    lines += ["", "COMPETÊNCIAS:"]
+    lines += [f"• {skill}" for skill in plan['skills']]
+    lines += ["", "ATIVIDADES:"]
+    lines += [f"{i}. {a['name']} ({a['duration']}) - {a['description']}"
+              for i, a in enumerate(plan['activities'], 1)]
+    return '\n'.join(lines) + '\n'
+
+
+def render_plan(plan: LessonPlan, key: Tuple[Any, str] = None) -> RenderedPlan:
+    """Render every artifact of a plan (uncached)"""
+    key = key or plan_key(plan)
+    markdown = render_markdown(plan)
+    text = render_text(plan)
+    return RenderedPlan(
+        key=key,
+        markdown=markdown,
+        text=text,
+        markdown_bytes=markdown.encode('utf-8'),
+        text_bytes=text.encode('utf-8'),
+        file_stem=f"plano_aula_{key[0]}_{key[1]}"
+    )
+
+
+class PlanRenderCache:
+    """LRU cache of rendered plans keyed by (template id, customizations hash)"""
+
+    def __init__(self, maxsize: int = 256):
+        self.cache = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self.renders = 0
+        self.render_seconds = 0.0
+
+    def _render(self, plan: LessonPlan, key: Tuple[Any, str]) -> RenderedPlan:
+        start = time.perf_counter()
+        rendered = render_plan(plan, key)
+        with self._lock:
+            self.renders += 1
+            self.render_seconds += time.perf_counter() - start
+        return rendered
+
+    def get(self, plan: LessonPlan) -> RenderedPlan:
+        """Return the rendered artifacts of a plan, rendering them on a miss"""
+        key = plan_key(plan)
+        return self.cache.get_or_compute(key, lambda: self._render(plan, key))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and render times"""
+        stats = self.cache.get_stats()
+        stats['renders'] = self.renders
+        stats['total_render_ms'] = round(self.render_seconds * 1000, 3)
+        stats['avg_render_ms'] = round(self.render_seconds * 1000 / self.renders, 3) if self.renders else 0.0
+        return stats
+
+
+def get_plan_render_cache() -> PlanRenderCache:
+    """Return the process-wide render cache, reset whenever lesson_plans.json reloads"""
+    return get_content_store().get_derived('lesson_plans', 'plan_render_cache',
+                                           lambda data: PlanRenderCache(), [])
@@ -0,0 +1,261 @@
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, Union
+
+from utils.activity_log import ActivityLog
+
+# Progress files are NDJSON: one header record, then the daily rollups, then
+# the retained events, oldest first. The whole stream may be gzip-compressed.
+EXPORT_FORMAT = 'ia-educa-progress'
+EXPORT_VERSION = 1
+REQUIRED_COUNTERS = ['simulations_completed', 'cases_studied', 'plans_created',
+                     'resources_accessed', 'total_score', 'sessions']
+# Everything an import may copy into a tracker's progress data
+PROGRESS_KEYS = REQUIRED_COUNTERS + ['achievements', 'last_activity']
+CHUNK_SIZE = 64 * 1024
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def iter_export_lines(tracker) -> Iterator[str]:
+    """Yield the NDJSON lines of a tracker's state without building the whole document"""
+    header = {
+        'kind': 'header',
+        'format': EXPORT_FORMAT,
+        'version': EXPORT_VERSION,
+        'exported_at': datetime.now().isoformat(),
+        'progress': tracker.progress_data
+    }
+    yield json.dumps(header, ensure_ascii=False) + '\n'
+    for record in tracker.history.rollup_records():
+        record['kind'] = 'rollup'
+        yield json.dumps(record, ensure_ascii=False) + '\n'
+    for activity_type, value, score, timestamp in tracker.history.iter_events():
+        yield json.dumps({'kind': 'event', 'type': activity_type, 'value': value,
+                          'score': score, 'ts': timestamp}, ensure_ascii=False) + '\n'
+
+
+def iter_export_chunks(tracker, compress: bool = False, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the export as byte chunks of about `chunk_size`, optionally gzip-compressed"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    buffer = []
+    buffered = 0
+    for line in iter_export_lines(tracker):
+        data = line.encode('utf-8')
+        if compressor is not None:
+            data = compressor.compress(data)
+        buffer.append(data)
+        buffered += len(data)
+        if buffered >= chunk_size:
+            yield b''.join(buffer)
+            buffer, buffered = [], 0
+    if compressor is not None:
+        buffer.append(compressor.flush())
+    if buffer:
+        yield b''.join(buffer)
+
+
+class ChunkStream(io.RawIOBase):
+    """Read-only file object over a chunk generator, accepted by st.download_button
+
+    Seeking back to the start restarts the generator, so the export is
+    produced on demand instead of being held as one string by the caller.
+    """
+
+    def __init__(self, chunks: Callable[[], Iterable[bytes]]):
+        self._chunks = chunks
+        self._iterator = iter(chunks())
+        self._pending = b''
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence != io.SEEK_SET or offset != 0:
+            raise io.UnsupportedOperation("ChunkStream can only seek to the start")
+        self._iterator = iter(self._chunks())
+        self._pending = b''
+        self._position = 0
+        return 0
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            self._pending = next(self._iterator, None)
+            if self._pending is None:
+                self._pending = b''
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        self._position += size
+        return size
+
+
+def export_stream(tracker, compress: bool = False) -> ChunkStream:
+    """Return a file object that streams a tracker's export"""
+    return ChunkStream(lambda: iter_export_chunks(tracker, compress))
+
+
+def iter_source_bytes(source: Union[bytes, str, Iterable[bytes], Any]) -> Iterator[bytes]:
+    """Yield the raw bytes of an export given as bytes, str, chunks or a binary file object"""
+    if isinstance(source, str):
+        yield source.encode('utf-8')
+    elif isinstance(source, (bytes, bytearray)):
+        yield bytes(source)
+    elif hasattr(source, 'read'):
+        while True:
+            chunk = source.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+    else:
+        for chunk in source:
+            yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+def iter_lines(source) -> Iterator[bytes]:
+    """Yield the lines of an export, decompressing gzip input on the fly"""
+    decompressor = None
+    first = True
+    tail = b''
+    for chunk in iter_source_bytes(source):
+        if first and chunk:
+            first = False
+            if chunk[:2] == GZIP_MAGIC:
+                decompressor = zlib.decompressobj(31)
+        if decompressor is not None:
+            chunk = decompressor.decompress(chunk)
+        lines = (tail + chunk).split(b'\n')
+        tail = lines.pop()
+        yield from lines
+    if decompressor is not None:
+        tail += decompressor.flush()
+    if tail:
+        yield from tail.split(b'\n')
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def validate_progress(progress: Any) -> Dict[str, Any]:
+    """Return the known progress keys of an imported progress dict, raising ValueError if invalid"""
+    if not isinstance(progress, dict) or not all(_is_int(progress.get(key)) for key in REQUIRED_COUNTERS):
+        raise ValueError("Missing or invalid progress counters")
+    achievements = progress.get('achievements', [])
+    if not isinstance(achievements, list) or not all(isinstance(name, str) for name in achievements):
+        raise ValueError("Invalid achievements list")
+    last_activity = progress.get('last_activity')
+    if last_activity is not None:
+        try:
+            datetime.fromisoformat(last_activity)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid last_activity: {last_activity!r}") from None
+    validated = {key: progress[key] for key in PROGRESS_KEYS if key in progress}
+    if 'achievements' in validated:
+        validated['achievements'] = list(achievements)
+    return validated
+
+
+def validate_header(record: Any) -> Dict[str, Any]:
+    """Return the progress counters of a header record, raising ValueError if invalid"""
+    if not isinstance(record, dict) or record.get('kind') != 'header' or record.get('format') != EXPORT_FORMAT:
+        raise ValueError("Not an IA-Educa progress export")
+    if record.get('version') != EXPORT_VERSION:
+        raise ValueError(f"Unsupported export version: {record.get('version')}")
+    return validate_progress(record.get('progress'))
+
+
+def valid_event(record: Dict[str, Any]) -> bool:
+    """Check the fields of an event record"""
+    return (isinstance(record.get('type'), str) and _is_int(record.get('value'))
+            and (record.get('score') is None or _is_int(record.get('score')))
+            and _is_int(record.get('ts')))
+
+
+def valid_rollup(record: Dict[str, Any]) -> bool:
+    """Check the fields of a rollup record"""
+    return (isinstance(record.get('type'), str) and isinstance(record.get('date'), str)
+            and all(_is_int(record.get(key)) for key in ('events', 'value', 'score_sum', 'scored_events')))
+
+
+def read_export(source, max_events: int = 1000) -> Dict[str, Any]:
+    """Stream-parse an export into progress counters and an ActivityLog
+
+    Records are validated and merged one at a time, so memory use is bounded
+    by the log's retention rather than by the size of the file. Invalid
+    records are skipped and counted; an invalid header raises ValueError.
+    """
+    progress = None
+    log = ActivityLog(max_events)
+    stats = {'events': 0, 'rollups': 0, 'skipped': 0}
+
+    for line in iter_lines(source):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            if progress is None:
+                raise ValueError("Not an IA-Educa progress export")
+            stats['skipped'] += 1
+            continue
+
+        if progress is None:
+            progress = validate_header(record)
+            continue
+
+        kind = record.get('kind') if isinstance(record, dict) else None
+        try:
+            if kind == 'event' and valid_event(record):
+                log.append(record['type'], record['value'], record['score'], record['ts'])
+                stats['events'] += 1
+            elif kind == 'rollup' and valid_rollup(record):
+                log.add_rollup_record(record)
+                stats['rollups'] += 1
+            else:
+                stats['skipped'] += 1
+        except (ValueError, OverflowError, OSError):
+            stats['skipped'] += 1
+
+    if progress is None:
+        raise ValueError("Empty progress export")
+    return {'progress': progress, 'history': log, 'stats': stats}
+
+
+def is_stream_export(data: Union[str, bytes]) -> bool:
+    """Tell a (possibly gzipped) NDJSON export from a legacy single JSON document"""
+    if isinstance(data, str):
+        data = data[:200].encode('utf-8')
+    if data[:2] == GZIP_MAGIC:
+        return True
+    first_line = data.lstrip()[:200].split(b'\n', 1)[0]
+    return b'"kind"' in first_line and b'"header"' in first_line
+
+
+def read_legacy_export(data: Union[str, bytes], max_events: int = 1000) -> Optional[Dict[str, Any]]:
+    """Parse the single-document JSON format written by earlier versions"""
+    imported = json.loads(data)
+    if not isinstance(imported, dict) or not all(key in imported for key in REQUIRED_COUNTERS):
+        return None
+    history = imported.pop('activity_history', None) or []
+    rollup = imported.pop('activity_rollup', None) or []
+    return {
+        'progress': validate_progress(imported),
+        'history': ActivityLog.from_records(history, rollup, max_events),
+        'stats': {'events': len(history), 'rollups': len(rollup), 'skipped': 0}
+    }
+
+
+def export_size(tracker, compress: bool = False) -> int:
+    """Size in bytes of a tracker's export, computed without keeping it in memory"""
+    return sum(len(chunk) for chunk in iter_export_chunks(tracker, compress))
+
@@ -0,0 +1,283 @@
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    score INTEGER,
+    ts INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_user ON events (user_id, id);
+CREATE TABLE IF NOT EXISTS counters (
+    user_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (user_id, name)
+);
+CREATE TABLE IF NOT EXISTS achievements (
+    user_id TEXT NOT NULL,
+    achievement_id TEXT NOT NULL,
+    earned_at INTEGER NOT NULL,
+    PRIMARY KEY (user_id, achievement_id)
+);
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    user_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    type TEXT NOT NULL,
+    events INTEGER NOT NULL,
+    value INTEGER NOT NULL,
+    score_sum INTEGER NOT NULL,
+    scored_events INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS daily_rollup_user ON daily_rollup (user_id);
+"""
+
+
+class ProgressStore(ABC):
+    """Storage backend interface for ProgressTracker state"""
+
+    @abstractmethod
+    def load(self, user_id: str, max_events: int = 1000) -> Optional[Dict[str, Any]]:
+        """Return {'counters', 'achievements', 'last_activity', 'history', 'rollup'} or None for a new user
+
+        `history` holds the latest `max_events` activities as (type, value,
+        score, epoch seconds) tuples, oldest first; older activities are
+        returned as daily aggregates in `rollup` (ActivityLog format).
+        """
+
+    @abstractmethod
+    def record_activity(self, user_id: str, activity_type: str, value: int, score: Optional[int],
+                        timestamp: int, counter_deltas: Dict[str, int], achievements: List[str]) -> None:
+        """Record one activity, its counter increments and newly earned achievements"""
+
+    @abstractmethod
+    def replace(self, user_id: str, counters: Dict[str, int], achievements: List[str],
+                history: List[Tuple[str, int, Optional[int], int]], rollup: List[Dict[str, Any]]) -> None:
+        """Overwrite all stored state of a user (used by import and reset)"""
+
+    def flush(self) -> None:
+        """Write any buffered changes"""
+
+    def close(self) -> None:
+        """Flush and release resources"""
+        self.flush()
+
+
+class SQLiteProgressStore(ProgressStore):
+    """SQLite (WAL mode) progress store with group commit
+
+    Activities are appended to an events table and counters are upserted as
+    increments, so several app processes can share one database file. Writes
+    are buffered and committed together once `batch_size` activities are
+    pending or `flush_interval` seconds have passed, turning many small
+    transactions into one.
+    """
+
+    def __init__(self, path: str, batch_size: int = 100, flush_interval: float = 0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._db_lock = threading.Lock()
+
+        # Pending writes, swapped out as a whole by flush()
+        self._pending_lock = threading.Lock()
+        self._events = []
+        self._deltas = {}
+        self._achievements = []
+        self.commits = 0
+        self.events_written = 0
+
+        self._wake = threading.Event()
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, name='progress-store-flush', daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def _flush_loop(self) -> None:
+        """Background group commit of whatever is pending every flush_interval"""
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # Keep the thread alive; the batch is retried on the next round
+                continue
+
+    def record_activity(self, user_id: str, activity_type: str, value: int, score: Optional[int],
+                        timestamp: int, counter_deltas: Dict[str, int], achievements: List[str]) -> None:
+        with self._pending_lock:
+            self._events.append((user_id, activity_type, value, score, timestamp))
+            for name, delta in counter_deltas.items():
+                key = (user_id, name)
+                self._deltas[key] = self._deltas.get(key, 0) + delta
+            self._achievements.extend((user_id, a, timestamp) for a in achievements)
+            full = len(self._events) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        with self._pending_lock:
+            events, self._events = self._events, []
+            deltas, self._deltas = self._deltas, {}
+            achievements, self._achievements = self._achievements, []
+        if not (events or deltas or achievements):
+            return
+
+        try:
+            with self._db_lock:
+                self._conn.execute('BEGIN IMMEDIATE')
+                try:
+                    self._conn.executemany(
+                        'INSERT INTO events (user_id, type, value, score, ts) VALUES (?, ?, ?, ?, ?)', events
+                    )
+                    self._conn.executemany(
+                        'INSERT INTO counters (user_id, name, value) VALUES (?, ?, ?) '
+                        'ON CONFLICT (user_id, name) DO UPDATE SET value = value + excluded.value',
+                        [(user_id, name, delta) for (user_id, name), delta in deltas.items()]
+                    )
+                    self._conn.executemany(
+                        'INSERT OR IGNORE INTO achievements (user_id, achievement_id, earned_at) VALUES (?, ?, ?)',
+                        achievements
+                    )
+                    self._conn.execute('COMMIT')
+                except BaseException:
+                    self._conn.execute('ROLLBACK')
+                    raise
+        except sqlite3.Error:
+            # Put the batch back in front of newer writes so nothing is lost
+            with self._pending_lock:
+                self._events[:0] = events
+                for key, delta in deltas.items():
+                    self._deltas[key] = self._deltas.get(key, 0) + delta
+                self._achievements[:0] = achievements
+            raise
+
+        self.commits += 1
+        self.events_written += len(events)
+
+    def load(self, user_id: str, max_events: int = 1000) -> Optional[Dict[str, Any]]:
+        # Read our own buffered writes
+        self.flush()
+        with self._db_lock:
+            conn = self._conn
+            counters = dict(conn.execute('SELECT name, value FROM counters WHERE user_id = ?', (user_id,)))
+            achievements = [row[0] for row in conn.execute(
+                'SELECT achievement_id FROM achievements WHERE user_id = ? ORDER BY earned_at, rowid', (user_id,)
+            )]
+            recent = conn.execute(
+                'SELECT id, type, value, score, ts FROM events WHERE user_id = ? ORDER BY id DESC LIMIT ?',
+                (user_id, max_events)
+            ).fetchall()
+            rollup = conn.execute(
+                'SELECT day, type, events, value, score_sum, scored_events FROM daily_rollup WHERE user_id = ?',
+                (user_id,)
+            ).fetchall()
+            if recent:
+                # Events older than the retained window come back as daily aggregates
+                rollup += conn.execute(
+                    "SELECT date(ts, 'unixepoch', 'localtime') AS day, type, COUNT(*), SUM(value), "
+                    "COALESCE(SUM(score), 0), COUNT(score) FROM events WHERE user_id = ? AND id < ? "
+                    "GROUP BY day, type",
+                    (user_id, recent[-1][0])
+                ).fetchall()
+            last_ts = conn.execute('SELECT MAX(ts) FROM events WHERE user_id = ?', (user_id,)).fetchone()[0]
+
+        if not (counters or achievements or recent or rollup):
+            return None
+
+        return {
+            'counters': counters,
+            'achievements': achievements,
+            'last_activity': datetime.fromtimestamp(last_ts).isoformat() if last_ts is not None else None,
+            'history': [row[1:] for row in reversed(recent)],
+            'rollup': [
+                {'date': day, 'type': t, 'events': events, 'value': value,
+                 'score_sum': score_sum, 'scored_events': scored}
+                for day, t, events, value, score_sum, scored in rollup
+            ]
+        }
+
+    def replace(self, user_id: str, counters: Dict[str, int], achievements: List[str],
+                history: List[Tuple[str, int, Optional[int], int]], rollup: List[Dict[str, Any]]) -> None:
+        self.flush()
+        now = int(time.time())
+        with self._db_lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                for table in ('events', 'counters', 'achievements', 'daily_rollup'):
+                    self._conn.execute(f'DELETE FROM {table} WHERE user_id = ?', (user_id,))
+                self._conn.executemany(
+                    'INSERT INTO counters (user_id, name, value) VALUES (?, ?, ?)',
+                    [(user_id, name, value) for name, value in counters.items()]
+                )
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO achievements (user_id, achievement_id, earned_at) VALUES (?, ?, ?)',
+                    [(user_id, a, now) for a in achievements]
+                )
+                self._conn.executemany(
+                    'INSERT INTO events (user_id, type, value, score, ts) VALUES (?, ?, ?, ?, ?)',
+                    [(user_id,) + tuple(event) for event in history]
+                )
+                self._conn.executemany(
+                    'INSERT INTO daily_rollup VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [(user_id, r['date'], r['type'], r['events'], r['value'], r['score_sum'], r['scored_events'])
+                     for r in rollup]
+                )
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return group-commit counters"""
+        with self._pending_lock:
+            pending = len(self._events)
+        return {
+            'commits': self.commits,
+            'events_written': self.events_written,
+            'events_per_commit': round(self.events_written / self.commits, 2) if self.commits else 0.0,
+            'pending_events': pending
+        }
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._flusher.join(timeout=5)
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_progress_store() -> Optional[ProgressStore]:
+    """Return the process-wide store configured by IA_EDUCA_PROGRESS_DB, or None if unset"""
+    global _default_store
+    path = os.environ.get('IA_EDUCA_PROGRESS_DB')
+    if not path:
+        return None
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = SQLiteProgressStore(path)
+        return _default_store
@@ -1,260 +1,272 @@
-import json
-from typing import Dict, Any, List
-from datetime import datetime
-
-class ProgressTracker:
-    """Track user progress across different activities in the platform"""
-    
-    def __init__(self):
-        self.progress_data = {
-            'simulations_completed': 0,
-            'cases_studied': 0,
-            'plans_created': 0,
-            'resources_accessed': 0,
-            'total_score': 0,
-            'sessions': 0,
-            'last_activity': None,
-            'achievements': [],
-            'activity_history': []
-        }
-        self.achievements = self._define_achievements()
-    
-    def _define_achievements(self) -> Dict[str, Dict[str, Any]]:
-        """Define available achievements and their criteria"""
-        return {
-            'first_simulation': {
-                'name': '🎯 Primeiro Simulador',
-                'description': 'Completou sua primeira simulação de viés',
-                'criteria': lambda data: data['simulations_completed'] >= 1
-            },
-            'case_explorer': {
-                'name': '📚 Explorador de Casos',
-                'description': 'Estudou 5 casos reais de vieses em IA',
-                'criteria': lambda data: data['cases_studied'] >= 5
-            },
-            'plan_creator': {
-                'name': '📝 Criador de Planos',
-                'description': 'Criou seu primeiro plano de aula',
-                'criteria': lambda data: data['plans_created'] >= 1
-            },
-            'resource_hunter': {
-                'name': '📖 Caçador de Recursos',
-                'description': 'Acessou 10 recursos educacionais',
-                'criteria': lambda data: data['resources_accessed'] >= 10
-            },
-            'bias_expert': {
-                'name': '🏆 Especialista em Vieses',
-                'description': 'Completou 10 simulações com pontuação média acima de 80',
-                'criteria': lambda data: (data['simulations_completed'] >= 10 and 
-                                        data['total_score'] / data['simulations_completed'] >= 80 
-                                        if data['simulations_completed'] > 0 else False)
-            },
-            'educator': {
-                'name': '🎓 Educador Consciente',
-                'description': 'Criou 3 planos de aula e estudou 10 casos',
-                'criteria': lambda data: data['plans_created'] >= 3 and data['cases_studied'] >= 10
-            },
-            'frequent_learner': {
-                'name': '📅 Aprendiz Constante',
-                'description': 'Realizou atividades em 7 sessões diferentes',
-                'criteria': lambda data: data['sessions'] >= 7
-            }
-        }
-    
-    def update_progress(self, activity_type: str, value: int = 1, score: int = None) -> None:
-        """Update progress for a specific activity"""
-        if activity_type in self.progress_data:
-            self.progress_data[activity_type] += value
-        
-        # Update score if provided
-        if score is not None and activity_type == 'simulations_completed':
-            self.progress_data['total_score'] += score
-        
-        # Update last activity timestamp
-        self.progress_data['last_activity'] = datetime.now().isoformat()
-        
-        # Record activity in history
-        self.progress_data['activity_history'].append({
-            'type': activity_type,
-            'value': value,
-            'score': score,
-            'timestamp': self.progress_data['last_activity']
-        })
-        
-        # Check for new achievements
-        self._check_achievements()
-    
-    def _check_achievements(self) -> None:
-        """Check if user has earned any new achievements"""
-        current_achievements = set(self.progress_data['achievements'])
-        
-        for achievement_id, achievement in self.achievements.items():
-            if achievement_id not in current_achievements:
-                if achievement['criteria'](self.progress_data):
-                    self.progress_data['achievements'].append(achievement_id)
-    
-    def get_progress(self) -> Dict[str, Any]:
-        """Get current progress data"""
-        return self.progress_data.copy()
-    
-    def get_achievements(self) -> List[Dict[str, Any]]:
-        """Get list of earned achievements with details"""
-        earned_achievements = []
-        
-        for achievement_id in self.progress_data['achievements']:
-            if achievement_id in self.achievements:
-                achievement = self.achievements[achievement_id].copy()
-                achievement['id'] = achievement_id
-                earned_achievements.append(achievement)
-        
-        return earned_achievements
-    
-    def get_next_achievements(self) -> List[Dict[str, Any]]:
-        """Get list of next achievements user can earn"""
-        current_achievements = set(self.progress_data['achievements'])
-        next_achievements = []
-        
-        for achievement_id, achievement in self.achievements.items():
-            if achievement_id not in current_achievements:
-                progress_info = self._get_achievement_progress(achievement_id)
-                achievement_info = achievement.copy()
-                achievement_info['id'] = achievement_id
-                achievement_info['progress'] = progress_info
-                next_achievements.append(achievement_info)
-        
-        return next_achievements
-    
-    def _get_achievement_progress(self, achievement_id: str) -> Dict[str, Any]:
-        """Calculate progress towards a specific achievement"""
-        # This is a simplified version - in a real implementation,
-        # you would analyze the criteria more sophisticatedly
-        data = self.progress_data
-        
-        progress_info = {
-            'first_simulation': {
-                'current': data['simulations_completed'],
-                'target': 1,
-                'percentage': min(100, data['simulations_completed'] * 100)
-            },
-            'case_explorer': {
-                'current': data['cases_studied'],
-                'target': 5,
-                'percentage': min(100, (data['cases_studied'] / 5) * 100)
-            },
-            'plan_creator': {
-                'current': data['plans_created'],
-                'target': 1,
-                'percentage': min(100, data['plans_created'] * 100)
-            },
-            'resource_hunter': {
-                'current': data['resources_accessed'],
-                'target': 10,
-                'percentage': min(100, (data['resources_accessed'] / 10) * 100)
-            },
-            'bias_expert': {
-                'current': data['simulations_completed'],
-                'target': 10,
-                'percentage': min(100, (data['simulations_completed'] / 10) * 100)
-            },
-            'educator': {
-                'current': min(data['plans_created'], data['cases_studied']),
-                'target': min(3, 10),
-                'percentage': min(100, (min(data['plans_created'] / 3, data['cases_studied'] / 10)) * 100)
-            },
-            'frequent_learner': {
-                'current': data['sessions'],
-                'target': 7,
-                'percentage': min(100, (data['sessions'] / 7) * 100)
-            }
-        }
-        
-        return progress_info.get(achievement_id, {'current': 0, 'target': 1, 'percentage': 0})
-    
-    def get_summary_stats(self) -> Dict[str, Any]:
-        """Get summary statistics for display"""
-        data = self.progress_data
-        
-        # Calculate average score
-        avg_score = (data['total_score'] / data['simulations_completed'] 
-                    if data['simulations_completed'] > 0 else 0)
-        
-        # Calculate total activities
-        total_activities = (data['simulations_completed'] + 
-                          data['cases_studied'] + 
-                          data['plans_created'] + 
-                          data['resources_accessed'])
-        
-        # Determine user level
-        level = self._calculate_user_level(total_activities, avg_score)
-        
-        return {
-            'total_activities': total_activities,
-            'average_score': round(avg_score, 1),
-            'achievements_earned': len(data['achievements']),
-            'user_level': level,
-            'days_active': self._calculate_days_active(),
-            'last_activity': data['last_activity']
-        }
-    
-    def _calculate_user_level(self, total_activities: int, avg_score: float) -> str:
-        """Calculate user level based on activities and performance"""
-        if total_activities >= 50 and avg_score >= 80:
-            return "Especialista"
-        elif total_activities >= 25 and avg_score >= 70:
-            return "Avançado"
-        elif total_activities >= 10 and avg_score >= 60:
-            return "Intermediário"
-        elif total_activities >= 5:
-            return "Iniciante"
-        else:
-            return "Novo"
-    
-    def _calculate_days_active(self) -> int:
-        """Calculate number of different days user was active"""
-        if not self.progress_data['activity_history']:
-            return 0
-        
-        # Extract unique dates from activity history
-        dates = set()
-        for activity in self.progress_data['activity_history']:
-            try:
-                date = datetime.fromisoformat(activity['timestamp']).date()
-                dates.add(date)
-            except (ValueError, KeyError):
-                continue
-        
-        return len(dates)
-    
-    def reset_progress(self) -> None:
-        """Reset all progress data (use with caution)"""
-        self.progress_data = {
-            'simulations_completed': 0,
-            'cases_studied': 0,
-            'plans_created': 0,
-            'resources_accessed': 0,
-            'total_score': 0,
-            'sessions': 0,
-            'last_activity': None,
-            'achievements': [],
-            'activity_history': []
-        }
-    
-    def export_progress(self) -> str:
-        """Export progress data as JSON string"""
-        return json.dumps(self.progress_data, indent=2, ensure_ascii=False)
-    
-    def import_progress(self, progress_json: str) -> bool:
-        """Import progress data from JSON string"""
-        try:
-            imported_data = json.loads(progress_json)
-            # Validate that all required keys exist
-            required_keys = ['simulations_completed', 'cases_studied', 'plans_created', 
-                           'resources_accessed', 'total_score', 'sessions']
-            
-            if all(key in imported_data for key in required_keys):
-                self.progress_data.update(imported_data)
-                return True
-            else:
-                return False
-        except (json.JSONDecodeError, TypeError):
-            return False
+import zlib
+from typing import Dict, Any, List, Iterator, MutableMapping
+from datetime import datetime
+from utils.activity_log import ActivityLog
+from utils.achievements import AchievementEngine, get_achievement_engine
+from utils.identity import session_user_id
+from utils.progress_store import ProgressStore, get_progress_store
+from utils.progress_export import (PROGRESS_KEYS, ChunkStream, export_stream, is_stream_export, iter_export_chunks,
+                                   iter_export_lines, read_export, read_legacy_export)
+
+ACTIVITY_COUNTERS = ['simulations_completed', 'cases_studied', 'plans_created', 'resources_accessed']
+
+# (minimum activities, minimum average score, level), checked from the highest level down
+USER_LEVELS = [
+    (50, 80, "Especialista"),
+    (25, 70, "Avançado"),
+    (10, 60, "Intermediário"),
+    (5, 0, "Iniciante")
+]
+DEFAULT_LEVEL = "Novo"
+
+
+def user_level(total_activities: int, avg_score: float) -> str:
+    """Return the level name for an activity count and average score"""
+    for min_activities, min_score, level in USER_LEVELS:
+        if total_activities >= min_activities and avg_score >= min_score:
+            return level
+    return DEFAULT_LEVEL
+
+
+def average_score(total_score: int, simulations_completed: int) -> float:
+    """Average simulation score, 0 before the first simulation"""
+    return total_score / simulations_completed if simulations_completed > 0 else 0
+
+
+class ProgressTracker:
+    """Track user progress across different activities in the platform"""
+    
+    def __init__(self, max_history: int = 1000, engine: AchievementEngine = None,
+                 store: ProgressStore = None, user_id: str = None):
+        # Older activities are rolled up into daily aggregates beyond max_history events
+        self.max_history = max_history
+        self.history = ActivityLog(max_history)
+        self.progress_data = {
+            'simulations_completed': 0,
+            'cases_studied': 0,
+            'plans_created': 0,
+            'resources_accessed': 0,
+            'total_score': 0,
+            'sessions': 0,
+            'last_activity': None,
+            'achievements': []
+        }
+        self.engine = engine or get_achievement_engine()
+        self.achievements = self.engine.rules
+        # Progress towards each achievement not yet earned, updated as counters change
+        self.achievement_progress = {}
+        # Optional persistent backend; without a user id the state stays in memory only
+        self.store = store if user_id else None
+        self.user_id = user_id
+        if self.store is not None:
+            self._load_from_store()
+        self._check_achievements()
+    
+    @classmethod
+    def for_session(cls, session_state: MutableMapping, query_params: MutableMapping = None) -> 'ProgressTracker':
+        """Create the tracker of a Streamlit session, keyed by its server-issued user id
+        
+        Stored progress is only reachable through a signed token (see
+        utils.identity), never through a raw id from the URL. Without a
+        configured store the tracker stays in memory and no id is issued.
+        """
+        store = get_progress_store()
+        if store is None:
+            return cls()
+        return cls(store=store, user_id=session_user_id(session_state, query_params))
+    
+    def _load_from_store(self) -> None:
+        """Restore counters, achievements and history saved for this user"""
+        state = self.store.load(self.user_id, self.max_history)
+        if state is None:
+            return
+        for name, value in state['counters'].items():
+            if name in self.progress_data:
+                self.progress_data[name] = value
+        self.progress_data['achievements'] = list(state['achievements'])
+        self.progress_data['last_activity'] = state['last_activity']
+        for record in state['rollup']:
+            self.history.add_rollup_record(record)
+        for event in state['history']:
+            self.history.append(*event)
+    
+    def _save_to_store(self) -> None:
+        """Overwrite the stored state of this user with the current one"""
+        if self.store is None:
+            return
+        counters = {name: value for name, value in self.progress_data.items() if isinstance(value, int)}
+        self.store.replace(self.user_id, counters, self.progress_data['achievements'],
+                           list(self.history.iter_events()), self.history.rollup_records())
+    
+    def update_progress(self, activity_type: str, value: int = 1, score: int = None) -> None:
+        """Update progress for a specific activity"""
+        if activity_type in self.progress_data:
+            self.progress_data[activity_type] += value
+        
+        changed = [activity_type]
+        deltas = {activity_type: value} if activity_type in self.progress_data else {}
+        
+        # Update score if provided
+        if score is not None and activity_type == 'simulations_completed':
+            self.progress_data['total_score'] += score
+            changed.append('total_score')
+            deltas['total_score'] = score
+        
+        # Update last activity timestamp
+        now = datetime.now()
+        self.progress_data['last_activity'] = now.isoformat()
+        
+        # Record activity in the compact history
+        timestamp = int(now.timestamp())
+        self.history.append(activity_type, value, score, timestamp)
+        
+        # Check for new achievements among the ones that depend on the changed counters
+        earned_before = len(self.progress_data['achievements'])
+        self._check_achievements(changed)
+        
+        if self.store is not None:
+            self.store.record_activity(self.user_id, activity_type, value, score, timestamp, deltas,
+                                       self.progress_data['achievements'][earned_before:])
+    
+    def _check_achievements(self, changed: List[str] = None) -> None:
+        """Re-evaluate the achievements affected by the changed counters (all if None)"""
+        data = self.progress_data
+        current_achievements = set(data['achievements'])
+        
+        for achievement_id in self.engine.affected(changed):
+            if achievement_id in current_achievements:
+                self.achievement_progress.pop(achievement_id, None)
+            elif self.engine.is_earned(achievement_id, data):
+                data['achievements'].append(achievement_id)
+                self.achievement_progress.pop(achievement_id, None)
+            else:
+                self.achievement_progress[achievement_id] = self.engine.progress(achievement_id, data)
+    
+    def get_progress(self) -> Dict[str, Any]:
+        """Get current progress data"""
+        return self.progress_data.copy()
+    
+    def get_achievements(self) -> List[Dict[str, Any]]:
+        """Get list of earned achievements with details"""
+        return [
+            self.engine.describe(achievement_id)
+            for achievement_id in self.progress_data['achievements']
+            if achievement_id in self.achievements
+        ]
+    
+    def get_next_achievements(self) -> List[Dict[str, Any]]:
+        """Get list of next achievements user can earn"""
+        current_achievements = set(self.progress_data['achievements'])
+        next_achievements = []
+        
+        for achievement_id in self.achievements:
+            if achievement_id not in current_achievements:
+                achievement_info = self.engine.describe(achievement_id)
+                achievement_info['progress'] = self._get_achievement_progress(achievement_id)
+                next_achievements.append(achievement_info)
+        
+        return next_achievements
+    
+    def _get_achievement_progress(self, achievement_id: str) -> Dict[str, Any]:
+        """Return the tracked progress towards a specific achievement"""
+        progress = self.achievement_progress.get(achievement_id)
+        if progress is None:
+            if achievement_id not in self.achievements:
+                return {'current': 0, 'target': 1, 'percentage': 0}
+            progress = self.engine.progress(achievement_id, self.progress_data)
+        return dict(progress)
+    
+    def get_summary_stats(self) -> Dict[str, Any]:
+        """Get summary statistics for display"""
+        data = self.progress_data
+        
+        # Calculate average score
+        avg_score = average_score(data['total_score'], data['simulations_completed'])
+        
+        # Calculate total activities
+        total_activities = sum(data[counter] for counter in ACTIVITY_COUNTERS)
+        
+        # Determine user level
+        level = self._calculate_user_level(total_activities, avg_score)
+        
+        return {
+            'total_activities': total_activities,
+            'average_score': round(avg_score, 1),
+            'achievements_earned': len(data['achievements']),
+            'user_level': level,
+            'days_active': self._calculate_days_active(),
+            'last_activity': data['last_activity']
+        }
+    
+    def _calculate_user_level(self, total_activities: int, avg_score: float) -> str:
+        """Calculate user level based on activities and performance"""
+        return user_level(total_activities, avg_score)
+    
+    def _calculate_days_active(self) -> int:
+        """Calculate number of different days user was active"""
+        # Maintained incrementally by the activity log
+        return self.history.days_active()
+    
+    def get_activity_history(self) -> List[Dict[str, Any]]:
+        """Return the retained (not yet rolled up) activities"""
+        return self.history.to_records()
+    
+    def reset_progress(self) -> None:
+        """Reset all progress data (use with caution)"""
+        self.history = ActivityLog(self.max_history)
+        self.progress_data = {
+            'simulations_completed': 0,
+            'cases_studied': 0,
+            'plans_created': 0,
+            'resources_accessed': 0,
+            'total_score': 0,
+            'sessions': 0,
+            'last_activity': None,
+            'achievements': []
+        }
+        self.achievement_progress = {}
+        self._check_achievements()
+        self._save_to_store()
+    
+    def export_progress(self) -> str:
+        """Export progress data as an NDJSON string (header, daily rollups, events)"""
+        return ''.join(iter_export_lines(self))
+    
+    def iter_export(self, compress: bool = False) -> Iterator[bytes]:
+        """Stream the export as byte chunks, optionally gzip-compressed"""
+        return iter_export_chunks(self, compress)
+    
+    def export_stream(self, compress: bool = False) -> ChunkStream:
+        """Return a file object streaming the export, suitable for st.download_button"""
+        return export_stream(self, compress)
+    
+    def import_progress(self, progress_export) -> bool:
+        """Import progress from an export (str, bytes or binary file, NDJSON or legacy JSON, optionally gzipped)"""
+        try:
+            if hasattr(progress_export, 'read'):
+                head = progress_export.read(200)
+                progress_export.seek(0)
+                stream = is_stream_export(head)
+            else:
+                stream = is_stream_export(progress_export)
+            
+            if stream:
+                imported = read_export(progress_export, self.max_history)
+            else:
+                if hasattr(progress_export, 'read'):
+                    progress_export = progress_export.read()
+                imported = read_legacy_export(progress_export, self.max_history)
+            if imported is None:
+                return False
+            
+            progress = imported['progress']
+            for key in PROGRESS_KEYS:
+                if key in progress:
+                    self.progress_data[key] = progress[key]
+            self.history = imported['history']
+            self._check_achievements()
+        except (ValueError, TypeError, zlib.error):
+            return False
+        
+        self._save_to_store()
+        return True
@@ -0,0 +1,68 @@
+import time
+from typing import Dict, Any
+
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+except ImportError:  # Streamlit not installed (CLI tools, benchmarks)
+    get_script_run_ctx = None
+
+
+class RenderMeter:
+    """Measure render time and the size of the messages a rerun sends to the browser
+
+    While active, the meter wraps the script run context's enqueue function and
+    adds up the serialized size of every ForwardMsg produced by the page.
+    Streamlit has no public hook for outgoing messages, so this relies on
+    the private `ScriptRunContext._enqueue` of the version pinned in
+    requirements; when it is missing (or outside a Streamlit run) only the
+    elapsed time is measured and the payload is reported as unavailable
+    (None), never as 0.
+    """
+
+    def __init__(self):
+        self.messages = 0
+        self.payload_bytes = 0
+        self.render_ms = 0.0
+        self.payload_available = False
+        self._ctx = None
+        self._original_enqueue = None
+        self._started_at = None
+
+    def start(self) -> 'RenderMeter':
+        """Start timing and counting outgoing messages"""
+        self._started_at = time.perf_counter()
+        ctx = get_script_run_ctx() if get_script_run_ctx else None
+
+        self.payload_available = ctx is not None and callable(getattr(ctx, '_enqueue', None))
+        if self.payload_available:
+            self._ctx = ctx
+            self._original_enqueue = ctx._enqueue
+
+            def counting_enqueue(msg):
+                self.messages += 1
+                self.payload_bytes += msg.ByteSize()
+                self._original_enqueue(msg)
+
+            ctx._enqueue = counting_enqueue
+
+        return self
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop measuring and return the collected metrics"""
+        if self._started_at is not None:
+            self.render_ms = (time.perf_counter() - self._started_at) * 1000
+            self._started_at = None
+
+        if self._ctx is not None:
+            self._ctx._enqueue = self._original_enqueue
+            self._ctx = None
+
+        return self.get_metrics()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return the metrics of the last measured rerun (messages and payload_bytes are None if unavailable)"""
+        return {
+            'render_ms': round(self.render_ms, 2),
+            'messages': self.messages if self.payload_available else None,
+            'payload_bytes': self.payload_bytes if self.payload_available else None
+        }
@@ -0,0 +1,52 @@
+from typing import Dict, List, Any, Optional
+
+from utils.content_store import get_content_store
+from utils.facet_index import FacetIndex
+
+
+class ResourceCatalog(FacetIndex):
+    """Inverted indexes over the resources dataset (books, articles, videos and links)
+
+    Every record belongs to one page section (`tab`) and has a `type` and an
+    optional `level`; filters intersect the prebuilt posting sets, so a page
+    only ever touches the records it is about to display.
+    """
+
+    FACETS = ('tab', 'type', 'level')
+
+    def __init__(self, resources: List[Dict]):
+        self.resources = resources
+        super().__init__(resources)
+
+        # Values of each facet inside each tab, in dataset order, for the filter widgets
+        self.tab_values = {}
+        for tab, ids in self.postings['tab'].items():
+            self.tab_values[tab] = {
+                facet: list(dict.fromkeys(
+                    resources[i][facet] for i in sorted(ids) if resources[i].get(facet) is not None
+                ))
+                for facet in self.FACETS if facet != 'tab'
+            }
+
+    def values(self, facet: str, tab: Optional[str] = None) -> List[str]:
+        """Return the distinct values of a facet, optionally restricted to one tab"""
+        if tab is not None:
+            return list(self.tab_values.get(tab, {}).get(facet, []))
+        return super().values(facet)
+
+    def group_ids(self, ids: List[int], facet: str = 'type', tab: Optional[str] = None) -> List[int]:
+        """Order ids by facet value (in the order of `values`), keeping dataset order within each value"""
+        rank = {value: position for position, value in enumerate(self.values(facet, tab=tab))}
+        return sorted(ids, key=lambda i: (rank.get(self.resources[i].get(facet), len(rank)), i))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return totals per facet value"""
+        return {
+            'total_resources': len(self.resources),
+            'facet_counts': self.facet_counts
+        }
+
+
+def get_resource_catalog() -> ResourceCatalog:
+    """Return the shared resource catalog, rebuilt only when resources.json changes"""
+    return get_content_store().get_derived('resources', 'catalog', ResourceCatalog, [])
@@ -0,0 +1,324 @@
+import bisect
+import gzip
+import heapq
+import json
+import math
+import os
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from utils.content_store import get_content_store
+
+INDEX_VERSION = 1
+INDEX_FILENAME = 'search_index.json.gz'
+SOURCE_DATASETS = ('real_cases', 'bias_scenarios', 'lesson_plans')
+
+# Portuguese stopwords, already accent-folded
+STOPWORDS = frozenset("""
+a ao aos as ate com como da das de dela dele deles do dos e ela elas ele eles em
+entre era essa esse esta este eu foi for foram ha isso isto ja lhe mais mas me
+mesmo muito na nao nas nem no nos o os ou para pela pelas pelo pelos por qual
+quando que quem se sem ser seu seus sua suas sao tambem te tem ter um uma umas
+uns voce voces
+""".split())
+
+# Suffixes removed by the light stemmer, longest first (accent-folded)
+SUFFIXES = (
+    'amentos', 'imentos', 'adoras', 'adores', 'amento', 'imento', 'idades',
+    'mente', 'acoes', 'icoes', 'istas', 'ismos', 'adora', 'ador', 'idade',
+    'acao', 'icao', 'ista', 'ismo', 'ivas', 'ivos', 'iva', 'ivo', 'oes', 'aes',
+    'ais', 'eis', 'es', 'as', 'os', 'is', 'a', 'e', 'o', 's'
+)
+MIN_STEM_LENGTH = 3
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def fold_accents(text: str) -> str:
+    """Lowercase text and strip diacritics (ação -> acao)"""
+    decomposed = unicodedata.normalize('NFD', text.lower())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def stem(word: str) -> str:
+    """Light Portuguese stemmer: strips one inflectional/derivational suffix"""
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            return word[:-len(suffix)]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Return folded, non-stopword surface words of a text"""
+    return [w for w in TOKEN_PATTERN.findall(fold_accents(text)) if w not in STOPWORDS]
+
+
+def _join(value: Any) -> str:
+    """Flatten a string or list of strings into a single text"""
+    if isinstance(value, list):
+        return ' '.join(_join(item) for item in value)
+    if isinstance(value, dict):
+        return ' '.join(_join(item) for item in value.values())
+    return str(value) if value is not None else ''
+
+
+def iter_documents(cases: List[Dict], scenarios: List[Dict], plans: List[Dict]) -> Iterable[Tuple[Dict, str]]:
+    """Yield (document metadata, searchable text) for every searchable item"""
+    for position, case in enumerate(cases):
+        text = ' '.join([
+            case.get('title', ''),
+            case.get('description', ''),
+            _join(case.get('lessons')),
+            _join(case.get('discussion_questions'))
+        ])
+        yield {'kind': 'case', 'ref': position, 'title': case.get('title', '')}, text
+
+    for position, scenario in enumerate(scenarios):
+        text = ' '.join([scenario.get('context', ''), scenario.get('situation', '')])
+        yield {'kind': 'scenario', 'ref': position, 'title': scenario.get('type', '')}, text
+
+    for position, plan in enumerate(plans):
+        activities = [
+            f"{activity.get('name', '')} {activity.get('description', '')}"
+            for activity in plan.get('activities', [])
+        ]
+        text = ' '.join([plan.get('title', ''), _join(activities)])
+        yield {'kind': 'plan', 'ref': position, 'title': plan.get('title', '')}, text
+
+
+class SearchEngine:
+    """Inverted-index full-text search with BM25 ranking and prefix matching"""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.docs = []
+        self.doc_lengths = []
+        self.postings = {}
+        self.surface_words = []
+        self.surface_stems = []
+        self.avg_doc_length = 0.0
+        self.doc_norms = []
+        self.fingerprint = None
+
+    def _finalize(self) -> None:
+        """Precompute the per-document BM25 length normalisation"""
+        lengths = self.doc_lengths
+        self.avg_doc_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        avg = self.avg_doc_length or 1.0
+        self.doc_norms = [self.k1 * (1 - self.b + self.b * length / avg) for length in lengths]
+
+    def build(self, documents: Iterable[Tuple[Dict, str]]) -> 'SearchEngine':
+        """Index (metadata, text) pairs"""
+        postings = defaultdict(list)
+        surface_to_stem = {}
+
+        for doc_id, (meta, text) in enumerate(documents):
+            words = tokenize(text)
+            stems = []
+            for word in words:
+                word_stem = surface_to_stem.get(word)
+                if word_stem is None:
+                    word_stem = surface_to_stem[word] = stem(word)
+                stems.append(word_stem)
+
+            for term, tf in Counter(stems).items():
+                postings[term].append((doc_id, tf))
+
+            self.docs.append(meta)
+            self.doc_lengths.append(len(stems))
+
+        self.postings = dict(postings)
+        self.surface_words = sorted(surface_to_stem)
+        self.surface_stems = [surface_to_stem[w] for w in self.surface_words]
+        self._finalize()
+        return self
+
+    def _idf(self, term: str) -> float:
+        """BM25 inverse document frequency"""
+        df = len(self.postings.get(term, ()))
+        n = len(self.docs)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def expand_prefix(self, prefix: str, limit: int = 50) -> List[str]:
+        """Return the stems of indexed words starting with a (folded) prefix"""
+        start = bisect.bisect_left(self.surface_words, prefix)
+        stems = []
+        seen = set()
+        for i in range(start, len(self.surface_words)):
+            if not self.surface_words[i].startswith(prefix):
+                break
+            term = self.surface_stems[i]
+            if term not in seen:
+                seen.add(term)
+                stems.append(term)
+
+        # Keep the most common expansions for very short prefixes
+        if len(stems) > limit:
+            stems = heapq.nlargest(limit, stems, key=lambda t: len(self.postings.get(t, ())))
+        return stems
+
+    def search(self, query: str, kind: Optional[str] = None, limit: int = 20,
+               prefix: bool = True) -> List[Dict[str, Any]]:
+        """Return the best matching documents for a query, ranked by BM25
+
+        With `prefix=True` the last query word also matches any indexed word it
+        starts, which supports search-as-you-type.
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+
+        # Each query word becomes a group of alternative terms
+        groups = [[stem(word)] for word in words]
+        if prefix and not query[-1:].isspace():
+            groups[-1] = list(dict.fromkeys(groups[-1] + self.expand_prefix(words[-1])))
+
+        scores = defaultdict(float)
+        for terms in groups:
+            group_scores = {}
+            for term in terms:
+                term_postings = self.postings.get(term)
+                if not term_postings:
+                    continue
+                idf = self._idf(term) * (self.k1 + 1)
+                norms = self.doc_norms
+                for doc_id, tf in term_postings:
+                    score = idf * tf / (tf + norms[doc_id])
+                    if score > group_scores.get(doc_id, 0.0):
+                        group_scores[doc_id] = score
+            for doc_id, score in group_scores.items():
+                scores[doc_id] += score
+
+        if kind is not None:
+            candidates = ((doc_id, score) for doc_id, score in scores.items() if self.docs[doc_id]['kind'] == kind)
+        else:
+            candidates = scores.items()
+
+        best = heapq.nlargest(limit, candidates, key=lambda item: item[1])
+        return [dict(self.docs[doc_id], score=round(score, 4)) for doc_id, score in best]
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Persist the index as gzipped JSON"""
+        path = path or default_index_path()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        payload = {
+            'version': INDEX_VERSION,
+            'fingerprint': self.fingerprint,
+            'k1': self.k1,
+            'b': self.b,
+            'docs': self.docs,
+            'doc_lengths': self.doc_lengths,
+            'postings': self.postings,
+            'surface_words': self.surface_words,
+            'surface_stems': self.surface_stems
+        }
+        tmp_path = f'{path}.tmp'
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> Optional['SearchEngine']:
+        """Load a persisted index, or return None if it is missing or outdated"""
+        path = path or default_index_path()
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+
+        if payload.get('version') != INDEX_VERSION:
+            return None
+
+        engine = cls(payload['k1'], payload['b'])
+        engine.fingerprint = payload['fingerprint']
+        engine.docs = payload['docs']
+        engine.doc_lengths = payload['doc_lengths']
+        engine.postings = {term: [tuple(p) for p in plist] for term, plist in payload['postings'].items()}
+        engine.surface_words = payload['surface_words']
+        engine.surface_stems = payload['surface_stems']
+        engine._finalize()
+        return engine
+
+
+def default_index_path() -> str:
+    """Return where the index is persisted (IA_EDUCA_CACHE_DIR, default .cache/)"""
+    return os.path.join(os.environ.get('IA_EDUCA_CACHE_DIR', '.cache'), INDEX_FILENAME)
+
+
+def source_fingerprint(data_dir: str = None) -> Dict[str, List[int]]:
+    """Return (mtime, size) of each source dataset, used to detect a stale index"""
+    store = get_content_store()
+    data_dir = data_dir or store.data_dir
+    fingerprint = {}
+    for name in SOURCE_DATASETS:
+        try:
+            st = os.stat(os.path.join(data_dir, f'{name}.json'))
+            fingerprint[name] = [st.st_mtime_ns, st.st_size]
+        except FileNotFoundError:
+            fingerprint[name] = None
+    return fingerprint
+
+
+def build_index(path: Optional[str] = None) -> SearchEngine:
+    """Build the index from the data/*.json files and persist it"""
+    store = get_content_store()
+    # Fingerprint first, then recheck the files: the documents are then at least as new as
+    # the fingerprint, so a dataset edited within the store's check interval is not indexed stale
+    fingerprint = source_fingerprint()
+    engine = SearchEngine().build(iter_documents(
+        store.get('real_cases', [], recheck=True),
+        store.get('bias_scenarios', [], recheck=True),
+        store.get('lesson_plans', [], recheck=True)
+    ))
+    engine.fingerprint = fingerprint
+    engine.save(path)
+    return engine
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_search_engine(path: Optional[str] = None) -> SearchEngine:
+    """Return the process-wide search engine, loading or rebuilding the persisted index as needed"""
+    global _engine
+    fingerprint = source_fingerprint()
+    if _engine is not None and _engine.fingerprint == fingerprint:
+        return _engine
+
+    with _engine_lock:
+        if _engine is None or _engine.fingerprint != fingerprint:
+            engine = SearchEngine.load(path)
+            if engine is None or engine.fingerprint != fingerprint:
+                engine = build_index(path)
+            _engine = engine
+    return _engine
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build or query the IA-Educa search index")
+    parser.add_argument('query', nargs='?', help="Query to run after loading the index")
+    parser.add_argument('--rebuild', action='store_true', help="Force a rebuild of the persisted index")
+    parser.add_argument('--kind', choices=['case', 'scenario', 'plan'])
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    engine = build_index() if args.rebuild else get_search_engine()
+    print(f"Index ready: {len(engine.docs)} documents, {len(engine.postings)} terms "
+          f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    if args.query:
+        start = time.perf_counter()
+        results = engine.search(args.query, kind=args.kind)
+        elapsed = (time.perf_counter() - start) * 1000
+        for result in results:
+            print(f"{result['score']:8.3f}  [{result['kind']}] {result['title']}")
+        print(f"{len(results)} results in {elapsed:.2f} ms")
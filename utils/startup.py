@@ -0,0 +1,279 @@
+import ast
+import glob
+import importlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List, Any, Callable, Optional, Sequence, Tuple
+
+from utils.navigation import ENTRYPOINT, PAGE_PATHS as PAGES, ROOT
+
+# "import time: self [us] | cumulative | imported package" lines of `python -X importtime`
+_IMPORTTIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def page_imports(path: str) -> List[str]:
+    """Return the modules a page script imports at load time (top-level import statements)"""
+    with open(os.path.join(ROOT, path), encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """Parse `-X importtime` output into (module, depth, self_ms, cumulative_ms) records"""
+    records = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append({
+                'module': module,
+                'depth': len(indent) // 2,
+                'self_ms': int(self_us) / 1000,
+                'cumulative_ms': int(cumulative_us) / 1000
+            })
+    return records
+
+
+def profile_imports(modules: Sequence[str], top: int = 10) -> Dict[str, Any]:
+    """Import `modules` in a fresh interpreter under `-X importtime` and summarize the cost
+
+    Returns the total import time, the cumulative time of each requested
+    module (0 when an earlier one already pulled it in) and the `top`
+    slowest modules by self time.
+    """
+    code = '\n'.join(f'import {module}' for module in modules)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=ROOT, capture_output=True, text=True)
+    records = parse_importtime(result.stderr)
+    roots = {r['module']: r['cumulative_ms'] for r in records if r['depth'] == 0}
+    slowest = sorted(records, key=lambda r: r['self_ms'], reverse=True)[:top]
+    return {
+        'total_ms': round(sum(roots.values()), 2),
+        'modules': {module: round(roots.get(module, 0.0), 2) for module in modules},
+        'slowest': [{'module': r['module'], 'self_ms': round(r['self_ms'], 2)} for r in slowest],
+        'imported': len(records),
+        'error': result.stderr.strip().splitlines()[-1] if result.returncode else None
+    }
+
+
+def _first_render(page: str, warm: bool) -> Dict[str, Any]:
+    """Time the first and second run of a page in this (fresh) process"""
+    from streamlit.testing.v1 import AppTest
+
+    report = {}
+    if warm:
+        report['warm_up_ms'] = round(sum(warm_up().values()), 2)
+    app = AppTest.from_file(ENTRYPOINT, default_timeout=120)
+    if page != ENTRYPOINT:
+        app.switch_page(page)
+    start = time.perf_counter()
+    app.run()
+    report['first_run_ms'] = round((time.perf_counter() - start) * 1000, 2)
+    start = time.perf_counter()
+    app.run()
+    report['second_run_ms'] = round((time.perf_counter() - start) * 1000, 2)
+    report['errors'] = [e.value for e in app.exception]
+    return report
+
+
+def profile_first_render(page: str, warm: bool = False) -> Dict[str, Any]:
+    """Run a page headlessly in a fresh interpreter and return its first-render cost
+
+    The first run pays for the page's imports and for loading datasets and
+    building indexes; `warm=True` calls warm_up() beforehand, as `serve` does.
+    """
+    command = [sys.executable, '-m', 'utils.startup', 'first-render', page] + (['--warm'] if warm else [])
+    result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+    if result.returncode:
+        return {'errors': [result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'failed']}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def profile_startup(pages: Sequence[str] = PAGES, renders: bool = True) -> Dict[str, Any]:
+    """Import-time and first-render report for every page"""
+    report = {}
+    for page in pages:
+        entry = {'imports': profile_imports(page_imports(page))}
+        if renders:
+            entry['cold'] = profile_first_render(page)
+            entry['warm'] = profile_first_render(page, warm=True)
+        report[page] = entry
+    return report
+
+
+def _load_datasets() -> int:
+    """Parse every data/*.json file into the shared content store"""
+    from utils.content_store import get_content_store
+
+    store = get_content_store()
+    names = [os.path.splitext(os.path.basename(path))[0]
+             for path in glob.glob(os.path.join(store.data_dir, '*.json'))]
+    for name in names:
+        store.get(name)
+    return len(names)
+
+
+def _import_pages() -> int:
+    """Import every module the pages import, so their first run finds them in sys.modules"""
+    modules = {module for page in PAGES for module in page_imports(page)}
+    for module in modules:
+        importlib.import_module(module)
+    return len(modules)
+
+
+def _warm_lesson_plans() -> int:
+    """Schedule every template at every duration and render the page's default plan of each"""
+    from utils.lesson_plans import (DIFFICULTY_LEVELS, DURATIONS, FOCUS_AREAS, GRADE_LEVELS, LEARNING_STYLES,
+                                    generate_lesson_plan, get_lesson_templates)
+    from utils.plan_render import get_plan_render_cache
+
+    render_cache = get_plan_render_cache()
+    plans = 0
+    for template in get_lesson_templates():
+        for duration in DURATIONS:
+            generate_lesson_plan(template, {'duration': duration, 'grade_level': GRADE_LEVELS[0],
+                                            'class_size': 25, 'focus_area': FOCUS_AREAS[0]})
+        # Same values as the untouched form of the Planos de Aula page
+        render_cache.get(generate_lesson_plan(template, {
+            'duration': template.suggested_duration,
+            'grade_level': GRADE_LEVELS[0],
+            'class_size': 25,
+            'focus_area': FOCUS_AREAS[0],
+            'include_technology': True,
+            'include_discussion': True,
+            'include_practical': True,
+            'difficulty_level': DIFFICULTY_LEVELS[1],
+            'learning_style': LEARNING_STYLES[:2]
+        }))
+        plans += 1
+    return plans
+
+
+def _warm_steps() -> List[Tuple[str, Callable[[], Any]]]:
+    from utils.achievements import get_achievement_engine
+    from utils.bias_simulator import get_scenario_library
+    from utils.case_index import get_case_index
+    from utils.resource_catalog import get_resource_catalog
+    from utils.search_engine import get_search_engine
+    from utils.theme import available_sheets, get_theme_assets
+
+    return [
+        ('datasets', _load_datasets),
+        ('case_index', get_case_index),
+        ('search_index', get_search_engine),
+        ('resource_catalog', get_resource_catalog),
+        ('achievements', get_achievement_engine),
+        ('scenario_library', get_scenario_library),
+        ('lesson_plans', _warm_lesson_plans),
+        ('theme', lambda: [get_theme_assets().sheet(name) for name in available_sheets()])
+    ]
+
+
+def warm_up() -> Dict[str, float]:
+    """Preload modules, datasets, indexes and caches shared by every session
+
+    Meant to run in the server process before it accepts traffic (see
+    `serve`), so the first visitor after a deploy does not pay for the cold
+    start. Returns the time of each step in milliseconds.
+    """
+    timings = {}
+    start = time.perf_counter()
+    _import_pages()
+    timings['imports'] = round((time.perf_counter() - start) * 1000, 2)
+    for name, step in _warm_steps():
+        start = time.perf_counter()
+        step()
+        timings[name] = round((time.perf_counter() - start) * 1000, 2)
+    return timings
+
+
+def serve(streamlit_args: Optional[List[str]] = None) -> int:
+    """Warm up, then run the Streamlit server in this same process (so it keeps the warm caches)"""
+    from streamlit.web import cli as streamlit_cli
+
+    os.chdir(ROOT)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    timings = warm_up()
+    print(f"Warm-up finished in {sum(timings.values()):.0f} ms: "
+          + ', '.join(f"{name} {ms:.0f} ms" for name, ms in timings.items()), file=sys.stderr)
+
+    sys.argv = ['streamlit', 'run', ENTRYPOINT] + list(streamlit_args or [])
+    return streamlit_cli.main()
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    for page, entry in report.items():
+        imports = entry['imports']
+        print(f"{page}")
+        print(f"  imports: {imports['total_ms']:.1f} ms ({imports['imported']} modules)"
+              + (f" - {imports['error']}" if imports['error'] else ''))
+        for module, ms in imports['modules'].items():
+            print(f"    {module:<32} {ms:>9.1f} ms")
+        print("    slowest: " + ', '.join(f"{r['module']} {r['self_ms']:.1f} ms" for r in imports['slowest'][:5]))
+        for label in ('cold', 'warm'):
+            if label in entry:
+                render = entry[label]
+                print(f"  first render ({label}): {render.get('first_run_ms', '-')} ms, "
+                      f"second: {render.get('second_run_ms', '-')} ms"
+                      + (f", warm-up: {render['warm_up_ms']} ms" if 'warm_up_ms' in render else '')
+                      + (f", errors: {render['errors']}" if render.get('errors') else ''))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Startup profiling and warm-up for the IA-Educa app")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    profile_parser = subparsers.add_parser('profile', help="Import-time and first-render cost of each page")
+    profile_parser.add_argument('--pages', nargs='+', default=PAGES)
+    profile_parser.add_argument('--no-render', action='store_true', help="Only profile imports")
+    profile_parser.add_argument('--output', help="Also write the report as JSON")
+
+    subparsers.add_parser('warmup', help="Run the warm-up and print the time of each step")
+
+    # Unknown options of `serve` are passed on to `streamlit run` (e.g. --server.port 8501)
+    subparsers.add_parser('serve', help="Warm up, then start the Streamlit server")
+
+    render_parser = subparsers.add_parser('first-render')
+    render_parser.add_argument('page')
+    render_parser.add_argument('--warm', action='store_true')
+
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command != 'serve':
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+
+    if args.command == 'profile':
+        report = profile_startup(args.pages, renders=not args.no_render)
+        _print_report(report)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+        return 0
+
+    if args.command == 'warmup':
+        for name, ms in warm_up().items():
+            print(f"{name:<18} {ms:>9.1f} ms")
+        return 0
+
+    if args.command == 'serve':
+        return serve(extra)
+
+    # first-render: internal, run by profile_first_render in a fresh interpreter
+    print(json.dumps(_first_render(args.page, args.warm)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+import os
+import re
+import sys
+import threading
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Served by Streamlit at app/static/... when server.enableStaticServing is on
+STATIC_DIR = os.path.join(ROOT, 'static')
+CSS_DIR = os.path.join(STATIC_DIR, 'css')
+STATIC_URL = 'app/static/css'
+BASE_SHEET = 'base'
+
+_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+_SPACE_PATTERN = re.compile(r'\s+')
+_PUNCTUATION_PATTERN = re.compile(r'\s*([{};,>])\s*')
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = _COMMENT_PATTERN.sub('', css)
+    css = _SPACE_PATTERN.sub(' ', css)
+    css = _PUNCTUATION_PATTERN.sub(r'\1', css)
+    # Only the space after a colon is dropped: "a :hover" and "a:hover" differ
+    css = css.replace(': ', ':').replace(';}', '}')
+    return css.strip()
+
+
+def dedupe_rules(css: str) -> str:
+    """Drop repeated rules from minified CSS (flat stylesheets only; at-rules are left untouched)"""
+    if '@' in css:
+        return css
+    rules = [rule + '}' for rule in css.split('}') if rule]
+    return ''.join(dict.fromkeys(rules))
+
+
+def _sheet_path(name: str, minified: bool = False) -> str:
+    return os.path.join(CSS_DIR, f'{name}.min.css' if minified else f'{name}.css')
+
+
+class ThemeAssets:
+    """Minified stylesheets from static/css, built once per process and shared by every session
+
+    Sources are re-read only when their mtime changes. `markup()` returns
+    the single block a page injects: an inline <style> with the deduplicated
+    minified CSS, or <link> tags to the prebuilt static files when static
+    serving is enabled (the browser then caches them across reruns and pages).
+    """
+
+    def __init__(self):
+        self._sheets = {}
+        self._markup = {}
+        self._lock = threading.Lock()
+
+    def sheet(self, name: str) -> str:
+        """Return the minified CSS of one stylesheet"""
+        path = _sheet_path(name)
+        mtime = os.stat(path).st_mtime_ns
+        entry = self._sheets.get(name)
+        if entry is None or entry[0] != mtime:
+            with open(path, encoding='utf-8') as f:
+                source = f.read()
+            entry = (mtime, minify_css(source), len(source.encode('utf-8')))
+            with self._lock:
+                self._sheets[name] = entry
+        return entry[1]
+
+    def bundle(self, names: Sequence[str]) -> str:
+        """Minified, deduplicated CSS of several stylesheets, in order"""
+        return dedupe_rules(''.join(self.sheet(name) for name in dict.fromkeys(names)))
+
+    def static_available(self, names: Sequence[str]) -> bool:
+        """Whether every sheet has an up-to-date minified copy to serve as a static file"""
+        for name in names:
+            built = _sheet_path(name, minified=True)
+            if not os.path.exists(built) or os.stat(built).st_mtime_ns < os.stat(_sheet_path(name)).st_mtime_ns:
+                return False
+        return True
+
+    def markup(self, names: Sequence[str], mode: str = 'inline') -> str:
+        """Return the HTML that applies the stylesheets: one <style> block, or <link> tags in static mode"""
+        names = tuple(dict.fromkeys(names))
+        if mode == 'static' and self.static_available(names):
+            return ''.join(f'<link rel="stylesheet" href="{STATIC_URL}/{name}.min.css">' for name in names)
+
+        # Rebuilt only when one of the source files changes
+        versions = tuple(os.stat(_sheet_path(name)).st_mtime_ns for name in names)
+        cached = self._markup.get(names)
+        if cached is None or cached[0] != versions:
+            cached = (versions, f'<style>{self.bundle(names)}</style>')
+            with self._lock:
+                self._markup[names] = cached
+        return cached[1]
+
+    def build(self, names: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        """Write static/css/<name>.min.css for every (or the given) stylesheet; returns their sizes"""
+        names = names or available_sheets()
+        sizes = {}
+        for name in names:
+            css = self.sheet(name)
+            with open(_sheet_path(name, minified=True), 'w', encoding='utf-8') as f:
+                f.write(css)
+            sizes[name] = len(css.encode('utf-8'))
+        return sizes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Source and minified size of each loaded stylesheet"""
+        return {
+            name: {'source_bytes': source_bytes, 'minified_bytes': len(css.encode('utf-8'))}
+            for name, (_, css, source_bytes) in self._sheets.items()
+        }
+
+
+def available_sheets() -> List[str]:
+    """Names of the source stylesheets in static/css"""
+    return sorted(name[:-len('.css')] for name in os.listdir(CSS_DIR)
+                  if name.endswith('.css') and not name.endswith('.min.css'))
+
+
+_assets = ThemeAssets()
+
+
+def get_theme_assets() -> ThemeAssets:
+    """Return the stylesheets shared by every session in this process"""
+    return _assets
+
+
+def theme_mode() -> str:
+    """'static' when Streamlit serves static/ (and IA_EDUCA_THEME_MODE does not force 'inline'), else 'inline'"""
+    mode = os.environ.get('IA_EDUCA_THEME_MODE', 'auto')
+    if mode != 'auto':
+        return mode
+    try:
+        import streamlit as st
+        return 'static' if st.get_option('server.enableStaticServing') else 'inline'
+    except Exception:
+        return 'inline'
+
+
+def _page_sheets(sheets: Sequence[str]) -> Tuple[str, ...]:
+    return (BASE_SHEET,) + tuple(sheets)
+
+
+def css_payload_bytes(*sheets: str) -> int:
+    """Bytes the theme adds to each rerun of a page using `sheets` (plus the base sheet)"""
+    return len(_assets.markup(_page_sheets(sheets), theme_mode()).encode('utf-8'))
+
+
+def inject_theme(*sheets: str) -> int:
+    """Apply the base stylesheet plus `sheets` to the current page with a single element
+
+    Streamlit drops elements that a rerun does not emit again, so the block
+    is sent on every rerun; it is built once per process and kept minimal.
+    Returns its size in bytes.
+    """
+    import streamlit as st
+
+    markup = _assets.markup(_page_sheets(sheets), theme_mode())
+    st.markdown(markup, unsafe_allow_html=True)
+    return len(markup.encode('utf-8'))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the minified stylesheets served from static/css")
+    parser.add_argument('command', choices=['build', 'stats'])
+    parser.add_argument('--sheets', nargs='+', help="Stylesheet names (default: all)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        for name, size in _assets.build(args.sheets).items():
+            print(f"static/css/{name}.min.css: {size} bytes", file=sys.stderr)
+        return 0
+
+    for name in args.sheets or available_sheets():
+        _assets.sheet(name)
+    for name, stats in _assets.get_stats().items():
+        print(f"{name:<8} {stats['source_bytes']:>6} -> {stats['minified_bytes']:>6} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+from typing import Dict, List, Any, Iterable, Iterator, Sequence
+
+import numpy as np
+
+from utils.batch_grader import parse_bias_types
+from utils.bias_simulator import BiasSimulator, accuracy_offset
+
+# Vocabularies up to this size are encoded as uint64 masks, larger ones as Python ints
+MASK_BITS = 64
+
+
+class BiasTypeEncoder:
+    """Encode lists of bias type names as bit masks over a fixed vocabulary
+
+    Every name of the vocabulary gets its own bit; names outside it (e.g. a
+    misspelled type in a submission) get none, so they can never match.
+    Masks are uint64 while the vocabulary fits in 64 bits and Python ints
+    (object arrays) beyond that, so no two names ever share a bit.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.bits = {}
+        for name in names:
+            self.bits.setdefault(name, len(self.bits))
+        self.dtype = np.uint64 if len(self.bits) <= MASK_BITS else object
+
+    def encode(self, names: Iterable[str]) -> int:
+        """Return the mask of a list of names (unknown names are ignored)"""
+        mask = 0
+        for name in names or ():
+            bit = self.bits.get(name)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def encode_many(self, name_lists: Sequence[Iterable[str]]) -> np.ndarray:
+        """Return the masks of many lists of names as a uint64 (or object) array"""
+        return np.fromiter((self.encode(names) for names in name_lists), dtype=self.dtype, count=len(name_lists))
+
+    def decode(self, mask: int) -> List[str]:
+        """Return the names whose bits are set in a mask"""
+        return [name for name, bit in self.bits.items() if mask >> bit & 1]
+
+
+def grade_columns(simulator: BiasSimulator, scenario_ids: Sequence[Any], bias_detected: Sequence[str],
+                  bias_types: Sequence[List[str]], solutions: Sequence[str]) -> Dict[str, np.ndarray]:
+    """Grade a whole cohort in one vectorized pass
+
+    Produces the same scores, levels and feedback flags as
+    BiasSimulator.evaluate_response, one array element per submission.
+    Rows whose scenario id is unknown have `valid == False` and a zero score.
+    """
+    n = len(scenario_ids)
+
+    # Scenario lookup: the extra last row stands for unknown ids
+    scenarios = simulator.scenario_templates
+    position_by_id = {str(s.get('id')): i for i, s in enumerate(scenarios)}
+    scenario_pos = np.fromiter((position_by_id.get(str(sid), -1) for sid in scenario_ids), dtype=np.int64, count=n)
+    valid = scenario_pos >= 0
+
+    # Only names a scenario can expect need a bit: any other submitted name never matches
+    correct_lists = [scenario.get('correct_identification', [scenario.get('bias_type', '')])
+                     for scenario in scenarios]
+    encoder = BiasTypeEncoder(list(simulator.bias_types) + [name for names in correct_lists for name in names])
+    correct_by_scenario = np.zeros(len(scenarios) + 1, dtype=encoder.dtype)
+    for i, names in enumerate(correct_lists):
+        correct_by_scenario[i] = encoder.encode(names)
+    correct_masks = correct_by_scenario[scenario_pos]
+
+    # Detection (on the Python strings: fixed-width str arrays drop trailing NULs)
+    positive = set(BiasSimulator.POSITIVE_DETECTIONS)
+    detected = np.fromiter((answer in positive for answer in bias_detected), dtype=bool, count=n)
+
+    # Bias type identification
+    type_masks = encoder.encode_many(bias_types)
+    has_types = np.fromiter((bool(types) for types in bias_types), dtype=bool, count=n)
+    matched_masks = type_masks & correct_masks
+    type_match = (matched_masks != 0).astype(bool)
+
+    # Solution length on the Python strings (same reason), keyword scan on a str array:
+    # the keywords contain no NULs, so dropping trailing ones cannot change a match
+    solution_list = ['' if s is None else s for s in solutions]
+    solution_ok = np.fromiter((len(s.strip()) > BiasSimulator.MIN_SOLUTION_LENGTH for s in solution_list),
+                              dtype=bool, count=n)
+    lowered = np.char.lower(np.asarray(solution_list, dtype=str))
+    keyword_hit = np.zeros(n, dtype=bool)
+    for keyword in BiasSimulator.SOLUTION_KEYWORDS:
+        keyword_hit |= np.char.find(lowered, keyword) >= 0
+
+    score = (detected * BiasSimulator.DETECTION_POINTS
+             + type_match * BiasSimulator.TYPE_POINTS
+             + solution_ok * BiasSimulator.SOLUTION_POINTS).astype(np.int16)
+    score[~valid] = 0
+
+    # Levels: SCORE_LEVELS is ordered from the highest threshold down
+    thresholds = np.array([threshold for threshold, _, _ in BiasSimulator.SCORE_LEVELS])
+    level_names = np.array([level for _, level, _ in BiasSimulator.SCORE_LEVELS], dtype=object)
+    level_codes = np.argmax(score[:, None] >= thresholds[None, :], axis=1)
+
+    offsets = np.fromiter(
+        (accuracy_offset(scenarios[pos], det, types, sol) if pos >= 0 else 0
+         for pos, det, types, sol in zip(scenario_pos, bias_detected, bias_types, solutions)),
+        dtype=np.int16, count=n
+    )
+    accuracy = np.minimum(100, score + offsets).astype(np.int16)
+
+    return {
+        'valid': valid,
+        'scenario_pos': scenario_pos,
+        'detected': detected,
+        'has_types': has_types,
+        'type_masks': type_masks,
+        'matched_masks': matched_masks,
+        'type_match': type_match,
+        'solution_ok': solution_ok,
+        'keyword_hit': keyword_hit & solution_ok,
+        'score': score,
+        'accuracy': accuracy,
+        'level_code': level_codes,
+        'level': level_names[level_codes],
+        'encoder': encoder
+    }
+
+
+def iter_results(simulator: BiasSimulator, columns: Dict[str, np.ndarray], bias_types: Sequence[List[str]],
+                 include_explanation: bool = True) -> Iterator[Dict[str, Any]]:
+    """Expand graded columns into result dicts shaped like evaluate_response's output"""
+    encoder = columns['encoder']
+    scenarios = simulator.scenario_templates
+
+    for i in range(len(columns['score'])):
+        if not columns['valid'][i]:
+            yield None
+            continue
+
+        scenario = scenarios[columns['scenario_pos'][i]]
+        correct = scenario.get('correct_identification', [scenario.get('bias_type', '')])
+        score = int(columns['score'][i])
+        level, general_feedback = simulator.get_level(score)
+
+        matching_types = None
+        if columns['has_types'][i]:
+            matched = set(encoder.decode(int(columns['matched_masks'][i])))
+            matching_types = tuple(t for t in correct if t in matched)
+
+        detailed_feedback = simulator._get_detailed_feedback(
+            bool(columns['detected'][i]), matching_types,
+            bool(columns['solution_ok'][i]), bool(columns['keyword_hit'][i])
+        )
+
+        result = {
+            "score": score,
+            "accuracy": int(columns['accuracy'][i]),
+            "level": level,
+            "feedback": general_feedback,
+            "detailed_feedback": list(detailed_feedback),
+            "explanation": simulator._generate_explanation(scenario),
+            "recommendations": list(simulator._generate_recommendations(score, bias_types[i] or [], correct))
+        }
+        if not include_explanation:
+            del result['explanation']
+        yield result
+
+
+def grade_dataframe(simulator: BiasSimulator, df):
+    """Grade a pandas DataFrame with scenario_id, bias_detected, bias_types and solution columns
+
+    Returns a copy of the frame with score, accuracy, level, type_match and
+    keyword_hit columns added.
+    """
+    # Same rule as the record-by-record grader: a list or array, or a ';'-separated string (NaN counts as empty)
+    bias_types = [parse_bias_types(t) for t in df['bias_types']]
+    columns = grade_columns(
+        simulator,
+        df['scenario_id'].tolist(),
+        df['bias_detected'].fillna('').tolist(),
+        bias_types,
+        df['solution'].fillna('').tolist()
+    )
+
+    graded = df.copy()
+    for name in ('score', 'accuracy', 'level', 'type_match', 'keyword_hit', 'valid'):
+        graded[name] = columns[name]
+    return graded